@@ -5,6 +5,9 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/3.2/howto/deployment/asgi/
+
+The server-sent event stream (events/) and the async/ endpoints need this entry
+point; served through wsgi.py the event stream refuses to start.
 """
 
 import os
@@ -0,0 +1,149 @@
+"""
+Change notifications pushed to clients over server-sent events.
+
+Model signals publish small JSON events to named channels ("user:<id>",
+"meeting:<id>") through a broker, and each open event stream holds a
+subscription to the channels it asked for. Events are published once the
+writing transaction commits, and only built when someone is subscribed.
+
+The default LocalBroker delivers within the current process only, which is
+enough for a single ASGI worker. Deployments running several processes set
+EVENTS["BROKER"] to a broker with the same interface backed by a shared
+pub/sub service.
+"""
+
+import asyncio
+import itertools
+import logging
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger("alarmclock.events")
+
+# Queued for a subscriber that fell too far behind, in place of what it missed.
+RESYNC = {"type": "resync"}
+
+
+def user_channel(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def meeting_channel(meeting_id: int) -> str:
+    return f"meeting:{meeting_id}"
+
+
+class Subscription:
+    """
+    The events of some channels for one consumer on an event loop. Brokers
+    call `deliver` from any thread; the consumer awaits `get`.
+    """
+
+    def __init__(self, channels: Iterable[str], max_queued: int):
+        self.channels = frozenset(channels)
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue(max_queued)
+        self._lagging = False
+
+    def deliver(self, event: dict) -> None:
+        self._loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event: dict) -> None:
+        if self._lagging:
+            return
+        if self._queue.full():
+            # Replace the backlog with one resync: the client refetches instead.
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(RESYNC)
+            self._lagging = True
+            return
+        self._queue.put_nowait(event)
+
+    async def get(self, timeout: float) -> Optional[dict]:
+        """The next event, or None if none arrived within `timeout` seconds."""
+        try:
+            event = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if event is RESYNC:
+            self._lagging = False
+        return event
+
+
+class LocalBroker:
+    """Delivers events to the subscriptions of this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions: dict[str, set[Subscription]] = {}
+
+    def subscribe(self, channels: Iterable[str]) -> Subscription:
+        subscription = Subscription(channels, settings.EVENTS["MAX_QUEUED"])
+        with self._lock:
+            for channel in subscription.channels:
+                self._subscriptions.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            for channel in subscription.channels:
+                subscribers = self._subscriptions.get(channel)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscriptions[channel]
+
+    def has_subscribers(self, channels: Optional[Iterable[str]] = None) -> bool:
+        """Whether any of `channels` (any channel at all when None) has a subscriber."""
+        with self._lock:
+            if channels is None:
+                return bool(self._subscriptions)
+            return any(channel in self._subscriptions for channel in channels)
+
+    def publish(self, channels: Iterable[str], event: dict) -> None:
+        with self._lock:
+            # A subscriber to several of the channels gets the event once.
+            subscriptions = set().union(*(self._subscriptions.get(channel, ()) for channel in channels))
+        for subscription in subscriptions:
+            subscription.deliver(event)
+
+
+@lru_cache(maxsize=None)
+def get_broker() -> Any:
+    return import_string(settings.EVENTS["BROKER"])()
+
+
+def listening() -> bool:
+    """Cheap check for signal receivers: False when nobody could receive anything."""
+    return get_broker().has_subscribers()
+
+
+_event_ids = itertools.count(1)
+
+
+def notify(channels: Iterable[str], build: Callable[[], Optional[dict]]) -> None:
+    """
+    Publish `build()` to `channels` after the current transaction commits (at
+    once outside one), so the event describes committed data. `build` is only
+    called if a channel has subscribers and may return None to send nothing.
+    """
+    channels = [channel for channel in channels if channel is not None]
+    broker = get_broker()
+    if not channels or not broker.has_subscribers(channels):
+        return
+
+    def send():
+        try:
+            event = build()
+            if event is not None:
+                broker.publish(channels, {"id": next(_event_ids), **event})
+        except Exception:
+            # The write has committed; a failed notification must not fail it.
+            logger.exception("Could not publish event to %s", channels)
+
+    transaction.on_commit(send)
@@ -0,0 +1,194 @@
+"""
+Per-request timing instrumentation.
+
+Sampled requests have every SQL statement timed through a database execute
+wrapper, and report query count, database time, view time and render time as
+`Server-Timing` headers. Any request slower than the configured threshold is
+also written to the "alarmclock.requests" logger as one JSON line, with the
+slowest statements when the request was sampled.
+"""
+
+import heapq
+import json
+import logging
+import random
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger("alarmclock.requests")
+
+# Logged statements are cut to this many characters.
+MAX_SQL_LENGTH = 500
+
+_current: ContextVar[Optional["RequestTimings"]] = ContextVar("request_timings", default=None)
+
+
+@dataclass
+class RequestTimings:
+    started: float
+    sampled: bool
+    slowest_limit: int = 0
+    query_count: int = 0
+    db_time: float = 0.0
+    # Min-heap of (duration, sql) holding the `slowest_limit` slowest statements.
+    slowest: list[tuple[float, str]] = field(default_factory=list)
+    view_started: Optional[float] = None
+    view_finished: Optional[float] = None
+    render_finished: Optional[float] = None
+
+    def record_query(self, sql: str, duration: float) -> None:
+        self.query_count += 1
+        self.db_time += duration
+        if len(self.slowest) < self.slowest_limit:
+            heapq.heappush(self.slowest, (duration, sql))
+        elif self.slowest and duration > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, (duration, sql))
+
+    def view_time(self, finished: float) -> Optional[float]:
+        if self.view_started is None:
+            return None
+        return (self.view_finished or finished) - self.view_started
+
+    def render_time(self) -> Optional[float]:
+        if self.view_finished is None or self.render_finished is None:
+            return None
+        return self.render_finished - self.view_finished
+
+
+def _time_query(execute, sql, params, many, context):
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.record_query(sql, time.perf_counter() - started)
+
+
+def _install(connection, **kwargs) -> None:
+    if _time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_time_query)
+
+
+# Connections opened from now on are wrapped here; ones already open in the
+# request's thread are wrapped when a sampled request starts.
+connection_created.connect(_install)
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 2)
+
+
+class RequestTimingMiddleware:
+    """
+    Settings come from REQUEST_TIMING: SAMPLE_RATE is the share of requests
+    whose queries are traced, SLOW_REQUEST_MS the threshold for the slow-request
+    log and SLOWEST_QUERIES how many statements that log keeps.
+
+    Render time covers DRF responses, which render after the view returns;
+    plain responses render inside the view, and streamed bodies are produced
+    after the middleware has finished.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timings, token = self.begin()
+        try:
+            response = self.get_response(request)
+        finally:
+            if token is not None:
+                _current.reset(token)
+        return self.finish(request, response, timings)
+
+    async def __acall__(self, request):
+        timings, token = self.begin()
+        try:
+            response = await self.get_response(request)
+        finally:
+            if token is not None:
+                _current.reset(token)
+        return self.finish(request, response, timings)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        timings = _current.get()
+        if timings is not None:
+            timings.view_started = time.perf_counter()
+        return None
+
+    def process_template_response(self, request, response):
+        timings = _current.get()
+        if timings is not None:
+            timings.view_finished = time.perf_counter()
+            response.add_post_render_callback(lambda rendered: setattr(timings, "render_finished", time.perf_counter()))
+        return response
+
+    @staticmethod
+    def begin():
+        config = settings.REQUEST_TIMING
+        started = time.perf_counter()
+        if random.random() >= config["SAMPLE_RATE"]:
+            return RequestTimings(started=started, sampled=False), None
+
+        for connection in connections.all(initialized_only=True):
+            _install(connection)
+        timings = RequestTimings(started=started, sampled=True, slowest_limit=config["SLOWEST_QUERIES"])
+        return timings, _current.set(timings)
+
+    @staticmethod
+    def finish(request, response, timings: RequestTimings):
+        finished = time.perf_counter()
+        total = finished - timings.started
+        sampled = timings.sampled
+
+        if sampled:
+            metrics = [f'db;dur={_ms(timings.db_time)};desc="{timings.query_count} queries"']
+            view = timings.view_time(finished)
+            if view is not None:
+                metrics.append(f"view;dur={_ms(view)}")
+            render = timings.render_time()
+            if render is not None:
+                metrics.append(f"render;dur={_ms(render)}")
+            metrics.append(f"total;dur={_ms(total)}")
+            response["Server-Timing"] = ", ".join(metrics)
+
+        if total * 1000 >= settings.REQUEST_TIMING["SLOW_REQUEST_MS"]:
+            record = {
+                "method": request.method,
+                "path": request.path,
+                "status": response.status_code,
+                "sampled": sampled,
+                "total_ms": _ms(total),
+            }
+            if sampled:
+                view, render = timings.view_time(finished), timings.render_time()
+                record.update(
+                    {
+                        "view_ms": None if view is None else _ms(view),
+                        "render_ms": None if render is None else _ms(render),
+                        "db_ms": _ms(timings.db_time),
+                        "queries": timings.query_count,
+                        "slowest_queries": [
+                            {"ms": _ms(duration), "sql": sql[:MAX_SQL_LENGTH]} for duration, sql in sorted(timings.slowest, reverse=True)
+                        ],
+                    }
+                )
+            logger.warning(json.dumps(record))
+
+        return response
@@ -0,0 +1,158 @@
+"""
+Versioned response cache.
+
+Cached payloads are keyed by a scope ("user" or "meeting"), the id within it
+and that scope's current version. Model signals bump the version on every write
+that can change a payload, so readers simply stop finding the stale entries
+instead of waiting for a TTL; old entries age out of the cache on their own.
+
+Versions start from the clock rather than 1, so a version key that is evicted
+or expires and is re-created can never come back to a value already used in a
+cached key.
+
+A bump is only seen by processes sharing the cache it was made in, so the cache
+is off (every read builds its payload) when RESPONSE_CACHE["ALIAS"] is a
+per-process backend, unless RESPONSE_CACHE["ALLOW_LOCAL"] is set.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import Counter
+from functools import wraps
+from typing import Any, Callable, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connection, transaction
+from django.views.decorators.http import etag as condition_etag
+
+_stats: Counter = Counter()
+_stats_lock = threading.Lock()
+
+
+def _cache():
+    return caches[settings.RESPONSE_CACHE["ALIAS"]]
+
+
+def enabled() -> bool:
+    """Whether payloads and versions are shared by every process serving requests."""
+    return settings.RESPONSE_CACHE["ALLOW_LOCAL"] or not isinstance(_cache(), (LocMemCache, DummyCache))
+
+
+def _version_key(scope: str, ident: int) -> str:
+    return f"rc:version:{scope}:{ident}"
+
+
+def get_version(scope: str, ident: int) -> int:
+    cache = _cache()
+    key = _version_key(scope, ident)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=settings.RESPONSE_CACHE["TIMEOUT"])
+        version = cache.get(key)
+    return version
+
+
+def _bump(scope: str, ident: int) -> None:
+    cache = _cache()
+    key = _version_key(scope, ident)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), timeout=settings.RESPONSE_CACHE["TIMEOUT"])
+
+
+def bump(scope: str, ids: Iterable[int]) -> None:
+    """
+    Invalidate every payload cached for `ids` in `scope`.
+
+    Inside a transaction the bump is repeated on commit, so a reader that cached
+    pre-commit data in between does not keep serving it.
+    """
+    ids = {ident for ident in ids if ident is not None}
+    for ident in ids:
+        _bump(scope, ident)
+    if ids and connection.in_atomic_block:
+        transaction.on_commit(lambda: [_bump(scope, ident) for ident in ids])
+
+
+def bump_users(user_ids: Iterable[int]) -> None:
+    bump("user", user_ids)
+
+
+def bump_meetings(meeting_ids: Iterable[int]) -> None:
+    bump("meeting", meeting_ids)
+
+
+def cached(name: str, scope: str, ident: int, build: Callable[[], Any], params: Optional[dict] = None) -> tuple[Any, bool]:
+    """
+    Return `(payload, hit)` for the `name` payload of `ident`, calling `build`
+    on a miss. `params` distinguishes variants of one payload (filters, pages).
+    Always a miss when the cache is not enabled().
+    """
+    if not enabled():
+        with _stats_lock:
+            _stats[(name, "misses")] += 1
+        return build(), False
+
+    params_hash = hashlib.sha1(json.dumps(params or {}, sort_keys=True, default=str).encode()).hexdigest()
+    key = f"rc:{name}:{scope}:{ident}:{get_version(scope, ident)}:{params_hash}"
+
+    cache = _cache()
+    payload = cache.get(key)
+    hit = payload is not None
+    if not hit:
+        payload = build()
+        cache.set(key, payload, timeout=settings.RESPONSE_CACHE["TIMEOUT"])
+
+    with _stats_lock:
+        _stats[(name, "hits" if hit else "misses")] += 1
+    return payload, hit
+
+
+def stats() -> dict[str, dict[str, int]]:
+    """Hit/miss counters of this process, per payload name."""
+    with _stats_lock:
+        counters = dict(_stats)
+    result: dict[str, dict[str, int]] = {}
+    for (name, kind), count in counters.items():
+        result.setdefault(name, {"hits": 0, "misses": 0})[kind] = count
+    return result
+
+
+def reset_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
+
+
+def etag(etag_func: Callable[..., str]) -> Callable:
+    """
+    django.views.decorators.http.etag for tags made from get_version(). No tag
+    is used while the cache is not enabled(), as another process could answer
+    304 with a version of its own, and only 200 responses carry one.
+    """
+
+    def tag(request, *args, **kwargs) -> Optional[str]:
+        return etag_func(request, *args, **kwargs) if enabled() else None
+
+    def decorator(view: Callable) -> Callable:
+        conditional = condition_etag(tag)(view)
+
+        @wraps(view)
+        def inner(request, *args, **kwargs):
+            response = conditional(request, *args, **kwargs)
+            if response.status_code not in (200, 304) and response.has_header("ETag"):
+                del response["ETag"]
+            return response
+
+        return inner
+
+    return decorator
+
+
+def cache_header(hit: bool) -> dict[str, str]:
+    return {"X-Cache": "HIT" if hit else "MISS"}
@@ -42,19 +42,34 @@ INSTALLED_APPS = [
     "authenticator",
     "task_manager",
     "note_manager",
+    "search",
+    "sync",
+    "jobs",
+    "workspace",
 ]
 
 MIDDLEWARE = [
+    "alarmclock.middleware.RequestTimingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "authenticator.middleware.TokenAuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 CORS_ALLOW_ALL_ORIGINS = True
+
+REST_FRAMEWORK = {
+    "DEFAULT_AUTHENTICATION_CLASSES": [
+        "authenticator.authentication.TokenAuthentication",
+        "rest_framework.authentication.SessionAuthentication",
+        "rest_framework.authentication.BasicAuthentication",
+    ],
+    "DEFAULT_THROTTLE_CLASSES": ["alarmclock.throttling.TokenBucketThrottle"],
+}
 ROOT_URLCONF = "alarmclock.urls"
 
 TEMPLATES = [
@@ -88,6 +103,24 @@ DATABASES = {
     }
 }
 
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# Versioned payload cache (see alarmclock.response_cache). Entries are invalidated
+# by version bumps, the timeout only reclaims space from superseded versions and
+# bounds how long a lost version key can go unnoticed. Versions must be seen by
+# every process, so ALIAS has to name a shared cache (Redis, Memcached, database,
+# file); on a per-process backend such as LocMemCache the cache stays off unless
+# ALLOW_LOCAL says the site runs in a single process.
+RESPONSE_CACHE = {
+    "ALIAS": "default",
+    "TIMEOUT": 60 * 60,
+    "ALLOW_LOCAL": False,
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
@@ -131,3 +164,90 @@ STATIC_URL = "/static/"
 # https://docs.djangoproject.com/en/3.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+# Turns throttling off for the test suite (see alarmclock.test_runner)
+TEST_RUNNER = "alarmclock.test_runner.TestRunner"
+
+# Task listing pagination (see task_manager.views.TaskListView)
+TASK_LIST_PAGE_SIZE = 100
+TASK_LIST_MAX_PAGE_SIZE = 500
+
+# Rows fetched per database round trip when a list endpoint is asked to ?stream=1
+STREAMING_CHUNK_SIZE = 500
+
+# Largest batch accepted by task_manager.views.BulkAddTaskView
+BULK_TASK_MAX_ITEMS = 5000
+
+# Records inserted per statement by workspace imports (see workspace.importer)
+WORKSPACE_IMPORT_BATCH_SIZE = 500
+
+# Signed API tokens (see authenticator.tokens), lifetimes in seconds. Token
+# versions are cached in CACHE_ALIAS for VERSION_CACHE_SECONDS (at most
+# ACCESS_TTL): a revocation reaches processes that do not share that cache
+# within this time, and refreshes always check the database. Resolved users are
+# kept in a per-process LRU of USER_CACHE_SIZE entries.
+AUTH_TOKENS = {
+    "ACCESS_TTL": 15 * 60,
+    "REFRESH_TTL": 14 * 24 * 60 * 60,
+    "CACHE_ALIAS": "default",
+    "VERSION_CACHE_SECONDS": 60,
+    "USER_CACHE_SIZE": 10000,
+}
+
+# Request rate limits (see alarmclock.throttling). USER and ANON are the budget
+# of each user and each anonymous address: a burst of `capacity` cost units,
+# refilled at `rate` per second. SCOPES give endpoint classes (a view's
+# throttle_scope) their cost against that budget, default 1, and optionally a
+# bucket of their own. STORE keeps buckets per process; use
+# "alarmclock.throttling.CacheBucketStore" to share them through CACHE_ALIAS.
+THROTTLING = {
+    "ENABLED": True,
+    "STORE": "alarmclock.throttling.LocalBucketStore",
+    "CACHE_ALIAS": "default",
+    "MAX_BUCKETS": 100000,
+    "USER": {"capacity": 600, "rate": 10},
+    "ANON": {"capacity": 600, "rate": 10},
+    "SCOPES": {
+        "list": {"cost": 5},
+        "search": {"cost": 3},
+        "bulk": {"cost": 20, "capacity": 10, "rate": 0.2},
+        "auth": {"capacity": 10, "rate": 0.2},
+    },
+}
+
+# Background jobs (see jobs.models.Job and the run_jobs command). A failed job is
+# retried up to MAX_ATTEMPTS times in all, after BACKOFF_SECONDS doubling per
+# attempt up to MAX_BACKOFF_SECONDS; one running for longer than
+# LOCK_TIMEOUT_SECONDS is taken to have lost its worker.
+JOBS = {
+    "MAX_ATTEMPTS": 5,
+    "BACKOFF_SECONDS": 10,
+    "MAX_BACKOFF_SECONDS": 60 * 60,
+    "LOCK_TIMEOUT_SECONDS": 30 * 60,
+    "POLL_INTERVAL_SECONDS": 1.0,
+}
+
+# Delta sync (see sync.changes). Cursors stay SYNC_OVERLAP_SECONDS behind the
+# present so slow-committing writes are not skipped; tombstones, and with them
+# cursors, are kept for SYNC_TOMBSTONE_DAYS.
+SYNC_OVERLAP_SECONDS = 5
+SYNC_TOMBSTONE_DAYS = 30
+
+# Server-sent change notifications (see alarmclock.events). BROKER delivers
+# within one process; point it at a shared broker when running several.
+# MAX_QUEUED events may wait per stream before it is told to resync, and idle
+# streams get a keepalive comment every KEEPALIVE_SECONDS.
+EVENTS = {
+    "BROKER": "alarmclock.events.LocalBroker",
+    "MAX_QUEUED": 100,
+    "KEEPALIVE_SECONDS": 15,
+}
+
+# Per-request timing (see alarmclock.middleware). SAMPLE_RATE is the share of
+# requests whose SQL is traced and reported in Server-Timing headers; lower it in
+# production. Every request slower than SLOW_REQUEST_MS is logged.
+REQUEST_TIMING = {
+    "SAMPLE_RATE": 1.0,
+    "SLOW_REQUEST_MS": 500,
+    "SLOWEST_QUERIES": 5,
+}
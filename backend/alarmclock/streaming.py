@@ -0,0 +1,80 @@
+"""
+Incremental JSON rendering for large list endpoints.
+
+Rows are rendered one at a time with the same encoder settings DRF's
+JSONRenderer uses, so a streamed body is byte-identical to the buffered
+`Response` for the same data while only one chunk is held in memory.
+"""
+
+import json
+from itertools import islice
+from typing import Any, Iterable, Iterator, Optional, TypeVar
+
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
+from rest_framework.settings import api_settings
+from rest_framework.utils import encoders
+
+# Rendered rows are coalesced into writes of roughly this many bytes.
+WRITE_BUFFER_SIZE = 64 * 1024
+
+T = TypeVar("T")
+
+
+def wants_streaming(request) -> bool:
+    return request.GET.get("stream", "").lower() in ("1", "true", "yes")
+
+
+def chunk_size() -> int:
+    return settings.STREAMING_CHUNK_SIZE
+
+
+def iter_chunks(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def render_json(data: Any) -> bytes:
+    """Same output as rest_framework.renderers.JSONRenderer for a compact, non-indented body."""
+    rendered = json.dumps(
+        data,
+        cls=encoders.JSONEncoder,
+        ensure_ascii=not api_settings.UNICODE_JSON,
+        allow_nan=not api_settings.STRICT_JSON,
+        separators=(",", ":") if api_settings.COMPACT_JSON else (", ", ": "),
+    )
+    rendered = rendered.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029")
+    return rendered.encode()
+
+
+def iter_json(rows: Iterable[Any], key: Optional[str] = None, extra: Optional[dict] = None) -> Iterator[bytes]:
+    """
+    Render `rows` as a JSON array, or as `{key: [rows...], **extra}` when a key is given.
+    """
+    buffer = bytearray(b"{" + render_json(key) + b":[" if key is not None else b"[")
+    for index, row in enumerate(rows):
+        if index:
+            buffer += b","
+        buffer += render_json(row)
+        if len(buffer) >= WRITE_BUFFER_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+
+    buffer += b"]"
+    if key is not None:
+        for extra_key, value in (extra or {}).items():
+            buffer += b"," + render_json(extra_key) + b":" + render_json(value)
+        buffer += b"}"
+    yield bytes(buffer)
+
+
+def json_response(data: Any, status: int = 200) -> HttpResponse:
+    """A buffered response rendered exactly as DRF would, for plain Django (async) views."""
+    return HttpResponse(render_json(data), content_type="application/json", status=status)
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+
+    def __init__(self, rows: Iterable[Any], key: Optional[str] = None, extra: Optional[dict] = None, status: int = 200):
+        super().__init__(iter_json(rows, key=key, extra=extra), content_type="application/json", status=status)
@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+
+class TestRunner(DiscoverRunner):
+    """
+    Runs the tests with throttling off. Every test client shares one address,
+    so otherwise each test would spend the budget of the ones after it;
+    tests of throttling itself turn it back on with override_settings.
+
+    The tests run in one process, so the response cache may use the
+    local-memory cache.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self.test_settings = override_settings(
+            THROTTLING={**settings.THROTTLING, "ENABLED": False}, RESPONSE_CACHE={**settings.RESPONSE_CACHE, "ALLOW_LOCAL": True}
+        )
+        self.test_settings.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self.test_settings.disable()
+        super().teardown_test_environment(**kwargs)
@@ -0,0 +1,147 @@
+"""
+Per-client rate limiting with token buckets.
+
+Every authenticated user (anonymous clients: every address) has a bucket of
+THROTTLING["USER"] (or ["ANON"]) capacity, refilled continuously at its rate.
+Each request takes its endpoint class's cost from it, so heavy list endpoints
+use up the budget faster than cheap ones; an endpoint class may also have a
+bucket of its own, limiting it independently of the others. Views name their
+class with a `throttle_scope` attribute.
+
+A request that finds too few tokens is refused with 429 and a Retry-After of
+the time until they will be there. The default store keeps buckets in process
+memory, so each process enforces its limits separately; THROTTLING["STORE"]
+names a store shared between processes instead.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.http import HttpResponse
+from django.utils.module_loading import import_string
+from rest_framework import status
+from rest_framework.throttling import BaseThrottle
+
+from .streaming import json_response
+
+
+class LocalBucketStore:
+    """
+    Buckets in a dict, kept to the MAX_BUCKETS most recently used. An evicted
+    bucket comes back full, which only ever errs towards letting a request in.
+    """
+
+    def __init__(self):
+        self.max_buckets = settings.THROTTLING["MAX_BUCKETS"]
+        # key -> (tokens, monotonic time they were counted at)
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(self, key: str, cost: float, capacity: float, rate: float) -> float:
+        """
+        Take `cost` tokens from the bucket. Returns 0 if they were there, and
+        otherwise (taking nothing) the seconds until they will be.
+        """
+        now = time.monotonic()
+        with self._lock:
+            tokens, counted_at = self._buckets.pop(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - counted_at) * rate)
+            wait = 0.0 if tokens >= cost else (cost - tokens) / rate
+            if not wait:
+                tokens -= cost
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+        return wait
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+class CacheBucketStore:
+    """
+    Buckets in a Django cache (THROTTLING["CACHE_ALIAS"]) shared by all
+    processes. The read and write of a bucket are not atomic, so concurrent
+    requests of one client can occasionally both spend the same tokens.
+    """
+
+    def __init__(self):
+        self._cache = caches[settings.THROTTLING["CACHE_ALIAS"]]
+
+    def consume(self, key: str, cost: float, capacity: float, rate: float) -> float:
+        now = time.time()
+        tokens, counted_at = self._cache.get(f"throttle:{key}", (capacity, now))
+        tokens = min(capacity, tokens + max(0.0, now - counted_at) * rate)
+        wait = 0.0 if tokens >= cost else (cost - tokens) / rate
+        if not wait:
+            tokens -= cost
+        # Untouched until it would be full again, the bucket may as well not exist.
+        self._cache.set(f"throttle:{key}", (tokens, now), timeout=math.ceil((capacity - tokens) / rate) + 1)
+        return wait
+
+
+@lru_cache(maxsize=None)
+def get_store() -> Any:
+    return import_string(settings.THROTTLING["STORE"])()
+
+
+@receiver(setting_changed)
+def reset_store(setting: str, **kwargs):
+    # Buckets filled under other limits (or another store) do not carry over.
+    if setting == "THROTTLING":
+        get_store.cache_clear()
+
+
+def check(client: str, anonymous: bool, scope: Optional[str] = None) -> float:
+    """
+    Charge one request of endpoint class `scope` to `client`. Returns 0 when it
+    may proceed, otherwise the seconds to wait.
+    """
+    config = settings.THROTTLING
+    if not config["ENABLED"]:
+        return 0.0
+    store = get_store()
+    scope_config = config["SCOPES"].get(scope, {})
+    if "capacity" in scope_config:
+        wait = store.consume(f"{client}:{scope}", 1, scope_config["capacity"], scope_config["rate"])
+        if wait:
+            return wait
+    budget = config["ANON" if anonymous else "USER"]
+    # A request refused here has still used its endpoint-class token.
+    return store.consume(client, scope_config.get("cost", 1), budget["capacity"], budget["rate"])
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """DRF throttle charging requests to the authenticated user, or to the client address."""
+
+    def allow_request(self, request, view) -> bool:
+        user = request.user
+        anonymous = not (user and user.is_authenticated)
+        client = f"anon:{self.get_ident(request)}" if anonymous else f"user:{user.pk}"
+        self.wait_seconds = check(client, anonymous, getattr(view, "throttle_scope", None))
+        return not self.wait_seconds
+
+    def wait(self) -> Optional[float]:
+        return self.wait_seconds or None
+
+
+async def athrottled(request, scope: Optional[str] = None) -> Optional[HttpResponse]:
+    """For plain async views: the 429 response to return if the request is over its limits, else None."""
+    user = await request.auser()
+    throttle = TokenBucketThrottle()
+    client = f"anon:{throttle.get_ident(request)}" if not user.is_authenticated else f"user:{user.pk}"
+    wait = check(client, not user.is_authenticated, scope)
+    if not wait:
+        return None
+    response = json_response({"error": "Request was throttled"}, status=status.HTTP_429_TOO_MANY_REQUESTS)
+    response["Retry-After"] = str(math.ceil(wait))
+    return response
@@ -16,30 +16,84 @@ Including another URLconf
 
 from django.contrib import admin
 from django.urls import path, include
-from authenticator.views import LoginView, SignUpView
-from task_manager.views import ProjectListView, AddTaskView, AddProjectView, TaskListView, EditTaskView
+from authenticator.views import LoginView, SignUpView, TokenObtainView, TokenRefreshView, TokenRevokeView
+from task_manager.views import (
+    ProjectListView,
+    AddTaskView,
+    AddProjectView,
+    TaskListView,
+    EditTaskView,
+    BulkAddTaskView,
+    BatchUpdateTasksView,
+    ProjectSummaryView,
+    TaskDependenciesView,
+    TaskDependenciesAddView,
+    TaskDependenciesRemoveView,
+    ProjectTaskOrderView,
+    AsyncProjectListView,
+    AsyncTaskListView,
+)
 from note_manager.views import (
     NewMeetingView,
     MeetingNoteView,
     EditNoteView,
+    PatchNoteView,
     UserMeetingsView,
     LinkTasksView,
+    MeetingTasksAddView,
+    MeetingTasksRemoveView,
     MeetingDetailsView,
+    CalendarView,
+    AsyncUserMeetingsView,
+    AsyncMeetingDetailsView,
+    AsyncMeetingNoteView,
+    EventStreamView,
 )
+from search.views import SearchView
+from sync.views import ChangesView
+from jobs.views import JobStatusView
+from workspace.views import ExportWorkspaceView, ImportWorkspaceView
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("login/", LoginView.as_view(), name="login"),
     path("signup/", SignUpView.as_view(), name="signup"),
+    path("token/", TokenObtainView.as_view(), name="token_obtain"),
+    path("token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    path("token/revoke/", TokenRevokeView.as_view(), name="token_revoke"),
     path("projects/<int:user_id>/", ProjectListView.as_view(), name="project_view"),
+    path("projects/<int:user_id>/summary/", ProjectSummaryView.as_view(), name="project_summary"),
     path("projects/<int:project_id>/add_task/", AddTaskView.as_view(), name="add_task"),
+    path("projects/<int:project_id>/add_task/bulk/", BulkAddTaskView.as_view(), name="bulk_add_task"),
+    path("projects/<int:project_id>/tasks/ordered/", ProjectTaskOrderView.as_view(), name="project_task_order"),
     path("projects/create/", AddProjectView.as_view(), name="add_project"),
     path("meetings/create/", NewMeetingView.as_view(), name="new_meeting"),
     path("meetings/<int:meeting_id>/note/", MeetingNoteView.as_view(), name="meeting_note"),
     path("meetings/<int:meeting_id>/note/edit/", EditNoteView.as_view(), name="edit_note"),
+    path("meetings/<int:meeting_id>/note/patch/", PatchNoteView.as_view(), name="patch_note"),
     path("meetings/", UserMeetingsView.as_view(), name="user_meetings"),
     path("meetings/<int:meeting_id>/add_task/", LinkTasksView.as_view(), name="add_task"),
+    path("meetings/<int:meeting_id>/tasks/add/", MeetingTasksAddView.as_view(), name="meeting_tasks_add"),
+    path("meetings/<int:meeting_id>/tasks/remove/", MeetingTasksRemoveView.as_view(), name="meeting_tasks_remove"),
     path("meetings/<int:meeting_id>/", MeetingDetailsView.as_view(), name="meeting_details"),
+    path("calendar/", CalendarView.as_view(), name="calendar"),
     path("tasks/<int:user_id>/", TaskListView.as_view(), name="task_view"),
     path("tasks/<int:task_id>/edit/", EditTaskView.as_view(), name="edit_task"),
+    path("tasks/batch/", BatchUpdateTasksView.as_view(), name="batch_update_tasks"),
+    path("tasks/<int:task_id>/dependencies/", TaskDependenciesView.as_view(), name="task_dependencies"),
+    path("tasks/<int:task_id>/dependencies/add/", TaskDependenciesAddView.as_view(), name="task_dependencies_add"),
+    path("tasks/<int:task_id>/dependencies/remove/", TaskDependenciesRemoveView.as_view(), name="task_dependencies_remove"),
+    path("search/", SearchView.as_view(), name="search"),
+    path("changes/", ChangesView.as_view(), name="changes"),
+    path("jobs/<int:job_id>/", JobStatusView.as_view(), name="job_status"),
+    path("workspace/export/", ExportWorkspaceView.as_view(), name="export_workspace"),
+    path("workspace/import/", ImportWorkspaceView.as_view(), name="import_workspace"),
+    # Server-sent events; only served through asgi.py.
+    path("events/", EventStreamView.as_view(), name="events"),
+    # Async variants of the hot read endpoints, for deployments served through asgi.py.
+    path("async/projects/<int:user_id>/", AsyncProjectListView.as_view(), name="async_project_view"),
+    path("async/tasks/<int:user_id>/", AsyncTaskListView.as_view(), name="async_task_view"),
+    path("async/meetings/", AsyncUserMeetingsView.as_view(), name="async_user_meetings"),
+    path("async/meetings/<int:meeting_id>/", AsyncMeetingDetailsView.as_view(), name="async_meeting_details"),
+    path("async/meetings/<int:meeting_id>/note/", AsyncMeetingNoteView.as_view(), name="async_meeting_note"),
 ]
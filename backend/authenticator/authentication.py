@@ -0,0 +1,16 @@
+from rest_framework.authentication import BaseAuthentication
+
+
+class TokenAuthentication(BaseAuthentication):
+    """
+    Hands DRF the user TokenAuthenticationMiddleware resolved from a bearer
+    token. Listed before SessionAuthentication so token requests skip the
+    session lookup and its CSRF check.
+    """
+
+    def authenticate(self, request):
+        user = getattr(request._request, "token_user", None)
+        return None if user is None else (user, None)
+
+    def authenticate_header(self, request) -> str:
+        return "Bearer"
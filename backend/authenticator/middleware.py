@@ -0,0 +1,62 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.http import JsonResponse
+
+from . import tokens
+
+
+def bearer_token(request):
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    return token.strip() if scheme.lower() == "bearer" else None
+
+
+def unauthorized(error: tokens.InvalidToken) -> JsonResponse:
+    response = JsonResponse({"error": str(error)}, status=401)
+    response["WWW-Authenticate"] = 'Bearer error="invalid_token"'
+    return response
+
+
+class TokenAuthenticationMiddleware:
+    """
+    Authenticates requests carrying `Authorization: Bearer <access token>` (see
+    authenticator.tokens) and sets `request.user` from the token, so neither
+    the session nor the user table is read. Requests without one fall through
+    to the session. Goes after AuthenticationMiddleware.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = bearer_token(request)
+        if token is not None:
+            try:
+                self.set_user(request, tokens.authenticate(token))
+            except tokens.InvalidToken as e:
+                return unauthorized(e)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        token = bearer_token(request)
+        if token is not None:
+            try:
+                self.set_user(request, await sync_to_async(tokens.authenticate)(token))
+            except tokens.InvalidToken as e:
+                return unauthorized(e)
+        return await self.get_response(request)
+
+    @staticmethod
+    def set_user(request, user) -> None:
+        async def auser():
+            return user
+
+        request.user = user
+        request.auser = auser
+        # Tells TokenAuthentication that DRF can take this user as is.
+        request.token_user = user
@@ -0,0 +1,18 @@
+# Generated by Django 4.2 on 2026-10-18 19:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authenticator", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="account",
+            name="token_version",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1 @@
+from .models import Account
@@ -1,3 +1,5 @@
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
 from django.db import models
 from django.contrib.auth.models import User
 
@@ -5,4 +7,22 @@ from django.contrib.auth.models import User
 # Create your models here.
 class Account(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="account")
-    bio = models.TextField(max_length=15)
+    bio = models.TextField(max_length=15, blank=True, default="")
+    # IANA name; local midnight in this zone is when the user's daily tasks roll over.
+    timezone = models.CharField(max_length=64, default="UTC")
+    # Local date of the last daily-task rollover (see task_manager DailyTaskHistory.rollover).
+    last_rollover_date = models.DateField(null=True)
+    # Bumped to revoke every API token issued so far (see authenticator.tokens).
+    token_version = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        indexes = [models.Index(fields=["timezone", "last_rollover_date"], name="account_rollover_idx")]
+
+    @classmethod
+    def timezone_for(cls, user_id: int) -> ZoneInfo:
+        """The user's timezone; UTC without an account or for an unknown zone name."""
+        name = cls.objects.filter(user_id=user_id).values_list("timezone", flat=True).first() or "UTC"
+        try:
+            return ZoneInfo(name)
+        except (ZoneInfoNotFoundError, ValueError):
+            return ZoneInfo("UTC")
@@ -1,3 +1,103 @@
-from django.test import TestCase
+from datetime import datetime, timezone
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import F
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from authenticator import tokens
+from authenticator.models import Account
+from note_manager.models import Meeting
+
+
+class TokenAuthenticationTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        tokens.users.clear()
+        self.user = User.objects.create_user(username="owner", password="correct horse")
+        start = datetime(2026, 3, 1, 10, tzinfo=timezone.utc)
+        self.meeting = Meeting.objects.create(owner=self.user, title="Standup", description="", start_time=start, end_time=start)
+
+    def obtain(self) -> dict:
+        response = self.client.post(reverse("token_obtain"), {"username": "owner", "password": "correct horse"}, content_type="application/json")
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def get_meetings(self, access: str):
+        return self.client.get(reverse("user_meetings"), headers={"authorization": f"Bearer {access}"})
+
+    def test_bearer_token_identifies_the_user(self):
+        access = self.obtain()["access"]
+        response = self.get_meetings(access)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([m["id"] for m in response.json()], [self.meeting.pk])
+        self.assertNotIn("sessionid", response.cookies)
+
+    def test_warm_tokens_resolve_without_queries(self):
+        access = self.obtain()["access"]
+        tokens.authenticate(access)
+        with self.assertNumQueries(0):
+            self.assertEqual(tokens.authenticate(access).pk, self.user.pk)
+
+    def test_invalid_expired_and_revoked_tokens_are_rejected(self):
+        pair = self.obtain()
+        self.assertEqual(self.get_meetings("garbage").status_code, 401)
+        # Refresh tokens are signed for a different purpose.
+        self.assertEqual(self.get_meetings(pair["refresh"]).status_code, 401)
+
+        with override_settings(AUTH_TOKENS={**settings.AUTH_TOKENS, "ACCESS_TTL": -1}):
+            self.assertEqual(self.get_meetings(pair["access"]).json(), {"error": "Token has expired"})
+
+        response = self.client.post(reverse("token_revoke"), headers={"authorization": f"Bearer {pair['access']}"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_meetings(pair["access"]).json(), {"error": "Token has been revoked"})
+        self.assertEqual(self.client.post(reverse("token_refresh"), {"refresh": pair["refresh"]}, content_type="application/json").status_code, 401)
+
+    def test_revocation_survives_a_cache_flush(self):
+        access = self.obtain()["access"]
+        tokens.revoke(self.user.pk)
+        cache.clear()
+        with self.assertRaises(tokens.InvalidToken):
+            tokens.authenticate(access)
+
+    def revoke_elsewhere(self) -> None:
+        # As another process revokes: the database changes, this cache does not.
+        Account.objects.get_or_create(user=self.user)
+        Account.objects.filter(user=self.user).update(token_version=F("token_version") + 1)
+
+    def test_revocation_elsewhere_reaches_this_process(self):
+
+        pair = self.obtain()
+        self.assertEqual(tokens.authenticate(pair["access"]).pk, self.user.pk)
+        self.revoke_elsewhere()
+        response = self.client.post(reverse("token_refresh"), {"refresh": pair["refresh"]}, content_type="application/json")
+        self.assertEqual(response.status_code, 401)
+
+        # Versions cached from now on expire at once.
+        cache.clear()
+        with override_settings(AUTH_TOKENS={**settings.AUTH_TOKENS, "VERSION_CACHE_SECONDS": 0}):
+            access = self.obtain()["access"]
+            self.assertEqual(tokens.authenticate(access).pk, self.user.pk)
+            self.revoke_elsewhere()
+            with self.assertRaises(tokens.InvalidToken):
+                tokens.authenticate(access)
+
+    def test_refresh_issues_a_new_pair(self):
+        refresh = self.obtain()["refresh"]
+        response = self.client.post(reverse("token_refresh"), {"refresh": refresh}, content_type="application/json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_meetings(response.json()["access"]).status_code, 200)
+
+    def test_token_posts_skip_csrf(self):
+        client = self.client_class(enforce_csrf_checks=True)
+        access = self.obtain()["access"]
+        response = client.post(reverse("token_revoke"), headers={"authorization": f"Bearer {access}"})
+        self.assertEqual(response.status_code, 200)
+
+    async def test_async_views_accept_tokens(self):
+        access = (await self.async_client.post(reverse("token_obtain"), {"username": "owner", "password": "correct horse"}, content_type="application/json")).json()["access"]
+        response = await self.async_client.get(reverse("async_user_meetings"), headers={"authorization": f"Bearer {access}"})
+        self.assertEqual([m["id"] for m in response.json()], [self.meeting.pk])
@@ -0,0 +1,139 @@
+"""
+Stateless API authentication with signed tokens.
+
+An access token is a signed, timestamped {user id, token version} pair, valid
+for AUTH_TOKENS["ACCESS_TTL"] seconds; a refresh token carries the same pair for
+longer and is exchanged for a new pair at the refresh endpoint. Verifying a
+token is a signature check, the user's current version comes from the cache
+and the resolved user from an in-process LRU, so an authenticated request
+needs no database query for its identity once warm.
+
+Bumping a user's version (Account.token_version) revokes every token issued
+before. Cached versions expire after AUTH_TOKENS["VERSION_CACHE_SECONDS"], so a
+revocation reaches processes that do not share the cache within that time;
+refresh tokens are always checked against the database.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core import signing
+from django.core.cache import caches
+from django.db.models import F
+
+from .models import Account
+
+ACCESS_SALT = "authenticator.tokens.access"
+REFRESH_SALT = "authenticator.tokens.refresh"
+
+
+class InvalidToken(Exception):
+    """The token is malformed, expired, revoked or names an unknown user."""
+
+
+def _cache():
+    return caches[settings.AUTH_TOKENS["CACHE_ALIAS"]]
+
+
+def _version_key(user_id: int) -> str:
+    return f"auth:token_version:{user_id}"
+
+
+def _version_timeout() -> int:
+    return min(settings.AUTH_TOKENS["VERSION_CACHE_SECONDS"], settings.AUTH_TOKENS["ACCESS_TTL"])
+
+
+def current_version(user_id: int, cached: bool = True) -> int:
+    """The user's token version; read from the database rather than the cache unless `cached`."""
+    cache = _cache()
+    version = cache.get(_version_key(user_id)) if cached else None
+    if version is None:
+        version = Account.objects.filter(user_id=user_id).values_list("token_version", flat=True).first() or 0
+        cache.set(_version_key(user_id), version, timeout=_version_timeout())
+    return version
+
+
+def revoke(user_id: int) -> int:
+    """Invalidate every token issued to the user so far; returns the new version."""
+    Account.objects.get_or_create(user_id=user_id)
+    Account.objects.filter(user_id=user_id).update(token_version=F("token_version") + 1)
+    version = Account.objects.filter(user_id=user_id).values_list("token_version", flat=True).get()
+    _cache().set(_version_key(user_id), version, timeout=_version_timeout())
+    return version
+
+
+def issue(user: User) -> dict:
+    payload = {"u": user.pk, "v": current_version(user.pk)}
+    return {
+        "access": signing.dumps(payload, salt=ACCESS_SALT),
+        "refresh": signing.dumps(payload, salt=REFRESH_SALT),
+        "expires_in": settings.AUTH_TOKENS["ACCESS_TTL"],
+    }
+
+
+def _verify(token: str, salt: str, max_age: int, cached: bool = True) -> tuple[int, int]:
+    try:
+        payload = signing.loads(token, salt=salt, max_age=max_age)
+    except signing.SignatureExpired:
+        raise InvalidToken("Token has expired")
+    except signing.BadSignature:
+        raise InvalidToken("Invalid token")
+    if payload["v"] != current_version(payload["u"], cached):
+        raise InvalidToken("Token has been revoked")
+    return payload["u"], payload["v"]
+
+
+class UserCache:
+    """Bounded LRU of active users by (id, token version), shared by the threads of a process."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._users: OrderedDict[tuple[int, int], User] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[int, int]) -> Optional[User]:
+        with self._lock:
+            user = self._users.get(key)
+            if user is not None:
+                self._users.move_to_end(key)
+            return user
+
+    def put(self, key: tuple[int, int], user: User) -> None:
+        with self._lock:
+            self._users[key] = user
+            self._users.move_to_end(key)
+            while len(self._users) > self.max_size:
+                self._users.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._users.clear()
+
+
+users = UserCache(settings.AUTH_TOKENS["USER_CACHE_SIZE"])
+
+
+def authenticate(access_token: str) -> User:
+    """The user an access token was issued to. Raises InvalidToken."""
+    key = _verify(access_token, ACCESS_SALT, settings.AUTH_TOKENS["ACCESS_TTL"])
+    user = users.get(key)
+    if user is None:
+        user = User.objects.filter(pk=key[0], is_active=True).first()
+        if user is None:
+            raise InvalidToken("User not found or inactive")
+        users.put(key, user)
+    return user
+
+
+def refresh(refresh_token: str) -> dict:
+    """A new token pair for a valid refresh token. Raises InvalidToken."""
+    # Long-lived, so checked against the database in case this process's cache
+    # has not seen a revocation yet.
+    user_id, _ = _verify(refresh_token, REFRESH_SALT, settings.AUTH_TOKENS["REFRESH_TTL"], cached=False)
+    user = User.objects.filter(pk=user_id, is_active=True).first()
+    if user is None:
+        raise InvalidToken("User not found or inactive")
+    return issue(user)
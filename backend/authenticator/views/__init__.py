@@ -1,2 +1,3 @@
 from .login_view import LoginView
 from .signup import SignUpView
+from .tokens import TokenObtainView, TokenRefreshView, TokenRevokeView
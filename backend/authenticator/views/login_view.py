@@ -9,6 +9,7 @@ from ..utils import *
 
 
 class LoginView(APIView):
+    throttle_scope = "auth"
 
     def post(self, request):
 
@@ -8,6 +8,7 @@ from ..utils import *
 
 
 class SignUpView(APIView):
+    throttle_scope = "auth"
 
     def post(self, request: HttpRequest):
 
@@ -0,0 +1,38 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from django.contrib.auth import authenticate
+
+from .. import tokens
+
+
+class TokenObtainView(APIView):
+    """Like LoginView, but answers with an access/refresh token pair instead of starting a session."""
+
+    throttle_scope = "auth"
+
+    def post(self, request):
+        user = authenticate(request, username=request.data.get("username"), password=request.data.get("password"))
+        if user is None:
+            return Response({"status": "error", "message": "Invalid username or password"}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"status": "success", "user_id": user.pk, **tokens.issue(user)}, status=status.HTTP_200_OK)
+
+
+class TokenRefreshView(APIView):
+    throttle_scope = "auth"
+
+    def post(self, request):
+        try:
+            return Response(tokens.refresh(request.data.get("refresh") or ""), status=status.HTTP_200_OK)
+        except tokens.InvalidToken as e:
+            return Response({"status": "error", "message": str(e)}, status=status.HTTP_401_UNAUTHORIZED)
+
+
+class TokenRevokeView(APIView):
+    """Revokes every token of the authenticated user, e.g. to log out everywhere."""
+
+    def post(self, request):
+        if not request.user.is_authenticated:
+            return Response({"status": "error", "message": "Authentication required"}, status=status.HTTP_401_UNAUTHORIZED)
+        tokens.revoke(request.user.pk)
+        return Response({"status": "success"}, status=status.HTTP_200_OK)
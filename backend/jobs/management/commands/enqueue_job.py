@@ -0,0 +1,25 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.models import Job
+from jobs.registry import handlers
+
+
+class Command(BaseCommand):
+    help = "Queue a background job for the run_jobs workers, e.g. enqueue_job task_manager.rollover_daily_tasks."
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", help="One of the registered job kinds")
+        parser.add_argument("--payload", default="{}", help="JSON object passed to the handler as keyword arguments")
+        parser.add_argument("--max-attempts", type=int)
+
+    def handle(self, *args, kind: str, payload: str, max_attempts, **options):
+        try:
+            payload = json.loads(payload)
+        except ValueError as e:
+            raise CommandError(f"Invalid --payload: {e}")
+        if kind not in handlers:
+            raise CommandError(f"Unknown job kind {kind!r}; registered: {', '.join(sorted(handlers))}")
+        job = Job.enqueue(kind, payload, max_attempts=max_attempts)
+        self.stdout.write(f"Queued job {job.pk}")
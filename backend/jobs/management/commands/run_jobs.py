@@ -0,0 +1,100 @@
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connections
+
+from jobs.models import Job
+
+logger = logging.getLogger("jobs.worker")
+
+# How often each worker releases jobs whose worker stopped (see Job.requeue_stale).
+REQUEUE_INTERVAL_SECONDS = 60
+
+
+def work(name: str, stop: threading.Event, once: bool, poll_interval: float) -> int:
+    """Run jobs until `stop` is set (or, with `once`, until none is due). Returns how many ran."""
+    ran = 0
+    requeued_at = float("-inf")
+    while not stop.is_set():
+        try:
+            close_old_connections()
+            if time.monotonic() - requeued_at >= REQUEUE_INTERVAL_SECONDS:
+                Job.requeue_stale()
+                requeued_at = time.monotonic()
+            job = Job.claim(name)
+            if job is None:
+                if once:
+                    break
+                stop.wait(poll_interval)
+                continue
+            job.run()
+            ran += 1
+        except Exception:
+            # A job this left running is requeued once its lock times out.
+            logger.exception("Worker %s failed", name)
+            stop.wait(poll_interval)
+    connections.close_all()
+    return ran
+
+
+def work_in_threads(name: str, threads: int, once: bool, poll_interval: float) -> None:
+    """One worker process: `threads` workers sharing a stop flag set by SIGTERM/SIGINT."""
+    stop = threading.Event()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, lambda *args: stop.set())
+    workers = [
+        threading.Thread(target=work, args=(f"{name}:{index}", stop, once, poll_interval), name=f"{name}:{index}")
+        for index in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+class Command(BaseCommand):
+    help = (
+        "Run queued background jobs with a pool of --processes worker processes of --threads threads each. "
+        "Stops after the running jobs finish on SIGTERM or Ctrl-C."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--processes", type=int, default=1)
+        parser.add_argument("--threads", type=int, default=1, help="Worker threads per process")
+        parser.add_argument("--once", action="store_true", help="Exit once no job is due instead of waiting for more")
+        parser.add_argument("--poll-interval", type=float, default=settings.JOBS["POLL_INTERVAL_SECONDS"])
+
+    def handle(self, *args, processes: int, threads: int, once: bool, poll_interval: float, **options):
+        name = f"{socket.gethostname()}:{os.getpid()}"
+        if processes == 1 and threads == 1:
+            # The simple case runs in this thread, which also keeps it inside test transactions.
+            ran = work(name, threading.Event(), once, poll_interval)
+            self.stdout.write(f"Ran {ran} jobs")
+            return
+
+        if processes == 1:
+            work_in_threads(name, threads, once, poll_interval)
+            return
+
+        # Children must not inherit this process's database connections.
+        connections.close_all()
+        pool = [
+            multiprocessing.Process(target=work_in_threads, args=(f"{name}/{index}", threads, once, poll_interval), name=f"{name}/{index}")
+            for index in range(processes)
+        ]
+        for process in pool:
+            process.start()
+        try:
+            for process in pool:
+                process.join()
+        except KeyboardInterrupt:
+            for process in pool:
+                process.terminate()
+                process.join()
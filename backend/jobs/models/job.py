@@ -0,0 +1,144 @@
+import json
+import random
+import traceback
+from datetime import datetime, timedelta
+from typing import Any, Optional
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import connection, models, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from ..registry import handlers
+
+# Due jobs a worker tries in turn when it cannot lock rows and may lose races.
+CLAIM_CANDIDATES = 10
+
+
+class Job(models.Model):
+    """
+    A unit of background work: the handler registered for `kind`, called with
+    `payload`, run by the run_jobs workers rather than in a request.
+
+    Workers claim due jobs with SELECT ... FOR UPDATE SKIP LOCKED where the
+    database supports it, and otherwise (SQLite) with a conditional UPDATE that
+    only one of them can win. A failed job is retried with exponential backoff
+    until it has had `max_attempts`; a job whose worker died is picked up again
+    once its lock is older than JOBS["LOCK_TIMEOUT_SECONDS"].
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    STATUS_CHOICES = ((QUEUED, QUEUED), (RUNNING, RUNNING), (SUCCEEDED, SUCCEEDED), (FAILED, FAILED))
+
+    kind = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict)
+    # Who asked for it, when anyone did.
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="jobs", null=True)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=QUEUED)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField()
+    # Not claimed before this time; pushed back after each failure.
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, default="")
+    locked_at = models.DateTimeField(null=True)
+    result = models.JSONField(null=True)
+    error = models.TextField(default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "run_at", "id"], name="job_due_idx"),
+            models.Index(fields=["status", "locked_at"], name="job_lock_idx"),
+        ]
+
+    @classmethod
+    def enqueue(
+        cls, kind: str, payload: Optional[dict] = None, user_id: Optional[int] = None, run_at: Optional[datetime] = None, max_attempts: Optional[int] = None
+    ) -> "Job":
+        if kind not in handlers:
+            raise ValueError(f"Unknown job kind {kind!r}")
+        return cls.objects.create(
+            kind=kind,
+            payload=payload or {},
+            user_id=user_id,
+            run_at=run_at or timezone.now(),
+            max_attempts=max_attempts or settings.JOBS["MAX_ATTEMPTS"],
+        )
+
+    @classmethod
+    def claim(cls, worker: str) -> Optional["Job"]:
+        """Lock the next due job for `worker` and mark it running, or return None if none is due."""
+        now = timezone.now()
+        with transaction.atomic():
+            due = cls.objects.filter(status=cls.QUEUED, run_at__lte=now).order_by("run_at", "id")
+            candidates = CLAIM_CANDIDATES
+            if connection.features.has_select_for_update_skip_locked:
+                # Other workers skip the row locked here instead of waiting on it.
+                due, candidates = due.select_for_update(skip_locked=True), 1
+            # Without row locks another worker can take a candidate first; the
+            # status condition on the UPDATE makes sure only one of them gets it.
+            for job_id in due.values_list("id", flat=True)[:candidates]:
+                claimed = cls.objects.filter(id=job_id, status=cls.QUEUED).update(
+                    status=cls.RUNNING, locked_by=worker, locked_at=now, attempts=F("attempts") + 1
+                )
+                if claimed:
+                    return cls.objects.get(id=job_id)
+        return None
+
+    @classmethod
+    def requeue_stale(cls) -> int:
+        """Release jobs whose worker stopped without finishing them; the lost attempt counts."""
+        stale = cls.objects.filter(status=cls.RUNNING, locked_at__lt=timezone.now() - timedelta(seconds=settings.JOBS["LOCK_TIMEOUT_SECONDS"]))
+        failed = stale.filter(attempts__gte=F("max_attempts")).update(
+            status=cls.FAILED, error="Worker stopped while running the job", finished_at=timezone.now()
+        )
+        return failed + stale.update(status=cls.QUEUED, locked_by="", locked_at=None)
+
+    def backoff(self) -> timedelta:
+        """Delay before the next attempt: doubling per attempt, capped, with jitter so retries spread out."""
+        delay = min(settings.JOBS["MAX_BACKOFF_SECONDS"], settings.JOBS["BACKOFF_SECONDS"] * 2 ** (self.attempts - 1))
+        return timedelta(seconds=delay * random.uniform(0.5, 1.0))
+
+    def run(self) -> None:
+        """Call the handler of a claimed job and record the outcome."""
+        try:
+            handler = handlers[self.kind]
+            result: Any = handler(**self.payload)
+            # A result that cannot be stored fails the job rather than the save below.
+            json.dumps(result)
+        except Exception:
+            self.error = traceback.format_exc()
+            self.locked_by, self.locked_at = "", None
+            if self.attempts < self.max_attempts:
+                self.status = self.QUEUED
+                self.run_at = timezone.now() + self.backoff()
+            else:
+                self.status = self.FAILED
+                self.finished_at = timezone.now()
+            self.save(update_fields=["status", "error", "locked_by", "locked_at", "run_at", "finished_at"])
+            return
+
+        self.status, self.result, self.error = self.SUCCEEDED, result, ""
+        self.locked_by, self.locked_at = "", None
+        self.finished_at = timezone.now()
+        self.save(update_fields=["status", "result", "error", "locked_by", "locked_at", "finished_at"])
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.pk,
+            "kind": self.kind,
+            "status": self.status,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "run_at": self.run_at,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+            # The last line of the traceback says what went wrong; the rest stays server-side.
+            "error": self.error.strip().splitlines()[-1] if self.error else None,
+        }
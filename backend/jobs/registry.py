@@ -0,0 +1,19 @@
+from typing import Any, Callable
+
+# Job kind -> handler, filled by the @job decorator in each app's jobs.py.
+handlers: dict[str, Callable[..., Any]] = {}
+
+
+def job(kind: str):
+    """
+    Register the decorated function as the handler of `kind`. It is called
+    with the job's payload as keyword arguments; what it returns (JSON
+    serializable) becomes the job's result. It may run more than once for the
+    same job, after a failure, so it should be safe to repeat.
+    """
+
+    def register(handler: Callable[..., Any]) -> Callable[..., Any]:
+        handlers[kind] = handler
+        return handler
+
+    return register
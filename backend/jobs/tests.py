@@ -0,0 +1,157 @@
+import io
+import threading
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from jobs.management.commands.run_jobs import work
+from jobs.models import Job
+from jobs.registry import handlers, job
+from task_manager.models.project import Project
+from task_manager.models.project_task import ProjectTask
+
+calls: list[dict] = []
+
+
+@job("jobs.tests.record")
+def record(**payload) -> dict:
+    calls.append(payload)
+    return {"seen": len(calls)}
+
+
+@job("jobs.tests.unstorable")
+def unstorable() -> object:
+    return object()
+
+
+@job("jobs.tests.explode")
+def explode() -> None:
+    raise RuntimeError("boom")
+
+
+class JobQueueTests(TestCase):
+
+    def setUp(self):
+        calls.clear()
+
+    def test_enqueue_rejects_unknown_kinds(self):
+        with self.assertRaises(ValueError):
+            Job.enqueue("jobs.tests.missing")
+
+    def test_claim_and_run(self):
+        queued = Job.enqueue("jobs.tests.record", {"x": 1})
+        later = Job.enqueue("jobs.tests.record", run_at=timezone.now() + timedelta(hours=1))
+
+        claimed = Job.claim("worker")
+        self.assertEqual(claimed.pk, queued.pk)
+        self.assertEqual((claimed.status, claimed.attempts, claimed.locked_by), (Job.RUNNING, 1, "worker"))
+        # The other job is not due yet.
+        self.assertIsNone(Job.claim("worker"))
+
+        claimed.run()
+        claimed.refresh_from_db()
+        self.assertEqual(calls, [{"x": 1}])
+        self.assertEqual((claimed.status, claimed.result, claimed.locked_by), (Job.SUCCEEDED, {"seen": 1}, ""))
+        self.assertIsNotNone(claimed.finished_at)
+        self.assertEqual(Job.objects.get(pk=later.pk).status, Job.QUEUED)
+
+    @override_settings(JOBS={"MAX_ATTEMPTS": 5, "BACKOFF_SECONDS": 10, "MAX_BACKOFF_SECONDS": 3600, "LOCK_TIMEOUT_SECONDS": 60, "POLL_INTERVAL_SECONDS": 1.0})
+    def test_failures_back_off_then_fail(self):
+        failing = Job.enqueue("jobs.tests.explode", max_attempts=2)
+
+        Job.claim("worker").run()
+        failing.refresh_from_db()
+        self.assertEqual((failing.status, failing.attempts), (Job.QUEUED, 1))
+        self.assertIn("RuntimeError: boom", failing.error)
+        delay = failing.run_at - timezone.now()
+        self.assertTrue(timedelta(seconds=3) < delay <= timedelta(seconds=10))
+
+        Job.objects.filter(pk=failing.pk).update(run_at=timezone.now())
+        Job.claim("worker").run()
+        failing.refresh_from_db()
+        self.assertEqual((failing.status, failing.attempts), (Job.FAILED, 2))
+        self.assertEqual(failing.to_dict()["error"], "RuntimeError: boom")
+        self.assertIsNone(Job.claim("worker"))
+
+    @override_settings(JOBS={"MAX_ATTEMPTS": 5, "BACKOFF_SECONDS": 10, "MAX_BACKOFF_SECONDS": 3600, "LOCK_TIMEOUT_SECONDS": 60, "POLL_INTERVAL_SECONDS": 1.0})
+    def test_requeue_stale(self):
+        retried = Job.enqueue("jobs.tests.record")
+        exhausted = Job.enqueue("jobs.tests.record", max_attempts=1)
+        Job.claim("worker")
+        Job.claim("worker")
+        Job.objects.update(locked_at=timezone.now() - timedelta(minutes=5))
+
+        self.assertEqual(Job.requeue_stale(), 2)
+        self.assertEqual(Job.objects.get(pk=retried.pk).status, Job.QUEUED)
+        self.assertEqual(Job.objects.get(pk=exhausted.pk).status, Job.FAILED)
+
+    def test_run_jobs_once(self):
+        for i in range(3):
+            Job.enqueue("jobs.tests.record", {"i": i})
+        out = io.StringIO()
+        call_command("run_jobs", "--once", stdout=out)
+        self.assertIn("Ran 3 jobs", out.getvalue())
+        self.assertEqual([call["i"] for call in calls], [0, 1, 2])
+        self.assertFalse(Job.objects.exclude(status=Job.SUCCEEDED).exists())
+
+    @override_settings(JOBS={"MAX_ATTEMPTS": 5, "BACKOFF_SECONDS": 10, "MAX_BACKOFF_SECONDS": 3600, "LOCK_TIMEOUT_SECONDS": 60, "POLL_INTERVAL_SECONDS": 1.0})
+    def test_workers_survive_errors_and_recover_stale_jobs(self):
+        stale = Job.enqueue("jobs.tests.record", {"stale": True})
+        Job.claim("dead worker")
+        Job.objects.filter(pk=stale.pk).update(locked_at=timezone.now() - timedelta(minutes=5))
+        unstorable = Job.enqueue("jobs.tests.unstorable")
+        Job.enqueue("jobs.tests.record", {"stale": False})
+
+        claim = Job.claim
+        failures = iter([RuntimeError("connection lost")])
+
+        def flaky_claim(name):
+            for error in failures:
+                raise error
+            return claim(name)
+
+        with mock.patch.object(Job, "claim", side_effect=flaky_claim), self.assertLogs("jobs.worker", "ERROR"):
+            ran = work("worker", threading.Event(), once=True, poll_interval=0)
+
+        self.assertEqual(ran, 3)
+        self.assertEqual(sorted(call["stale"] for call in calls), [False, True])
+        unstorable.refresh_from_db()
+        self.assertEqual(unstorable.status, Job.QUEUED)
+        self.assertIn("TypeError", unstorable.error)
+
+    def test_registered_jobs(self):
+        self.assertIn("task_manager.bulk_upsert_tasks", handlers)
+        self.assertIn("search.rebuild_index", handlers)
+
+
+class BackgroundBulkAddTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username="owner", email="owner@example.com")
+        self.client.force_login(self.user)
+        self.project = Project.objects.create(user=self.user, display_name="Project", description="")
+
+    def test_job_status_not_found(self):
+        response = self.client.get(reverse("job_status", kwargs={"job_id": 12345}))
+        self.assertEqual(response.status_code, 404)
+
+    def test_background_bulk_add(self):
+        url = reverse("bulk_add_task", kwargs={"project_id": self.project.pk}) + "?background=1"
+        items = [{"title": f"Task {i}", "description": ""} for i in range(3)] + [{"description": "no title"}]
+        response = self.client.post(url, {"tasks": items}, content_type="application/json")
+        self.assertEqual(response.status_code, 202)
+        status_url = reverse("job_status", kwargs={"job_id": response.json()["job_id"]})
+        self.assertEqual(self.client.get(status_url).json()["status"], Job.QUEUED)
+        self.assertFalse(ProjectTask.objects.filter(project=self.project).exists())
+
+        call_command("run_jobs", "--once", stdout=io.StringIO())
+
+        body = self.client.get(status_url).json()
+        self.assertEqual(body["status"], Job.SUCCEEDED)
+        self.assertEqual((body["result"]["created"], body["result"]["error"]), (3, 1))
+        self.assertEqual(ProjectTask.objects.filter(project=self.project).count(), 3)
@@ -0,0 +1 @@
+from .job_status import JobStatusView
@@ -0,0 +1,20 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+
+from ..models import Job
+
+
+class JobStatusView(APIView):
+    """
+    Status of a background job, polled by clients after an endpoint answered
+    202 with its id: queued or running until it succeeds (with its result) or
+    has failed every attempt (with the last error).
+    """
+
+    def get(self, request, job_id: int) -> Response:
+        try:
+            job = Job.objects.get(id=job_id)
+        except Job.DoesNotExist:
+            return Response({"error": "Job not found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(job.to_dict(), status=status.HTTP_200_OK)
@@ -0,0 +1,50 @@
+# Generated by Django 4.2 on 2026-10-18 17:55
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_owner(apps, schema_editor):
+    # Existing meetings have no owner; attribute each one to the owner of the
+    # project of its first linked task. Meetings without tasks stay unowned.
+    Meeting = apps.get_model("note_manager", "Meeting")
+    ProjectTask = apps.get_model("task_manager", "ProjectTask")
+    first_task_owner = (
+        ProjectTask.objects.filter(meetings=OuterRef("pk"))
+        .order_by("id")
+        .values("project__user_id")[:1]
+    )
+    Meeting.objects.filter(owner__isnull=True).update(
+        owner_id=Subquery(first_task_owner)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("note_manager", "0001_initial"),
+        ("task_manager", "0003_project_task_listing_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="meeting",
+            name="owner",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="meetings",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.RunPython(backfill_owner, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="meeting",
+            index=models.Index(
+                fields=["owner", "start_time"], name="meeting_owner_start_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2 on 2026-10-18 18:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("note_manager", "0002_meeting_owner"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="note",
+            name="revision",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-18 19:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("note_manager", "0003_note_revision"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="meeting",
+            index=models.Index(fields=["owner", "updated_at"], name="meeting_owner_updated_idx"),
+        ),
+    ]
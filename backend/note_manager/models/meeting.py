@@ -1,8 +1,13 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Prefetch, QuerySet
+from django.contrib.auth.models import User
+from django.dispatch import Signal
 from pydantic import BaseModel, Field
-from datetime import datetime
-from typing import List, Optional
-from task_manager.models.project_task import ProjectTask
+from datetime import date, datetime, time
+from typing import Iterable, Iterator, List, Optional, Union
+from alarmclock.streaming import iter_chunks
+from authenticator.models import Account
+from task_manager.models.project_task import ProjectTask, task_row_fields
 
 
 class MeetingSchema(BaseModel):
@@ -21,7 +26,16 @@ class MeetingSchema(BaseModel):
         json_decoders = {datetime: datetime.fromisoformat}
 
 
+# Columns for the values_list() fast path, in MeetingSchema field order (tasks excluded).
+MEETING_ROW_FIELDS = ("id", "title", "description", "start_time", "end_time")
+
+# Sent with `meeting_ids` after set-based writes (bulk_create) to meetings, their
+# task links or their notes, which bypass the per-row save and m2m_changed receivers.
+meetings_bulk_updated = Signal()
+
+
 class Meeting(models.Model):
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name="meetings", null=True)
     title = models.CharField(max_length=200)
     description = models.TextField()
     start_time = models.DateTimeField()
@@ -31,6 +45,12 @@ class Meeting(models.Model):
 
     tasks = models.ManyToManyField(ProjectTask, related_name="meetings")
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["owner", "start_time"], name="meeting_owner_start_idx"),
+            models.Index(fields=["owner", "updated_at"], name="meeting_owner_updated_idx"),
+        ]
+
     def __str__(self) -> str:
         return self.title
 
@@ -44,9 +64,38 @@ class Meeting(models.Model):
             tasks=[task.serialize().model_dump() for task in self.tasks.all()],
         )
 
+    @classmethod
+    def linked_task_rows(cls, meetings: Union[QuerySet, list[int]]) -> QuerySet:
+        """(meeting id, *TASK_ROW_FIELDS) rows for every task linked to `meetings`, read off the through table."""
+        links = cls.tasks.through.objects.filter(meeting_id__in=meetings).order_by("meeting_id", "projecttask_id")
+        return links.values_list("meeting_id", *task_row_fields("projecttask__"))
+
+    @staticmethod
+    def rows_to_dicts(meeting_rows: Iterable[tuple], linked_task_rows: Iterable[tuple]) -> list[dict]:
+        """
+        What `serialize().model_dump()` returns for each MEETING_ROW_FIELDS row,
+        with its tasks picked out of `linked_task_rows` by meeting id.
+        """
+        tasks_by_meeting: dict[int, list[dict]] = {}
+        for meeting_id, *task_row in linked_task_rows:
+            tasks_by_meeting.setdefault(meeting_id, []).append(ProjectTask.row_to_dict(task_row))
+
+        return [
+            {
+                "id": meeting_id,
+                "title": title,
+                "description": description,
+                "start_time": start_time.isoformat(),
+                "end_time": end_time.isoformat(),
+                "tasks": tasks_by_meeting.get(meeting_id, []),
+            }
+            for meeting_id, title, description, start_time, end_time in meeting_rows
+        ]
+
     @classmethod
     def create_meeting(cls, meeting_details: dict) -> "Meeting":
         meeting = cls(
+            owner_id=meeting_details.get("user_id"),
             title=meeting_details["title"],
             description=meeting_details["description"],
             start_time=datetime.fromisoformat(meeting_details["start_time"]),
@@ -54,20 +103,133 @@ class Meeting(models.Model):
         )
         meeting.save()
         if meeting_details["tasks"]:
-            tasks = ProjectTask.objects.filter(id__in=meeting_details["tasks"])
-            meeting.tasks.set(tasks)
+            meeting.add_tasks(meeting_details["tasks"])
         return meeting
 
+    @classmethod
+    def with_related(cls) -> QuerySet["Meeting"]:
+        """
+        Meetings with linked tasks (and each task's project) prefetched, so
+        serializing any number of them costs two queries in total.
+        """
+        return cls.objects.prefetch_related(
+            Prefetch("tasks", queryset=ProjectTask.objects.select_related("project").order_by("id")),
+        )
+
     @classmethod
     def get_meeting(cls, meeting_id: int) -> "Meeting":
-        return cls.objects.get(id=meeting_id)
-
-    def link_tasks(self, task_ids: list[int]) -> None:
-        try:
-            tasks = list(ProjectTask.objects.filter(id__in=task_ids))
-            self.tasks.clear()
-            self.tasks.add(*tasks)
-            self.save()
-        except Exception as e:
-            print(e)
-            raise e
+        return cls.with_related().get(id=meeting_id)
+
+    @classmethod
+    def get_meeting_data(cls, meeting_id: int) -> dict:
+        """`get_meeting(meeting_id).serialize().model_dump()` without building the model graph."""
+        meeting_row = cls.objects.filter(id=meeting_id).values_list(*MEETING_ROW_FIELDS).first()
+        if meeting_row is None:
+            raise cls.DoesNotExist("Meeting matching query does not exist.")
+        return cls.rows_to_dicts([meeting_row], cls.linked_task_rows([meeting_id]))[0]
+
+    @classmethod
+    async def aget_meeting_data(cls, meeting_id: int) -> dict:
+        """`get_meeting_data` on Django's async ORM API."""
+        meeting_row = await cls.objects.filter(id=meeting_id).values_list(*MEETING_ROW_FIELDS).afirst()
+        if meeting_row is None:
+            raise cls.DoesNotExist("Meeting matching query does not exist.")
+        task_rows = [row async for row in cls.linked_task_rows([meeting_id])]
+        return cls.rows_to_dicts([meeting_row], task_rows)[0]
+
+    @classmethod
+    def feed_queryset(cls, user_id: int, start: Optional[datetime] = None, end: Optional[datetime] = None) -> QuerySet["Meeting"]:
+        """
+        The user's meetings starting within [start, end), ordered by start time.
+        Either bound may be omitted.
+        """
+        meetings = cls.objects.filter(owner_id=user_id)
+        if start is not None:
+            meetings = meetings.filter(start_time__gte=start)
+        if end is not None:
+            meetings = meetings.filter(start_time__lt=end)
+        return meetings.order_by("start_time", "id")
+
+    @classmethod
+    def get_feed_for_user(cls, user_id: int, start: Optional[datetime] = None, end: Optional[datetime] = None) -> list[dict]:
+        meetings = cls.feed_queryset(user_id, start, end)
+        return cls.rows_to_dicts(meetings.values_list(*MEETING_ROW_FIELDS), cls.linked_task_rows(meetings.values("id")))
+
+    @classmethod
+    async def aget_feed_for_user(cls, user_id: int, start: Optional[datetime] = None, end: Optional[datetime] = None) -> list[dict]:
+        """`get_feed_for_user` on Django's async ORM API."""
+        meetings = cls.feed_queryset(user_id, start, end)
+        meeting_rows = [row async for row in meetings.values_list(*MEETING_ROW_FIELDS)]
+        task_rows = [row async for row in cls.linked_task_rows(meetings.values("id"))]
+        return cls.rows_to_dicts(meeting_rows, task_rows)
+
+    @classmethod
+    def iter_feed_for_user(
+        cls, user_id: int, chunk_size: int, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> Iterator[dict]:
+        meeting_rows = cls.feed_queryset(user_id, start, end).values_list(*MEETING_ROW_FIELDS)
+        for chunk in iter_chunks(meeting_rows.iterator(chunk_size=chunk_size), chunk_size):
+            yield from cls.rows_to_dicts(chunk, cls.linked_task_rows([row[0] for row in chunk]))
+
+    @classmethod
+    def get_calendar_for_user(cls, user_id: int, start: date, end: date, top: int) -> list[dict]:
+        """
+        The days of [start, end) that have tasks or meetings, each with its task
+        counts, top tasks (see ProjectTask.get_calendar_for_user) and meetings.
+        Meetings fall on the day they start in the user's timezone and are
+        listed without their linked tasks.
+        """
+        tz = Account.timezone_for(user_id)
+        meetings = cls.feed_queryset(user_id, datetime.combine(start, time.min, tzinfo=tz), datetime.combine(end, time.min, tzinfo=tz))
+
+        days = ProjectTask.get_calendar_for_user(user_id=user_id, start=start, end=end, top=top)
+        empty = {"task_count": 0, "completed_count": 0, "tasks": []}
+        meetings_by_day: dict[date, list[dict]] = {}
+        for meeting in cls.rows_to_dicts(meetings.values_list(*MEETING_ROW_FIELDS), []):
+            meeting_day = datetime.fromisoformat(meeting["start_time"]).astimezone(tz).date()
+            meetings_by_day.setdefault(meeting_day, []).append(meeting)
+
+        return [
+            {"date": day.isoformat(), **days.get(day, empty), "meetings": meetings_by_day.get(day, [])}
+            for day in sorted(days.keys() | meetings_by_day.keys())
+        ]
+
+    def linked_task_ids(self) -> set[int]:
+        return set(self.tasks.through.objects.filter(meeting_id=self.pk).values_list("projecttask_id", flat=True))
+
+    def link_tasks(self, task_ids: list[int]) -> tuple[set[int], set[int]]:
+        """
+        Make `task_ids` the meeting's linked tasks (unknown ids are ignored),
+        inserting and deleting only the links that differ from the current ones.
+        Returns the (added, removed) task ids.
+        """
+        with transaction.atomic():
+            wanted = set(ProjectTask.objects.filter(id__in=task_ids).values_list("id", flat=True))
+            linked = self.linked_task_ids()
+            added, removed = wanted - linked, linked - wanted
+            if removed:
+                self.tasks.remove(*removed)
+            if added:
+                self.tasks.add(*added)
+        return added, removed
+
+    def add_tasks(self, task_ids: list[int]) -> set[int]:
+        """Link `task_ids` (unknown ids are ignored). Returns the ids that were not linked before."""
+        with transaction.atomic():
+            existing = set(ProjectTask.objects.filter(id__in=task_ids).values_list("id", flat=True))
+            added = existing - set(
+                self.tasks.through.objects.filter(meeting_id=self.pk, projecttask_id__in=existing).values_list("projecttask_id", flat=True)
+            )
+            if added:
+                self.tasks.add(*added)
+        return added
+
+    def remove_tasks(self, task_ids: list[int]) -> set[int]:
+        """Unlink `task_ids`. Returns the ids that were linked before."""
+        with transaction.atomic():
+            removed = set(
+                self.tasks.through.objects.filter(meeting_id=self.pk, projecttask_id__in=task_ids).values_list("projecttask_id", flat=True)
+            )
+            if removed:
+                self.tasks.remove(*removed)
+        return removed
@@ -1,19 +1,59 @@
-from django.db import models
+from django.db import models, transaction
 from .meeting import Meeting
 from pydantic import BaseModel
 from datetime import datetime
+from typing import Optional
 
 
 class NoteSchema(BaseModel):
     meeting_id: int
     content: str
+    revision: int
     created_at: datetime
     updated_at: datetime
 
 
+# Columns for the values_list() fast path, in NoteSchema field order.
+NOTE_ROW_FIELDS = ("meeting_id", "content", "revision", "created_at", "updated_at")
+
+
+class NoteConflict(Exception):
+    """An edit was based on a revision of the note that is no longer current."""
+
+    def __init__(self, note: "Note"):
+        super().__init__(f"Note is at revision {note.revision}")
+        self.note = note
+
+
+def apply_text_operations(content: str, operations: list[dict]) -> str:
+    """
+    Apply insert/delete operations in order, each against the result of the
+    previous one. Positions count Unicode code points.
+
+    {"op": "insert", "pos": 3, "text": "abc"}
+    {"op": "delete", "pos": 3, "length": 2}
+    """
+    for operation in operations:
+        pos = operation["pos"]
+        if operation["op"] == "insert":
+            if pos > len(content):
+                raise ValueError(f"Insert position {pos} is past the end of the note ({len(content)})")
+            content = content[:pos] + operation["text"] + content[pos:]
+        elif operation["op"] == "delete":
+            end = pos + operation["length"]
+            if end > len(content):
+                raise ValueError(f"Delete range {pos}-{end} is past the end of the note ({len(content)})")
+            content = content[:pos] + content[end:]
+        else:
+            raise ValueError(f"Unknown operation {operation['op']!r}")
+    return content
+
+
 class Note(models.Model):
     meeting = models.OneToOneField(Meeting, on_delete=models.CASCADE)
     content = models.TextField()
+    # Incremented on every edit; clients send the revision they edited from.
+    revision = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -22,12 +62,19 @@ class Note(models.Model):
 
     def serialize(self) -> NoteSchema:
         return NoteSchema(
-            meeting_id=self.meeting.pk,
+            meeting_id=self.meeting_id,
             content=self.content,
+            revision=self.revision,
             created_at=self.created_at,
             updated_at=self.updated_at,
         )
 
+    @staticmethod
+    def row_to_dict(row: tuple) -> dict:
+        """What `serialize().model_dump()` returns, built directly from a NOTE_ROW_FIELDS row."""
+        meeting_id, content, revision, created_at, updated_at = row
+        return {"meeting_id": meeting_id, "content": content, "revision": revision, "created_at": created_at, "updated_at": updated_at}
+
     @classmethod
     def create_note(cls, note_details: NoteSchema) -> "Note":
         note = cls(
@@ -41,7 +88,41 @@ class Note(models.Model):
     def get_note(cls, meeting_id: int) -> "Note":
         return cls.objects.get_or_create(meeting_id=meeting_id)[0]
 
+    @classmethod
+    def get_note_data(cls, meeting_id: int) -> dict:
+        """`get_note(meeting_id).serialize().model_dump()`, reading a single row when the note exists."""
+        row = cls.objects.filter(meeting_id=meeting_id).values_list(*NOTE_ROW_FIELDS).first()
+        if row is None:
+            return cls.get_note(meeting_id).serialize().model_dump()
+        return cls.row_to_dict(row)
+
+    @classmethod
+    async def aget_note_data(cls, meeting_id: int) -> dict:
+        """`get_note_data` on Django's async ORM API."""
+        row = await cls.objects.filter(meeting_id=meeting_id).values_list(*NOTE_ROW_FIELDS).afirst()
+        if row is None:
+            note, _ = await cls.objects.aget_or_create(meeting_id=meeting_id)
+            return note.serialize().model_dump()
+        return cls.row_to_dict(row)
+
     def update_note(self, content: str) -> "Note":
         self.content = content
+        self.revision += 1
         self.save()
         return self
+
+    @classmethod
+    def edit(cls, meeting_id: int, base_revision: Optional[int], content: Optional[str] = None, operations: Optional[list[dict]] = None) -> "Note":
+        """
+        Replace the note's content, or patch it with `operations`, as of
+        `base_revision`. Raises NoteConflict if the note has moved on since
+        (a None base skips the check). The row is locked for the duration so
+        concurrent edits of one note apply one after the other.
+        """
+        with transaction.atomic():
+            note = cls.objects.select_for_update().get_or_create(meeting_id=meeting_id)[0]
+            if base_revision is not None and base_revision != note.revision:
+                raise NoteConflict(note)
+            if operations is not None:
+                content = apply_text_operations(note.content, operations)
+            return note.update_note(content)
@@ -0,0 +1,91 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from alarmclock import events, response_cache
+from .models import Meeting, Note
+from .models.meeting import meetings_bulk_updated
+
+
+@receiver([post_save, post_delete], sender=Meeting)
+def invalidate_meeting(sender, instance: Meeting, **kwargs):
+    response_cache.bump_meetings([instance.pk])
+
+
+@receiver(m2m_changed, sender=Meeting.tasks.through)
+def invalidate_meeting_links(sender, instance, action: str, reverse: bool, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        response_cache.bump_meetings([instance.pk])
+    elif action == "pre_clear":
+        response_cache.bump_meetings(instance.meetings.values_list("id", flat=True))
+    else:
+        response_cache.bump_meetings(pk_set)
+
+
+@receiver(meetings_bulk_updated, sender=Meeting)
+def invalidate_bulk_updated_meetings(sender, meeting_ids: list[int], **kwargs):
+    response_cache.bump_meetings(meeting_ids)
+
+
+@receiver([post_save, post_delete], sender=Note)
+def invalidate_note(sender, instance: Note, **kwargs):
+    response_cache.bump_meetings([instance.meeting_id])
+
+
+def publish_meetings(meeting_ids) -> None:
+    """Push the details of each meeting (as MeetingDetailsView returns them) to its viewers and owner."""
+    for meeting_id, owner_id in Meeting.objects.filter(id__in=meeting_ids).values_list("id", "owner_id"):
+        channels = [events.meeting_channel(meeting_id), owner_id and events.user_channel(owner_id)]
+        events.notify(channels, lambda meeting_id=meeting_id: meeting_saved_event(meeting_id))
+
+
+def meeting_saved_event(meeting_id: int):
+    try:
+        return {"type": "meeting.saved", "meeting": Meeting.get_meeting_data(meeting_id)}
+    except Meeting.DoesNotExist:
+        # Deleted before the event was built; the deletion is published separately.
+        return None
+
+
+@receiver(post_save, sender=Meeting)
+def publish_saved_meeting(sender, instance: Meeting, **kwargs):
+    if events.listening():
+        publish_meetings([instance.pk])
+
+
+@receiver(meetings_bulk_updated, sender=Meeting)
+def publish_bulk_updated_meetings(sender, meeting_ids: list[int], **kwargs):
+    if events.listening():
+        publish_meetings(meeting_ids)
+
+
+@receiver(post_delete, sender=Meeting)
+def publish_deleted_meeting(sender, instance: Meeting, **kwargs):
+    meeting_id = instance.pk
+    channels = [events.meeting_channel(meeting_id), instance.owner_id and events.user_channel(instance.owner_id)]
+    events.notify(channels, lambda: {"type": "meeting.deleted", "id": meeting_id})
+
+
+@receiver(m2m_changed, sender=Meeting.tasks.through)
+def publish_meeting_links(sender, instance, action: str, reverse: bool, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear") or not events.listening():
+        return
+    if not reverse:
+        publish_meetings([instance.pk])
+    elif action == "pre_clear":
+        publish_meetings(list(instance.meetings.values_list("id", flat=True)))
+    else:
+        publish_meetings(pk_set)
+
+
+@receiver(post_save, sender=Note)
+def publish_saved_note(sender, instance: Note, **kwargs):
+    meeting_id = instance.meeting_id
+    events.notify([events.meeting_channel(meeting_id)], lambda: {"type": "note.saved", "note": Note.get_note_data(meeting_id)})
+
+
+@receiver(post_delete, sender=Note)
+def publish_deleted_note(sender, instance: Note, **kwargs):
+    meeting_id = instance.meeting_id
+    events.notify([events.meeting_channel(meeting_id)], lambda: {"type": "note.deleted", "meeting_id": meeting_id})
@@ -1,3 +1,444 @@
-from django.test import TestCase
+import asyncio
+from datetime import date, datetime, timezone
+from unittest.mock import ANY
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from alarmclock import events
+from authenticator.models import Account
+from note_manager.models import Meeting, Note
+from task_manager.models.project import Project
+from task_manager.models.project_task import ProjectTask, TaskState
+
+
+def at(day: int, hour: int = 10) -> datetime:
+    return datetime(2026, 3, day, hour, tzinfo=timezone.utc)
+
+
+def make_meeting(owner: User, day: int, tasks: list[ProjectTask] = ()) -> Meeting:
+    meeting = Meeting.objects.create(owner=owner, title=f"Meeting {day}", description="", start_time=at(day), end_time=at(day, 11))
+    meeting.tasks.add(*tasks)
+    return meeting
+
+
+class MeetingFeedTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username="owner")
+        self.other_user = User.objects.create(username="other")
+        self.project = Project.objects.create(user=self.user, display_name="Project", description="")
+        self.tasks = [ProjectTask.objects.create(project=self.project, title=f"Task {i}", description="") for i in range(3)]
+
+    def test_feed_is_scoped_to_owner_and_window(self):
+        inside = make_meeting(self.user, day=10)
+        make_meeting(self.user, day=20)
+        make_meeting(self.other_user, day=10)
+
+        feed = Meeting.get_feed_for_user(user_id=self.user.pk, start=at(1), end=at(15))
+
+        self.assertEqual([m["id"] for m in feed], [inside.pk])
+
+    def test_feed_query_count_is_constant(self):
+        make_meeting(self.user, day=1, tasks=self.tasks[:1])
+        with self.assertNumQueries(2):
+            Meeting.get_feed_for_user(user_id=self.user.pk)
+
+        for day in range(2, 12):
+            make_meeting(self.user, day=day, tasks=self.tasks)
+        with self.assertNumQueries(2):
+            feed = Meeting.get_feed_for_user(user_id=self.user.pk)
+
+        self.assertEqual(len(feed), 11)
+        self.assertEqual(feed[-1]["tasks"][0]["project_name"], "Project")
+
+    def test_view_requires_a_user(self):
+        make_meeting(self.user, day=10)
+        url = reverse("user_meetings")
+
+        self.assertEqual(self.client.get(url).status_code, 400)
+
+        response = self.client.get(url, {"user_id": self.user.pk, "start": "2026-03-01T00:00:00Z"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 1)
+
+    def test_create_requires_an_owner(self):
+        url = reverse("new_meeting")
+        body = {"title": "Sync", "description": "", "start_time": "2026-03-10T09:00:00Z", "end_time": "2026-03-10T10:00:00Z", "tasks": []}
+
+        self.assertEqual(self.client.post(url, body, content_type="application/json").status_code, 400)
+        self.assertFalse(Meeting.objects.exists())
+
+        response = self.client.post(url, {**body, "user_id": self.user.pk}, content_type="application/json")
+        self.assertEqual(response.status_code, 201)
+        feed = Meeting.get_feed_for_user(user_id=self.user.pk)
+        self.assertEqual([m["id"] for m in feed], [response.json()["id"]])
+
+    def test_streamed_feed_matches_buffered(self):
+        make_meeting(self.user, day=10, tasks=self.tasks)
+        make_meeting(self.user, day=11)
+        url = reverse("user_meetings")
+
+        buffered = self.client.get(url, {"user_id": self.user.pk})
+        streamed = self.client.get(url, {"user_id": self.user.pk, "stream": "true"})
+
+        self.assertEqual(b"".join(streamed.streaming_content), buffered.content)
+
+
+class FastPathSerializationTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username="owner")
+        project = Project.objects.create(user=self.user, display_name="Project", description="")
+        tasks = [ProjectTask.objects.create(project=project, title=f"Task {i}", description="", is_daily_task=bool(i)) for i in range(2)]
+        self.meeting = make_meeting(self.user, day=5, tasks=tasks)
+        make_meeting(self.user, day=6)
+
+    def test_meeting_rows_match_model_serialization(self):
+        expected = [m.serialize().model_dump() for m in Meeting.with_related().order_by("start_time")]
+
+        self.assertEqual(Meeting.get_feed_for_user(user_id=self.user.pk), expected)
+        self.assertEqual(list(Meeting.iter_feed_for_user(user_id=self.user.pk, chunk_size=1)), expected)
+        self.assertEqual(Meeting.get_meeting_data(self.meeting.pk), expected[0])
+
+    def test_note_row_matches_model_serialization(self):
+        note = Note.objects.create(meeting=self.meeting, content="hello")
+
+        self.assertEqual(Note.get_note_data(self.meeting.pk), note.serialize().model_dump())
+
+
+class AsyncMeetingViewTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username="owner")
+        project = Project.objects.create(user=self.user, display_name="Project", description="")
+        tasks = [ProjectTask.objects.create(project=project, title=f"Task {i}", description="") for i in range(2)]
+        self.meeting = make_meeting(self.user, day=5, tasks=tasks)
+        Note.objects.create(meeting=self.meeting, content="hello")
+
+    async def test_async_views_match_sync_views(self):
+        cases = [
+            ("user_meetings", {}, {"user_id": self.user.pk}),
+            ("user_meetings", {}, {}),
+            ("meeting_details", {"meeting_id": self.meeting.pk}, {}),
+            ("meeting_note", {"meeting_id": self.meeting.pk}, {}),
+        ]
+        for name, kwargs, params in cases:
+            sync = await self.async_client.get(reverse(name, kwargs=kwargs), params)
+            asynchronous = await self.async_client.get(reverse(f"async_{name}", kwargs=kwargs), params)
+
+            self.assertEqual((asynchronous.status_code, asynchronous.content), (sync.status_code, sync.content), name)
+
+
+class MeetingCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(username="owner")
+        self.project = Project.objects.create(user=self.user, display_name="Project", description="")
+        self.task = ProjectTask.objects.create(project=self.project, title="Task", description="")
+        self.meeting = make_meeting(self.user, day=5)
+        self.url = reverse("meeting_details", kwargs={"meeting_id": self.meeting.pk})
+
+    def test_linking_and_renaming_invalidate_meeting_details(self):
+        self.client.get(self.url)
+        self.assertEqual(self.client.get(self.url)["X-Cache"], "HIT")
+
+        self.meeting.tasks.add(self.task)
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(len(response.json()["tasks"]), 1)
+
+        self.project.display_name = "Renamed"
+        self.project.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["tasks"][0]["project_name"], "Renamed")
+
+        self.task.meetings.clear()
+        self.assertEqual(self.client.get(self.url).json()["tasks"], [])
+
+    def test_note_edit_invalidates_note(self):
+        note_url = reverse("meeting_note", kwargs={"meeting_id": self.meeting.pk})
+        self.client.get(note_url)
+        Note.objects.filter(meeting=self.meeting).get().update_note("edited")
+
+        response = self.client.get(note_url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["content"], "edited")
+
+
+class ConditionalGetTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(username="owner")
+        self.meeting = make_meeting(self.user, day=5)
+        self.note = Note.objects.create(meeting=self.meeting, content="first")
+
+    def test_meeting_details_revalidate_without_queries(self):
+        url = reverse("meeting_details", kwargs={"meeting_id": self.meeting.pk})
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+        self.meeting.title = "Renamed"
+        self.meeting.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_meeting_details_tag_only_successes(self):
+        missing = self.client.get(reverse("meeting_details", kwargs={"meeting_id": self.meeting.pk + 100}))
+        self.assertEqual(missing.status_code, 400)
+        self.assertFalse(missing.has_header("ETag"))
+
+    @override_settings(RESPONSE_CACHE={**settings.RESPONSE_CACHE, "ALLOW_LOCAL": False})
+    def test_no_meeting_etag_without_a_shared_cache(self):
+        response = self.client.get(reverse("meeting_details", kwargs={"meeting_id": self.meeting.pk}))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("ETag"))
+
+    def test_note_revalidates_with_one_query(self):
+        url = reverse("meeting_note", kwargs={"meeting_id": self.meeting.pk})
+        first = self.client.get(url)
+        self.assertIn("Last-Modified", first)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+        self.note.update_note("second")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["content"], "second")
+
+
+class NotePatchTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username="owner")
+        self.meeting = make_meeting(self.user, day=5)
+        self.url = reverse("patch_note", kwargs={"meeting_id": self.meeting.pk})
+        Note.objects.create(meeting=self.meeting, content="Hello world")
+
+    def patch(self, base_revision: int, ops: list[dict]):
+        return self.client.post(self.url, {"base_revision": base_revision, "ops": ops}, content_type="application/json")
+
+    def test_operations_apply_in_order_and_bump_revision(self):
+        response = self.patch(0, [{"op": "delete", "pos": 5, "length": 6}, {"op": "insert", "pos": 5, "text": ", team"}])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["revision"], 1)
+        self.assertNotIn("content", response.json())
+        self.assertEqual(Note.objects.get(meeting=self.meeting).content, "Hello, team")
+
+    def test_stale_base_is_rejected(self):
+        self.patch(0, [{"op": "insert", "pos": 0, "text": "A: "}])
+
+        response = self.patch(0, [{"op": "insert", "pos": 0, "text": "B: "}])
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()["revision"], 1)
+        self.assertEqual(response.json()["content"], "A: Hello world")
+
+    def test_out_of_range_operation_is_rejected_without_saving(self):
+        response = self.patch(0, [{"op": "insert", "pos": 0, "text": "x"}, {"op": "delete", "pos": 10, "length": 5}])
+
+        self.assertEqual(response.status_code, 400)
+        note = Note.objects.get(meeting=self.meeting)
+        self.assertEqual((note.content, note.revision), ("Hello world", 0))
+
+    def test_full_edit_honours_base_revision(self):
+        url = reverse("edit_note", kwargs={"meeting_id": self.meeting.pk})
+
+        response = self.client.post(url, {"content": "Replaced", "base_revision": 0}, content_type="application/json")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["revision"], 1)
+
+        response = self.client.post(url, {"content": "Stale", "base_revision": 0}, content_type="application/json")
+        self.assertEqual(response.status_code, 409)
+
+
+class MeetingTaskLinkTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username="owner")
+        project = Project.objects.create(user=self.user, display_name="Project", description="")
+        self.tasks = [ProjectTask.objects.create(project=project, title=f"Task {i}", description="") for i in range(4)]
+        self.ids = [t.pk for t in self.tasks]
+        self.meeting = make_meeting(self.user, day=5, tasks=self.tasks[:2])
+
+    def test_link_tasks_only_touches_the_difference(self):
+        untouched_link = Meeting.tasks.through.objects.get(meeting=self.meeting, projecttask=self.tasks[1])
+
+        added, removed = self.meeting.link_tasks([self.ids[1], self.ids[2], 999999])
+
+        self.assertEqual((added, removed), ({self.ids[2]}, {self.ids[0]}))
+        self.assertEqual(self.meeting.linked_task_ids(), {self.ids[1], self.ids[2]})
+        # The surviving link row was neither deleted nor re-inserted.
+        self.assertTrue(Meeting.tasks.through.objects.filter(pk=untouched_link.pk).exists())
+
+    def test_unchanged_link_set_writes_nothing(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.meeting.link_tasks(self.ids[:2]), (set(), set()))
+        self.assertEqual([q["sql"].split()[0] for q in queries if "SAVEPOINT" not in q["sql"]], ["SELECT", "SELECT"])
+
+    def test_add_and_remove_endpoints_send_only_the_change(self):
+        add_url = reverse("meeting_tasks_add", kwargs={"meeting_id": self.meeting.pk})
+        remove_url = reverse("meeting_tasks_remove", kwargs={"meeting_id": self.meeting.pk})
+
+        response = self.client.post(add_url, {"task_ids": [self.ids[1], self.ids[3]]}, content_type="application/json")
+        self.assertEqual(response.json(), {"added": [self.ids[3]]})
+
+        response = self.client.post(remove_url, {"task_ids": [self.ids[0], self.ids[2]]}, content_type="application/json")
+        self.assertEqual(response.json(), {"removed": [self.ids[0]]})
+
+        self.assertEqual(self.meeting.linked_task_ids(), {self.ids[1], self.ids[3]})
+
+
+class CalendarTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username="owner")
+        self.project = Project.objects.create(user=self.user, display_name="Project", description="")
+        self.url = reverse("calendar")
+
+    def add_task(self, title: str, **fields) -> ProjectTask:
+        return ProjectTask.objects.create(project=self.project, title=title, description="", **fields)
+
+    def test_month_counts_top_tasks_and_meetings_per_day(self):
+        self.add_task("linked", calendar_linked_date=date(2026, 3, 10), deadline=date(2026, 4, 30))
+        for i in range(4):
+            self.add_task(f"due {i}", deadline=date(2026, 3, 10), priority=2 - min(i, 2), status=TaskState.COMPLETED if i == 0 else TaskState.TODO)
+        self.add_task("next month", deadline=date(2026, 4, 1))
+        make_meeting(self.user, day=10)
+        make_meeting(self.user, day=31, tasks=[])
+
+        with self.assertNumQueries(3):
+            days = Meeting.get_calendar_for_user(user_id=self.user.pk, start=date(2026, 3, 1), end=date(2026, 4, 1), top=2)
+
+        self.assertEqual([d["date"] for d in days], ["2026-03-10", "2026-03-31"])
+        tenth = days[0]
+        self.assertEqual((tenth["task_count"], tenth["completed_count"]), (5, 1))
+        self.assertEqual([t["title"] for t in tenth["tasks"]], ["due 2", "due 3"])
+        self.assertEqual([m["title"] for m in tenth["meetings"]], ["Meeting 10"])
+        self.assertEqual(days[1]["task_count"], 0)
+
+    def test_top_zero_returns_counts_only(self):
+        self.add_task("due", deadline=date(2026, 3, 10), status=TaskState.COMPLETED)
+        self.add_task("also due", deadline=date(2026, 3, 10))
+
+        response = self.client.get(self.url, {"user_id": self.user.pk, "date": "2026-03-10", "top": 0})
+
+        day = response.json()["days"][0]
+        self.assertEqual((day["date"], day["task_count"], day["completed_count"], day["tasks"]), ("2026-03-10", 2, 1, []))
+
+    def test_week_view_and_meeting_days_follow_user_timezone(self):
+        Account.objects.create(user=self.user, timezone="America/New_York")
+        # 02:00 UTC on Monday March 9th is still Sunday the 8th in New York.
+        Meeting.objects.create(owner=self.user, title="Late call", description="", start_time=at(9, hour=2), end_time=at(9, hour=3))
+
+        response = self.client.get(self.url, {"user_id": self.user.pk, "view": "week", "date": "2026-03-11"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.json()["start"], response.json()["end"]), ("2026-03-09", "2026-03-16"))
+        self.assertEqual(response.json()["days"], [])
+        self.assertEqual(self.client.get(self.url, {"user_id": self.user.pk, "view": "year"}).status_code, 400)
+
+
+class EventStreamTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username="owner")
+        self.project = Project.objects.create(user=self.user, display_name="Project", description="")
+        self.task = ProjectTask.objects.create(project=self.project, title="Agenda", description="")
+        start = datetime(2026, 3, 1, 10, tzinfo=timezone.utc)
+        self.meeting = Meeting.objects.create(owner=self.user, title="Standup", description="", start_time=start, end_time=start)
+        self.loop = asyncio.new_event_loop()
+        self.addCleanup(self.loop.close)
+
+    def subscribe(self, *channels: str):
+        async def subscribe():
+            return events.get_broker().subscribe(channels)
+
+        subscription = self.loop.run_until_complete(subscribe())
+        self.addCleanup(events.get_broker().unsubscribe, subscription)
+        return subscription
+
+    def received(self, subscription) -> list[dict]:
+        received = []
+        while (event := self.loop.run_until_complete(subscription.get(timeout=0.01))) is not None:
+            received.append(event)
+        return received
+
+    def test_changes_are_pushed_after_commit(self):
+        meeting_events = self.subscribe(events.meeting_channel(self.meeting.pk))
+        user_events = self.subscribe(events.user_channel(self.user.pk))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.meeting.add_tasks([self.task.pk])
+            Note.objects.create(meeting=self.meeting, content="Minutes")
+            self.assertEqual(self.received(meeting_events), [])
+
+        pushed = self.received(meeting_events)
+        self.assertEqual([e["type"] for e in pushed], ["meeting.saved", "note.saved"])
+        self.assertEqual([t["id"] for t in pushed[0]["meeting"]["tasks"]], [self.task.pk])
+        self.assertEqual(pushed[1]["note"]["content"], "Minutes")
+        self.assertEqual([e["type"] for e in self.received(user_events)], ["meeting.saved"])
+
+        # Task edits reach the owner and every meeting the task is linked to.
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.title = "Agenda v2"
+            self.task.save()
+        for subscription in (meeting_events, user_events):
+            self.assertEqual([e["tasks"][0]["title"] for e in self.received(subscription)], ["Agenda v2"])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            task_id = self.task.pk
+            self.task.delete()
+        self.assertEqual(self.received(user_events), [{"id": ANY, "type": "tasks.deleted", "ids": [task_id]}])
+
+    def test_other_users_changes_are_not_pushed(self):
+        other = User.objects.create(username="other")
+        other_events = self.subscribe(events.user_channel(other.pk))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.task.save()
+        self.assertEqual(self.received(other_events), [])
+
+    @override_settings(EVENTS={**settings.EVENTS, "MAX_QUEUED": 2})
+    def test_slow_subscribers_are_told_to_resync(self):
+        subscription = self.subscribe(events.user_channel(self.user.pk))
+        with self.captureOnCommitCallbacks(execute=True):
+            for i in range(5):
+                self.task.description = str(i)
+                self.task.save()
+        self.assertEqual(self.received(subscription), [events.RESYNC])
+
+    def test_stream_requires_asgi(self):
+        self.assertEqual(self.client.get(reverse("events"), {"user_id": self.user.pk}).status_code, 400)
+
+    async def test_stream_starts_with_ready_event(self):
+        response = await self.async_client.get(reverse("events"), {"user_id": self.user.pk, "meeting": self.meeting.pk})
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = aiter(response.streaming_content)
+        first = await anext(stream)
+        self.assertIn(b"event: ready\n", first)
+        self.assertIn(f"meeting:{self.meeting.pk}".encode(), first)
+        self.assertTrue(events.get_broker().has_subscribers())
+
+        # A client disconnecting cancels the pending read, which unsubscribes.
+        pending = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        pending.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await pending
+        self.assertFalse(events.get_broker().has_subscribers())
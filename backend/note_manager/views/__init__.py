@@ -1,6 +1,11 @@
 from .new_meeting import NewMeetingView
 from .meeting_note import MeetingNoteView
 from .edit_note import EditNoteView
+from .patch_note import PatchNoteView
 from .user_meetings import UserMeetingsView
 from .link_task import LinkTasksView
+from .meeting_tasks import MeetingTasksAddView, MeetingTasksRemoveView
 from .meeting_details import MeetingDetailsView
+from .async_meetings import AsyncUserMeetingsView, AsyncMeetingDetailsView, AsyncMeetingNoteView
+from .calendar import CalendarView
+from .event_stream import EventStreamView
@@ -0,0 +1,56 @@
+from django.views import View
+from pydantic import ValidationError
+from rest_framework import status
+
+from alarmclock.streaming import json_response
+from alarmclock.throttling import athrottled
+from note_manager.models import Meeting, Note
+from .user_meetings import MeetingFeedQuerySchema
+
+
+class AsyncUserMeetingsView(View):
+    """
+    UserMeetingsView on the async ORM, for serving under ASGI without holding a
+    thread per request.
+    """
+
+    async def get(self, request):
+        if throttled := await athrottled(request, "list"):
+            return throttled
+        try:
+            query = MeetingFeedQuerySchema.model_validate(request.GET.dict())
+        except ValidationError as e:
+            return json_response({"error": "Invalid query parameters", "details": e.errors()}, status=status.HTTP_400_BAD_REQUEST)
+
+        user = await request.auser()
+        user_id = query.user_id or user.pk
+        if user_id is None:
+            return json_response({"error": "user_id is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            meetings = await Meeting.aget_feed_for_user(user_id=user_id, start=query.start, end=query.end)
+            return json_response(meetings)
+        except Exception as e:
+            return json_response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class AsyncMeetingDetailsView(View):
+
+    async def get(self, request, meeting_id: int):
+        if throttled := await athrottled(request):
+            return throttled
+        try:
+            return json_response(await Meeting.aget_meeting_data(meeting_id=meeting_id))
+        except Exception as e:
+            return json_response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class AsyncMeetingNoteView(View):
+
+    async def get(self, request, meeting_id: int):
+        if throttled := await athrottled(request):
+            return throttled
+        try:
+            return json_response(await Note.aget_note_data(meeting_id=meeting_id))
+        except Exception as e:
+            return json_response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,54 @@
+from calendar import monthrange
+import datetime
+from datetime import date, timedelta
+from typing import Literal, Optional
+
+from django.utils import timezone
+from pydantic import BaseModel, Field, ValidationError
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from note_manager.models import Meeting
+
+
+class CalendarQuerySchema(BaseModel):
+    user_id: Optional[int] = None
+    view: Literal["month", "week"] = "month"
+    # Any day of the requested month or week; today by default.
+    date: Optional[datetime.date] = None
+    top: int = Field(3, ge=0, le=20)
+
+    def window(self) -> tuple[date, date]:
+        day = self.date or timezone.localdate()
+        if self.view == "week":
+            start = day - timedelta(days=day.weekday())
+            return start, start + timedelta(days=7)
+        start = day.replace(day=1)
+        return start, start + timedelta(days=monthrange(day.year, day.month)[1])
+
+
+class CalendarView(APIView):
+    """
+    Per-day task counts, top tasks and meetings for a month or week, so the
+    calendar renders from one request instead of bucketing every task itself.
+    """
+
+    throttle_scope = "list"
+
+    def get(self, request) -> Response:
+        try:
+            query = CalendarQuerySchema.model_validate(request.query_params.dict())
+        except ValidationError as e:
+            return Response({"error": "Invalid query parameters", "details": e.errors()}, status=status.HTTP_400_BAD_REQUEST)
+
+        user_id = query.user_id or request.user.pk
+        if user_id is None:
+            return Response({"error": "user_id is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        start, end = query.window()
+        try:
+            days = Meeting.get_calendar_for_user(user_id=user_id, start=start, end=end, top=query.top)
+            return Response({"start": start, "end": end, "days": days}, status=status.HTTP_200_OK)
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -1,22 +1,33 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from note_manager.models.notes import Note, NoteSchema
+from note_manager.models.notes import Note, NoteConflict, NoteSchema
 from pydantic import BaseModel
+from typing import Optional
 
 
 class EditNoteSchema(BaseModel):
     content: str
+    base_revision: Optional[int] = None
+
+
+def conflict_response(conflict: NoteConflict) -> Response:
+    # The current text is sent back so the client can rebase its pending edits.
+    return Response(
+        {"error": str(conflict), "revision": conflict.note.revision, "content": conflict.note.content},
+        status=status.HTTP_409_CONFLICT,
+    )
 
 
 class EditNoteView(APIView):
 
     def post(self, request, meeting_id: int) -> Response:
         try:
-            meeting_note = Note.get_note(meeting_id=meeting_id)
             edited_note = EditNoteSchema.model_validate(request.data)
-            meeting_note.update_note(edited_note.content)
-            return Response(meeting_note.serialize(), status=status.HTTP_200_OK)
+            meeting_note = Note.edit(meeting_id=meeting_id, base_revision=edited_note.base_revision, content=edited_note.content)
+            return Response(meeting_note.serialize().model_dump(), status=status.HTTP_200_OK)
+        except NoteConflict as conflict:
+            return conflict_response(conflict)
         except Exception as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         return Response(status=status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,74 @@
+from typing import AsyncIterator, Optional
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from django.views import View
+from pydantic import BaseModel, Field, ValidationError
+from rest_framework import status
+
+from alarmclock import events
+from alarmclock.streaming import json_response, render_json
+
+# How long browsers wait before reconnecting a dropped stream.
+RECONNECT_MS = 3000
+
+
+class EventStreamQuerySchema(BaseModel):
+    user_id: Optional[int] = None
+    # Meetings whose details, task links and note to follow.
+    meeting: list[int] = Field(default_factory=list, max_length=50)
+
+
+def format_event(event: dict) -> bytes:
+    lines = b"event: " + event["type"].encode() + b"\ndata: " + render_json(event) + b"\n\n"
+    return b"id: %d\n" % event["id"] + lines if "id" in event else lines
+
+
+async def iter_events(channels: list[str]) -> AsyncIterator[bytes]:
+    broker = events.get_broker()
+    subscription = broker.subscribe(channels)
+    try:
+        # Anything written before this point is not pushed: on "ready" clients
+        # catch up through the changes endpoint, then rely on the stream.
+        yield b"retry: %d\n" % RECONNECT_MS + format_event({"type": "ready", "channels": sorted(channels)})
+        while True:
+            event = await subscription.get(timeout=settings.EVENTS["KEEPALIVE_SECONDS"])
+            # A comment line keeps proxies from closing an idle stream.
+            yield b": keepalive\n\n" if event is None else format_event(event)
+    finally:
+        broker.unsubscribe(subscription)
+
+
+class EventStreamView(View):
+    """
+    Server-sent events carrying the user's task changes and, for each `meeting`
+    given, that meeting's details, task links and note as they change. Replaces
+    polling the task, meeting and note endpoints.
+
+    The stream holds its connection open indefinitely, so it is only served by
+    the ASGI application (alarmclock/asgi.py).
+    """
+
+    async def get(self, request):
+        if not isinstance(request, ASGIRequest):
+            return json_response({"error": "Event streams are only served over ASGI"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            query = EventStreamQuerySchema.model_validate({**request.GET.dict(), "meeting": request.GET.getlist("meeting")})
+        except ValidationError as e:
+            return json_response({"error": "Invalid query parameters", "details": e.errors()}, status=status.HTTP_400_BAD_REQUEST)
+
+        user = await request.auser()
+        user_id = query.user_id or user.pk
+        channels = [events.meeting_channel(meeting_id) for meeting_id in query.meeting]
+        if user_id is not None:
+            channels.append(events.user_channel(user_id))
+        if not channels:
+            return json_response({"error": "user_id or meeting is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        response = StreamingHttpResponse(iter_events(channels), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        # Stops nginx from buffering the stream.
+        response["X-Accel-Buffering"] = "no"
+        return response
@@ -2,17 +2,29 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from pydantic import BaseModel
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
 
-from note_manager.models import Meeting 
+from alarmclock import response_cache
+from note_manager.models import Meeting
 
 
+def meeting_etag(request, meeting_id: int) -> str:
+    # The meeting version is bumped by every write that changes this payload
+    # (see note_manager.signals), so no database query is needed here.
+    return f"meeting-{meeting_id}-{response_cache.get_version('meeting', meeting_id)}"
 
+
+@method_decorator(cache_control(private=True, no_cache=True), name="get")
+@method_decorator(response_cache.etag(meeting_etag), name="get")
 class MeetingDetailsView(APIView):
 
     def get(self, request , meeting_id: int) -> Response:
 
         try:
-            meeting = Meeting.get_meeting(meeting_id=meeting_id)
-            return Response(meeting.serialize().model_dump(), status=status.HTTP_200_OK)
+            meeting, hit = response_cache.cached(
+                "meeting_details", "meeting", meeting_id, build=lambda: Meeting.get_meeting_data(meeting_id=meeting_id)
+            )
+            return Response(meeting, status=status.HTTP_200_OK, headers=response_cache.cache_header(hit))
         except Exception as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
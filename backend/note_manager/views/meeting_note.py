@@ -1,14 +1,35 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+from datetime import datetime
+from typing import Optional
+from alarmclock import response_cache
 from note_manager.models.notes import Note, NoteSchema
 
 
+def note_updated_at(request, meeting_id: int) -> Optional[datetime]:
+    # Memoized on the request: both validators below are derived from it.
+    if not hasattr(request, "note_updated_at"):
+        request.note_updated_at = Note.objects.filter(meeting_id=meeting_id).values_list("updated_at", flat=True).first()
+    return request.note_updated_at
+
+
+def note_etag(request, meeting_id: int) -> Optional[str]:
+    # Full-precision timestamp: Last-Modified alone cannot tell apart two saves within a second.
+    updated_at = note_updated_at(request, meeting_id)
+    return f"note-{meeting_id}-{updated_at.timestamp()}" if updated_at else None
+
+
+@method_decorator(cache_control(private=True, no_cache=True), name="get")
+@method_decorator(condition(etag_func=note_etag, last_modified_func=note_updated_at), name="get")
 class MeetingNoteView(APIView):
 
     def get(self, request, meeting_id: int) -> Response:
         try:
-            meeting_note = Note.get_note(meeting_id=meeting_id)
-            return Response(meeting_note.serialize().model_dump(), status=status.HTTP_200_OK)
+            note, hit = response_cache.cached("meeting_note", "meeting", meeting_id, build=lambda: Note.get_note_data(meeting_id=meeting_id))
+            return Response(note, status=status.HTTP_200_OK, headers=response_cache.cache_header(hit))
         except Exception as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,36 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from note_manager.models.meeting import Meeting
+
+from .link_task import LinkTaskSchema
+
+
+class MeetingTasksAddView(APIView):
+    """
+    Link the given tasks to a meeting, leaving its other links untouched.
+    """
+
+    def post(self, request, meeting_id: int) -> Response:
+        try:
+            meeting = Meeting.objects.get(id=meeting_id)
+            task_ids = LinkTaskSchema.model_validate(request.data)
+            added = meeting.add_tasks(task_ids.task_ids)
+            return Response({"added": sorted(added)}, status=status.HTTP_200_OK)
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class MeetingTasksRemoveView(APIView):
+    """
+    Unlink the given tasks from a meeting, leaving its other links untouched.
+    """
+
+    def post(self, request, meeting_id: int) -> Response:
+        try:
+            meeting = Meeting.objects.get(id=meeting_id)
+            task_ids = LinkTaskSchema.model_validate(request.data)
+            removed = meeting.remove_tasks(task_ids.task_ids)
+            return Response({"removed": sorted(removed)}, status=status.HTTP_200_OK)
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -3,7 +3,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from note_manager.models import Meeting
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
 
 
 class NewMeetingSchema(BaseModel):
@@ -13,6 +13,7 @@ class NewMeetingSchema(BaseModel):
     start_time: str
     end_time: str
     tasks: List[int]
+    user_id: Optional[int] = None
 
 
 class NewMeetingView(APIView):
@@ -22,6 +23,11 @@ class NewMeetingView(APIView):
         try:
             print(request.data)
             meeting_details = NewMeetingSchema.model_validate(request.data)
+            if meeting_details.user_id is None:
+                meeting_details.user_id = request.user.pk
+            if meeting_details.user_id is None:
+                # The feed, calendar, search and sync only ever show a meeting to its owner.
+                return Response({"error": "user_id is required"}, status=status.HTTP_400_BAD_REQUEST)
             print("HERE")
             meeting = Meeting.create_meeting(meeting_details.model_dump())
             print("HERE 2")
@@ -0,0 +1,47 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from note_manager.models.notes import Note, NoteConflict
+from pydantic import BaseModel, Field, ValidationError
+from typing import Literal
+
+from .edit_note import conflict_response
+
+
+class NoteOperationSchema(BaseModel):
+    op: Literal["insert", "delete"]
+    pos: int = Field(..., ge=0)
+    text: str = ""
+    length: int = Field(0, ge=0)
+
+
+class PatchNoteSchema(BaseModel):
+    base_revision: int = Field(..., ge=0)
+    ops: list[NoteOperationSchema] = Field(..., min_length=1)
+
+
+class PatchNoteView(APIView):
+    """
+    Apply insert/delete operations to a meeting note against the revision the
+    client last saw. Only the operations travel up and only the new revision
+    comes back; a stale base gets a 409 with the current text.
+    """
+
+    def post(self, request, meeting_id: int) -> Response:
+        try:
+            patch = PatchNoteSchema.model_validate(request.data)
+        except ValidationError as e:
+            return Response({"error": "Invalid request data", "details": e.errors()}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            note = Note.edit(
+                meeting_id=meeting_id,
+                base_revision=patch.base_revision,
+                operations=[operation.model_dump() for operation in patch.ops],
+            )
+        except NoteConflict as conflict:
+            return conflict_response(conflict)
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({"meeting_id": note.meeting_id, "revision": note.revision, "updated_at": note.updated_at}, status=status.HTTP_200_OK)
@@ -1,16 +1,39 @@
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from pydantic import BaseModel, ValidationError
+from typing import Optional
+from datetime import datetime
+from alarmclock.streaming import StreamingJSONResponse, chunk_size, wants_streaming
 from note_manager.models import Meeting
 from note_manager.models.meeting import MeetingSchema
 
 
+class MeetingFeedQuerySchema(BaseModel):
+    user_id: Optional[int] = None
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+
+
 class UserMeetingsView(APIView):
+    throttle_scope = "list"
 
     def get(self, request) -> Response:
+        try:
+            query = MeetingFeedQuerySchema.model_validate(request.query_params.dict())
+        except ValidationError as e:
+            return Response({"error": "Invalid query parameters", "details": e.errors()}, status=status.HTTP_400_BAD_REQUEST)
+
+        user_id = query.user_id or request.user.pk
+        if user_id is None:
+            return Response({"error": "user_id is required"}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            meetings = Meeting.objects.all().order_by('start_time')
-            return Response([meeting.serialize().model_dump() for meeting in meetings], status=status.HTTP_201_CREATED)
+            if wants_streaming(request):
+                rows = Meeting.iter_feed_for_user(user_id=user_id, chunk_size=chunk_size(), start=query.start, end=query.end)
+                return StreamingJSONResponse(rows)
+
+            meetings = Meeting.get_feed_for_user(user_id=user_id, start=query.start, end=query.end)
+            return Response(meetings, status=status.HTTP_200_OK)
         except Exception as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,11 @@
+from django.db import transaction
+
+from jobs.registry import job
+from .models import SearchEntry
+
+
+@job("search.rebuild_index")
+def rebuild_index() -> dict:
+    with transaction.atomic():
+        SearchEntry.rebuild()
+    return {"entries": SearchEntry.objects.count()}
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from search.models import SearchEntry
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index from all tasks, meetings and notes."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            SearchEntry.rebuild()
+        self.stdout.write(f"Indexed {SearchEntry.objects.count()} entries")
@@ -0,0 +1,165 @@
+# Generated by Django 4.2 on 2026-10-18 18:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+POSTGRESQL_INDEX = [
+    """
+    ALTER TABLE search_searchentry ADD COLUMN document tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(body, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX search_searchentry_document_idx ON search_searchentry USING GIN (document)",
+]
+
+# External-content FTS5 table: it stores only the index and reads the text back
+# from search_searchentry, which the triggers keep it in sync with. Note that
+# SQLite rebuilds a table on most ALTERs, which drops these triggers; any later
+# migration touching search_searchentry has to recreate them.
+SQLITE_INDEX = [
+    """
+    CREATE VIRTUAL TABLE search_searchentry_fts USING fts5(
+        title, body, content='search_searchentry', content_rowid='id', tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER search_searchentry_fts_insert AFTER INSERT ON search_searchentry BEGIN
+        INSERT INTO search_searchentry_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER search_searchentry_fts_delete AFTER DELETE ON search_searchentry BEGIN
+        INSERT INTO search_searchentry_fts(search_searchentry_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER search_searchentry_fts_update AFTER UPDATE ON search_searchentry BEGIN
+        INSERT INTO search_searchentry_fts(search_searchentry_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO search_searchentry_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+]
+
+SQLITE_DROP_INDEX = [
+    "DROP TRIGGER search_searchentry_fts_update",
+    "DROP TRIGGER search_searchentry_fts_delete",
+    "DROP TRIGGER search_searchentry_fts_insert",
+    "DROP TABLE search_searchentry_fts",
+]
+
+
+def create_fulltext_index(apps, schema_editor):
+    statements = {"postgresql": POSTGRESQL_INDEX, "sqlite": SQLITE_INDEX}.get(
+        schema_editor.connection.vendor, []
+    )
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def drop_fulltext_index(apps, schema_editor):
+    # The PostgreSQL column and index go away with the table itself.
+    if schema_editor.connection.vendor == "sqlite":
+        for statement in SQLITE_DROP_INDEX:
+            schema_editor.execute(statement)
+
+
+def index_existing_rows(apps, schema_editor):
+    SearchEntry = apps.get_model("search", "SearchEntry")
+    ProjectTask = apps.get_model("task_manager", "ProjectTask")
+    Meeting = apps.get_model("note_manager", "Meeting")
+    Note = apps.get_model("note_manager", "Note")
+
+    entries = [
+        SearchEntry(
+            kind="task",
+            object_id=task_id,
+            user_id=user_id,
+            title=title,
+            body=description,
+        )
+        for task_id, user_id, title, description in ProjectTask.objects.values_list(
+            "id", "project__user_id", "title", "description"
+        )
+    ]
+    entries += [
+        SearchEntry(
+            kind="meeting",
+            object_id=meeting_id,
+            user_id=owner_id,
+            title=title,
+            body=description,
+        )
+        for meeting_id, owner_id, title, description in Meeting.objects.filter(
+            owner__isnull=False
+        ).values_list("id", "owner_id", "title", "description")
+    ]
+    entries += [
+        SearchEntry(
+            kind="note",
+            object_id=meeting_id,
+            user_id=owner_id,
+            title=title,
+            body=content,
+        )
+        for meeting_id, owner_id, title, content in Note.objects.filter(
+            meeting__owner__isnull=False
+        ).values_list("meeting_id", "meeting__owner_id", "meeting__title", "content")
+    ]
+    SearchEntry.objects.bulk_create(entries, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("task_manager", "0003_project_task_listing_indexes"),
+        ("note_manager", "0003_note_revision"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("task", "task"),
+                            ("meeting", "meeting"),
+                            ("note", "note"),
+                        ],
+                        max_length=16,
+                    ),
+                ),
+                ("object_id", models.BigIntegerField()),
+                ("title", models.TextField(default="")),
+                ("body", models.TextField(default="")),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_entries",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("kind", "object_id")},
+            },
+        ),
+        migrations.RunPython(create_fulltext_index, drop_fulltext_index),
+        migrations.RunPython(index_existing_rows, migrations.RunPython.noop),
+    ]
@@ -0,0 +1 @@
+from .search_entry import SearchEntry
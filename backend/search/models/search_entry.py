@@ -0,0 +1,154 @@
+import re
+from typing import Iterable, Optional
+
+from django.contrib.auth.models import User
+from django.db import connection, models
+from pydantic import BaseModel
+
+from note_manager.models import Meeting, Note
+from task_manager.models.project_task import ProjectTask
+
+TABLE = "search_searchentry"
+FTS_TABLE = "search_searchentry_fts"
+
+
+class SearchResultSchema(BaseModel):
+    kind: str
+    id: int
+    title: str
+    snippet: str
+    score: float
+
+
+class SearchEntry(models.Model):
+    """
+    One searchable document per task, meeting and meeting note, owned by the
+    user whose results it can appear in.
+
+    The inverted index lives next to this table and is maintained by the
+    database itself (see migrations/0001_initial.py): a generated, GIN-indexed
+    tsvector column on PostgreSQL and an FTS5 external-content table kept in
+    sync by triggers on SQLite. Keeping these rows current is therefore all
+    that is needed to keep the index current.
+    """
+
+    TASK = "task"
+    MEETING = "meeting"
+    NOTE = "note"
+    KIND_CHOICES = ((TASK, TASK), (MEETING, MEETING), (NOTE, NOTE))
+
+    kind = models.CharField(max_length=16, choices=KIND_CHOICES)
+    # Task id, meeting id, or for notes the id of their meeting.
+    object_id = models.BigIntegerField()
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="search_entries")
+    title = models.TextField(default="")
+    body = models.TextField(default="")
+
+    class Meta:
+        unique_together = ("kind", "object_id")
+
+    @classmethod
+    def upsert(cls, entries: Iterable["SearchEntry"]) -> None:
+        cls.objects.bulk_create(
+            list(entries),
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=["kind", "object_id"],
+            update_fields=["user", "title", "body"],
+        )
+
+    @classmethod
+    def remove(cls, kind: str, object_ids: Iterable[int]) -> None:
+        cls.objects.filter(kind=kind, object_id__in=list(object_ids)).delete()
+
+    @classmethod
+    def index_tasks(cls, tasks: models.QuerySet) -> None:
+        rows = tasks.values_list("id", "project__user_id", "title", "description")
+        cls.upsert(cls(kind=cls.TASK, object_id=task_id, user_id=user_id, title=title, body=description) for task_id, user_id, title, description in rows)
+
+    @classmethod
+    def index_meetings(cls, meetings: models.QuerySet) -> None:
+        """Index meetings and their notes, dropping entries of meetings without an owner."""
+        cls.remove(cls.MEETING, meetings.filter(owner__isnull=True).values_list("id", flat=True))
+        cls.remove(cls.NOTE, meetings.filter(owner__isnull=True).values_list("id", flat=True))
+
+        owned = meetings.filter(owner__isnull=False)
+        rows = owned.values_list("id", "owner_id", "title", "description")
+        cls.upsert(cls(kind=cls.MEETING, object_id=meeting_id, user_id=owner_id, title=title, body=description) for meeting_id, owner_id, title, description in rows)
+        cls.index_notes(Note.objects.filter(meeting__in=owned))
+
+    @classmethod
+    def index_notes(cls, notes: models.QuerySet) -> None:
+        rows = notes.filter(meeting__owner__isnull=False).values_list("meeting_id", "meeting__owner_id", "meeting__title", "content")
+        cls.upsert(cls(kind=cls.NOTE, object_id=meeting_id, user_id=owner_id, title=title, body=content) for meeting_id, owner_id, title, content in rows)
+
+    @classmethod
+    def rebuild(cls) -> None:
+        cls.objects.all().delete()
+        cls.index_tasks(ProjectTask.objects.all())
+        cls.index_meetings(Meeting.objects.all())
+
+    @classmethod
+    def search(cls, user_id: int, query: str, limit: int, offset: int = 0) -> list[SearchResultSchema]:
+        """The user's entries matching `query`, best match first."""
+        if connection.vendor == "postgresql":
+            rows = cls._search_postgresql(user_id, query, limit, offset)
+        elif connection.vendor == "sqlite":
+            rows = cls._search_sqlite(user_id, query, limit, offset)
+        else:
+            rows = cls._search_fallback(user_id, query, limit, offset)
+        return [SearchResultSchema(kind=kind, id=object_id, title=title, snippet=snippet or "", score=score) for kind, object_id, title, snippet, score in rows]
+
+    @staticmethod
+    def _search_postgresql(user_id: int, query: str, limit: int, offset: int) -> list[tuple]:
+        # Headlines are only computed for the page, after ranking and limiting.
+        sql = f"""
+            SELECT kind, object_id, title, ts_headline('english', body, q, 'MaxWords=20, MinWords=5'), score
+            FROM (
+                SELECT kind, object_id, title, body, q, ts_rank(document, q) AS score
+                FROM {TABLE}, websearch_to_tsquery('english', %s) AS q
+                WHERE user_id = %s AND document @@ q
+                ORDER BY score DESC, id
+                LIMIT %s OFFSET %s
+            ) AS page
+            ORDER BY score DESC
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [query, user_id, limit, offset])
+            return cursor.fetchall()
+
+    @staticmethod
+    def _search_sqlite(user_id: int, query: str, limit: int, offset: int) -> list[tuple]:
+        match = fts5_match_expression(query)
+        if match is None:
+            return []
+        # bm25() is lower-is-better; titles weigh ten times the body.
+        sql = f"""
+            SELECT e.kind, e.object_id, e.title, snippet({FTS_TABLE}, 1, '[', ']', '...', 12), -bm25({FTS_TABLE}, 10.0, 1.0) AS score
+            FROM {FTS_TABLE} JOIN {TABLE} AS e ON e.id = {FTS_TABLE}.rowid
+            WHERE {FTS_TABLE} MATCH %s AND e.user_id = %s
+            ORDER BY score DESC, e.id
+            LIMIT %s OFFSET %s
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [match, user_id, limit, offset])
+            return cursor.fetchall()
+
+    @classmethod
+    def _search_fallback(cls, user_id: int, query: str, limit: int, offset: int) -> list[tuple]:
+        entries = cls.objects.filter(user_id=user_id)
+        for term in query.split():
+            entries = entries.filter(models.Q(title__icontains=term) | models.Q(body__icontains=term))
+        return [(kind, object_id, title, body[:120], 0.0) for kind, object_id, title, body in entries.order_by("-id").values_list("kind", "object_id", "title", "body")[offset : offset + limit]]
+
+
+def fts5_match_expression(query: str) -> Optional[str]:
+    """
+    Turn free text into an FTS5 query: every word must match, the last one as a
+    prefix so results show up while typing. Words are quoted so FTS5 operators
+    in user input are taken literally.
+    """
+    words = re.findall(r"\w+", query)
+    if not words:
+        return None
+    return " ".join(f'"{word}"' for word in words) + "*"
@@ -0,0 +1,55 @@
+from typing import Optional
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from note_manager.models import Meeting, Note
+from note_manager.models.meeting import meetings_bulk_updated
+from task_manager.models.project_task import ProjectTask, tasks_bulk_updated
+from .models import SearchEntry
+
+# Task columns that end up in a search entry.
+INDEXED_TASK_FIELDS = {"title", "description", "project"}
+
+
+@receiver(post_save, sender=ProjectTask)
+def index_task(sender, instance: ProjectTask, **kwargs):
+    SearchEntry.index_tasks(ProjectTask.objects.filter(pk=instance.pk))
+
+
+@receiver(tasks_bulk_updated, sender=ProjectTask)
+def index_bulk_updated_tasks(sender, task_ids: list[int], fields: Optional[list[str]] = None, **kwargs):
+    if fields is not None and not INDEXED_TASK_FIELDS.intersection(fields):
+        return
+    SearchEntry.index_tasks(ProjectTask.objects.filter(id__in=task_ids))
+
+
+@receiver(post_delete, sender=ProjectTask)
+def unindex_task(sender, instance: ProjectTask, **kwargs):
+    SearchEntry.remove(SearchEntry.TASK, [instance.pk])
+
+
+@receiver(post_save, sender=Meeting)
+def index_meeting(sender, instance: Meeting, **kwargs):
+    SearchEntry.index_meetings(Meeting.objects.filter(pk=instance.pk))
+
+
+@receiver(meetings_bulk_updated, sender=Meeting)
+def index_bulk_updated_meetings(sender, meeting_ids: list[int], **kwargs):
+    SearchEntry.index_meetings(Meeting.objects.filter(id__in=meeting_ids))
+
+
+@receiver(post_delete, sender=Meeting)
+def unindex_meeting(sender, instance: Meeting, **kwargs):
+    SearchEntry.remove(SearchEntry.MEETING, [instance.pk])
+    SearchEntry.remove(SearchEntry.NOTE, [instance.pk])
+
+
+@receiver(post_save, sender=Note)
+def index_note(sender, instance: Note, **kwargs):
+    SearchEntry.index_notes(Note.objects.filter(pk=instance.pk))
+
+
+@receiver(post_delete, sender=Note)
+def unindex_note(sender, instance: Note, **kwargs):
+    SearchEntry.remove(SearchEntry.NOTE, [instance.meeting_id])
@@ -0,0 +1,71 @@
+from datetime import datetime, timezone
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+
+from note_manager.models import Meeting, Note
+from search.models import SearchEntry
+from search.models.search_entry import fts5_match_expression
+from task_manager.models.project import Project
+from task_manager.models.project_task import ProjectTask
+
+
+class SearchTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username="owner")
+        self.other_user = User.objects.create(username="other")
+        self.project = Project.objects.create(user=self.user, display_name="Project", description="")
+        start = datetime(2026, 3, 1, 10, tzinfo=timezone.utc)
+        self.meeting = Meeting.objects.create(owner=self.user, title="Quarterly planning", description="Budget review", start_time=start, end_time=start)
+
+    def search(self, query: str, user: User = None) -> list[tuple[str, int]]:
+        results = SearchEntry.search(user_id=(user or self.user).pk, query=query, limit=20)
+        return [(r.kind, r.id) for r in results]
+
+    def test_entries_follow_saves_and_deletes(self):
+        task = ProjectTask.objects.create(project=self.project, title="Renew passport", description="Bring photos")
+        self.assertEqual(self.search("passport"), [("task", task.pk)])
+
+        task.title = "Renew licence"
+        task.save()
+        self.assertEqual(self.search("passport"), [])
+        self.assertEqual(self.search("licence"), [("task", task.pk)])
+
+        task.delete()
+        self.assertEqual(self.search("licence"), [])
+
+    def test_notes_and_meetings_are_indexed_per_owner(self):
+        Note.objects.create(meeting=self.meeting, content="Agreed to hire two engineers")
+
+        self.assertEqual(self.search("engineers"), [("note", self.meeting.pk)])
+        self.assertEqual(self.search("budget"), [("meeting", self.meeting.pk)])
+        self.assertEqual(self.search("engineers", user=self.other_user), [])
+
+    def test_title_matches_rank_first_and_prefixes_match(self):
+        in_body = ProjectTask.objects.create(project=self.project, title="Misc", description="call the dentist")
+        in_title = ProjectTask.objects.create(project=self.project, title="Dentist appointment", description="")
+
+        self.assertEqual(self.search("dentist"), [("task", in_title.pk), ("task", in_body.pk)])
+        self.assertEqual(self.search("denti"), [("task", in_title.pk), ("task", in_body.pk)])
+
+    def test_bulk_upserted_tasks_are_indexed(self):
+        ProjectTask.bulk_upsert(project=self.project, items=[{"title": "Imported invoice", "description": ""}])
+        self.assertEqual(len(self.search("invoice")), 1)
+
+    def test_view_paginates(self):
+        for i in range(3):
+            ProjectTask.objects.create(project=self.project, title=f"Report {i}", description="")
+        url = reverse("search")
+
+        first = self.client.get(url, {"q": "report", "user_id": self.user.pk, "page_size": 2}).json()
+        second = self.client.get(url, {"q": "report", "user_id": self.user.pk, "page_size": 2, "page": 2}).json()
+
+        self.assertEqual((len(first["results"]), first["has_next"]), (2, True))
+        self.assertEqual((len(second["results"]), second["has_next"]), (1, False))
+
+    def test_user_input_cannot_inject_fts_syntax(self):
+        self.assertEqual(fts5_match_expression('title:"x" OR y'), '"title" "x" "OR" "y"*')
+        self.assertIsNone(fts5_match_expression("!!"))
+        self.assertEqual(self.search("NEAR("), [])
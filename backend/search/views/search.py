@@ -0,0 +1,48 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from pydantic import BaseModel, Field, ValidationError
+from typing import Optional
+
+from ..models import SearchEntry
+
+
+class SearchQuerySchema(BaseModel):
+    q: str = Field(..., min_length=1, max_length=200)
+    user_id: Optional[int] = None
+    page: int = Field(1, ge=1)
+    page_size: int = Field(20, ge=1, le=100)
+
+
+class SearchView(APIView):
+    """
+    Ranked full-text search over the user's tasks, meetings and meeting notes.
+    """
+
+    throttle_scope = "search"
+
+    def get(self, request) -> Response:
+        try:
+            query = SearchQuerySchema.model_validate(request.query_params.dict())
+        except ValidationError as e:
+            return Response({"error": "Invalid query parameters", "details": e.errors()}, status=status.HTTP_400_BAD_REQUEST)
+
+        user_id = query.user_id or request.user.pk
+        if user_id is None:
+            return Response({"error": "user_id is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            # One extra result tells whether there is a next page.
+            results = SearchEntry.search(
+                user_id=user_id, query=query.q, limit=query.page_size + 1, offset=(query.page - 1) * query.page_size
+            )
+            return Response(
+                {
+                    "results": [result.model_dump() for result in results[: query.page_size]],
+                    "page": query.page,
+                    "has_next": len(results) > query.page_size,
+                },
+                status=status.HTTP_200_OK,
+            )
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,98 @@
+"""
+Delta sync: what changed in a user's projects, tasks and meetings since a cursor.
+
+A cursor is a point in time, handed to clients as whole microseconds since the
+epoch, and matches rows whose updated_at (deleted_at for tombstones) is later.
+Those timestamps are taken before the writing transaction commits, so a row can
+become visible with an older timestamp than rows already sent. The next cursor
+therefore never comes closer than SYNC_OVERLAP_SECONDS to the present: rows
+changed within that window are sent again on the next poll, which clients apply
+idempotently, instead of being missed.
+"""
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+from note_manager.models.meeting import MEETING_ROW_FIELDS, Meeting
+from task_manager.models.project import PROJECT_ROW_FIELDS, Project
+from task_manager.models.project_task import TASK_ROW_FIELDS, ProjectTask
+from .models import Tombstone
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+class CursorExpired(Exception):
+    """The cursor is older than the tombstones kept, so deletions since may be lost."""
+
+
+def to_cursor(moment: datetime) -> int:
+    return (moment - EPOCH) // timedelta(microseconds=1)
+
+
+def from_cursor(cursor: int) -> datetime:
+    return EPOCH + timedelta(microseconds=cursor)
+
+
+def get_changes(user_id: int, since: Optional[int] = None) -> dict:
+    """
+    The user's projects, tasks and meetings changed after `since`, and the ids
+    deleted since, by kind; everything (a snapshot, marked "full") when `since`
+    is None. Empty groups are left out, so a poll with nothing new returns only
+    the next cursor. Projects come without their tasks and meetings with the ids
+    of their linked tasks, so a change is only sent where it happened.
+    """
+    now = timezone.now()
+    projects = Project.objects.filter(user_id=user_id)
+    tasks = ProjectTask.objects.filter(project__user_id=user_id)
+    meetings = Meeting.objects.filter(owner_id=user_id)
+    tombstones = Tombstone.objects.none()
+
+    since_at = None
+    if since is not None:
+        since_at = from_cursor(since)
+        if since_at < now - timedelta(days=settings.SYNC_TOMBSTONE_DAYS):
+            raise CursorExpired(f"Cursor {since} is older than {settings.SYNC_TOMBSTONE_DAYS} days")
+        projects = projects.filter(updated_at__gt=since_at)
+        tasks = tasks.filter(updated_at__gt=since_at)
+        meetings = meetings.filter(updated_at__gt=since_at)
+        tombstones = Tombstone.objects.filter(user_id=user_id, deleted_at__gt=since_at)
+
+    # Each row is fetched with its timestamp last, to find the latest one sent.
+    project_rows = list(projects.order_by("id").values_list(*PROJECT_ROW_FIELDS, "updated_at"))
+    task_rows = list(tasks.order_by("id").values_list(*TASK_ROW_FIELDS, "updated_at"))
+    meeting_rows = list(meetings.order_by("id").values_list(*MEETING_ROW_FIELDS, "updated_at"))
+    tombstone_rows = list(tombstones.order_by("id").values_list("kind", "object_id", "deleted_at"))
+
+    changes: dict = {}
+    if since is None:
+        changes["full"] = True
+    if project_rows:
+        changes["projects"] = Project.rows_to_dicts((row[:-1] for row in project_rows), [])
+        for project in changes["projects"]:
+            del project["tasks"]
+    if task_rows:
+        changes["tasks"] = [ProjectTask.row_to_dict(row[:-1]) for row in task_rows]
+    if meeting_rows:
+        task_ids: dict[int, list[int]] = {}
+        links = Meeting.tasks.through.objects.filter(meeting__in=meetings).order_by("meeting_id", "projecttask_id")
+        for meeting_id, task_id in links.values_list("meeting_id", "projecttask_id"):
+            task_ids.setdefault(meeting_id, []).append(task_id)
+        changes["meetings"] = Meeting.rows_to_dicts((row[:-1] for row in meeting_rows), [])
+        for meeting in changes["meetings"]:
+            del meeting["tasks"]
+            meeting["task_ids"] = task_ids.get(meeting["id"], [])
+    if tombstone_rows:
+        changes["deleted"] = {}
+        for kind, object_id, _ in tombstone_rows:
+            changes["deleted"].setdefault(kind, []).append(object_id)
+
+    latest = max((row[-1] for rows in (project_rows, task_rows, meeting_rows, tombstone_rows) for row in rows), default=None)
+    horizon = now - timedelta(seconds=settings.SYNC_OVERLAP_SECONDS)
+    cursor_at = horizon if latest is None else min(latest, horizon)
+    if since_at is not None:
+        # Never move a cursor backwards; with nothing new it stays where it was.
+        cursor_at = since_at if latest is None else max(since_at, cursor_at)
+    return {"cursor": to_cursor(cursor_at), **changes}
@@ -0,0 +1,18 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from sync.models import Tombstone
+
+
+class Command(BaseCommand):
+    help = "Delete tombstones older than SYNC_TOMBSTONE_DAYS; clients with older cursors resync from a snapshot."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=settings.SYNC_TOMBSTONE_DAYS)
+
+    def handle(self, *args, days: int, **options):
+        pruned = Tombstone.prune(timezone.now() - timedelta(days=days))
+        self.stdout.write(f"Pruned {pruned} tombstones")
@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import Iterable
+
+from django.db import models
+from django.utils import timezone
+
+
+class Tombstone(models.Model):
+    """
+    Records that a project, task or meeting was deleted, so that clients syncing
+    through the changes endpoint can drop it. Rows older than
+    SYNC_TOMBSTONE_DAYS are pruned (the prune_tombstones command), after which
+    cursors that old have to start over from a full snapshot.
+    """
+
+    PROJECT = "project"
+    TASK = "task"
+    MEETING = "meeting"
+    KIND_CHOICES = ((PROJECT, PROJECT), (TASK, TASK), (MEETING, MEETING))
+
+    kind = models.CharField(max_length=16, choices=KIND_CHOICES)
+    object_id = models.BigIntegerField()
+    # Not a foreign key: tombstones are written while a user's rows cascade
+    # away, possibly together with the user.
+    user_id = models.IntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [models.Index(fields=["user_id", "deleted_at"], name="tombstone_user_deleted_idx")]
+
+    @classmethod
+    def record(cls, kind: str, user_id: int, object_ids: Iterable[int]) -> None:
+        now = timezone.now()
+        cls.objects.bulk_create([cls(kind=kind, object_id=object_id, user_id=user_id, deleted_at=now) for object_id in object_ids])
+
+    @classmethod
+    def prune(cls, before: datetime) -> int:
+        deleted, _ = cls.objects.filter(deleted_at__lt=before).delete()
+        return deleted
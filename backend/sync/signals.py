@@ -0,0 +1,56 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from note_manager.models import Meeting
+from task_manager.models.project import Project
+from task_manager.models.project_task import ProjectTask, tasks_bulk_updated
+from .models import Tombstone
+
+
+@receiver(post_delete, sender=ProjectTask)
+def bury_task(sender, instance: ProjectTask, **kwargs):
+    # Tasks are deleted before their project when it cascades, so the owner can still be found.
+    user_id = Project.objects.filter(id=instance.project_id).values_list("user_id", flat=True).first()
+    if user_id is not None:
+        Tombstone.record(Tombstone.TASK, user_id, [instance.pk])
+
+
+@receiver(pre_delete, sender=ProjectTask)
+def touch_meetings_of_deleted_task(sender, instance: ProjectTask, **kwargs):
+    # Synced meetings carry their linked task ids, which lose this one.
+    Meeting.objects.filter(tasks=instance).update(updated_at=timezone.now())
+
+
+@receiver(post_delete, sender=Project)
+def bury_project(sender, instance: Project, **kwargs):
+    Tombstone.record(Tombstone.PROJECT, instance.user_id, [instance.pk])
+
+
+@receiver(post_save, sender=Project)
+def touch_tasks_of_renamed_project(sender, instance: Project, created: bool, update_fields=None, **kwargs):
+    # Synced tasks carry their project's display name.
+    if created or (update_fields is not None and "display_name" not in update_fields):
+        return
+    tasks = ProjectTask.objects.filter(project=instance)
+    tasks.update(updated_at=timezone.now())
+    tasks_bulk_updated.send(sender=ProjectTask, task_ids=tasks.values("id"), fields=["updated_at"])
+
+
+@receiver(post_delete, sender=Meeting)
+def bury_meeting(sender, instance: Meeting, **kwargs):
+    if instance.owner_id is not None:
+        Tombstone.record(Tombstone.MEETING, instance.owner_id, [instance.pk])
+
+
+@receiver(m2m_changed, sender=Meeting.tasks.through)
+def touch_relinked_meetings(sender, instance, action: str, reverse: bool, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        meetings = Meeting.objects.filter(pk=instance.pk)
+    elif action == "pre_clear":
+        meetings = Meeting.objects.filter(tasks=instance)
+    else:
+        meetings = Meeting.objects.filter(pk__in=pk_set)
+    meetings.update(updated_at=timezone.now())
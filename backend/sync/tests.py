@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from note_manager.models import Meeting
+from sync.changes import get_changes, to_cursor
+from sync.models import Tombstone
+from task_manager.models.daily_task_history import DailyTaskHistory
+from task_manager.models.project import Project
+from task_manager.models.project_task import ProjectTask, TaskState
+
+
+# No overlap, so each cursor covers everything written before it was issued.
+@override_settings(SYNC_OVERLAP_SECONDS=0)
+class ChangesTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username="owner")
+        self.project = Project.objects.create(user=self.user, display_name="Home", description="")
+        self.task = ProjectTask.objects.create(project=self.project, title="Water plants", description="")
+        start = datetime(2026, 3, 1, 10, tzinfo=dt_timezone.utc)
+        self.meeting = Meeting.objects.create(owner=self.user, title="Sync", description="", start_time=start, end_time=start)
+        self.meeting.add_tasks([self.task.pk])
+
+    def test_snapshot_then_idle_poll(self):
+        snapshot = get_changes(self.user.pk)
+        self.assertTrue(snapshot["full"])
+        self.assertEqual([p["id"] for p in snapshot["projects"]], [self.project.pk])
+        self.assertEqual([t["id"] for t in snapshot["tasks"]], [self.task.pk])
+        self.assertEqual(snapshot["meetings"][0]["task_ids"], [self.task.pk])
+
+        self.assertEqual(get_changes(self.user.pk, snapshot["cursor"]), {"cursor": snapshot["cursor"]})
+
+    def test_poll_returns_only_what_changed(self):
+        other = ProjectTask.objects.create(project=self.project, title="Pay rent", description="")
+        cursor = get_changes(self.user.pk)["cursor"]
+
+        self.task.status = TaskState.COMPLETED
+        self.task.save()
+        changes = get_changes(self.user.pk, cursor)
+
+        self.assertEqual([t["id"] for t in changes["tasks"]], [self.task.pk])
+        self.assertNotIn("projects", changes)
+        self.assertNotIn("meetings", changes)
+        self.assertGreater(changes["cursor"], cursor)
+        self.assertNotIn(other.pk, [t["id"] for t in changes["tasks"]])
+
+    def test_deletions_are_reported_as_tombstones(self):
+        cursor = get_changes(self.user.pk)["cursor"]
+        task_id = self.task.pk
+        self.task.delete()
+
+        changes = get_changes(self.user.pk, cursor)
+        self.assertEqual(changes["deleted"], {"task": [task_id]})
+        # The meeting lost its link to the task.
+        self.assertEqual(changes["meetings"][0]["task_ids"], [])
+
+        project_id, meeting_id = self.project.pk, self.meeting.pk
+        self.project.delete()
+        self.meeting.delete()
+        self.assertEqual(get_changes(self.user.pk, cursor)["deleted"], {"task": [task_id], "project": [project_id], "meeting": [meeting_id]})
+
+    def test_set_based_writes_and_renames_are_picked_up(self):
+        cursor = get_changes(self.user.pk)["cursor"]
+        ProjectTask.bulk_upsert(project=self.project, items=[{"title": "Water plants", "description": "Twice a week"}])
+        self.assertEqual([t["description"] for t in get_changes(self.user.pk, cursor)["tasks"]], ["Twice a week"])
+
+        cursor = get_changes(self.user.pk)["cursor"]
+        self.project.display_name = "House"
+        self.project.save()
+        changes = get_changes(self.user.pk, cursor)
+        self.assertEqual([p["display_name"] for p in changes["projects"]], ["House"])
+        self.assertEqual([t["project_name"] for t in changes["tasks"]], ["House"])
+
+    def test_rollover_reset_is_synced(self):
+        self.task.is_daily_task = True
+        self.task.status = TaskState.COMPLETED
+        self.task.save()
+        cursor = get_changes(self.user.pk)["cursor"]
+
+        DailyTaskHistory.rollover()
+        self.assertEqual([t["status"] for t in get_changes(self.user.pk, cursor)["tasks"]], [TaskState.TODO])
+
+    @override_settings(SYNC_OVERLAP_SECONDS=60)
+    def test_cursor_stays_behind_recent_writes(self):
+        cursor = get_changes(self.user.pk)["cursor"]
+        self.assertLessEqual(cursor, to_cursor(timezone.now() - timedelta(seconds=59)))
+        # Rows inside the overlap window are sent again.
+        self.assertEqual([t["id"] for t in get_changes(self.user.pk, cursor)["tasks"]], [self.task.pk])
+
+    def test_view(self):
+        url = reverse("changes")
+        response = self.client.get(url, {"user_id": self.user.pk})
+        self.assertEqual(response.status_code, 200)
+        cursor = response.json()["cursor"]
+
+        response = self.client.get(url, {"user_id": self.user.pk, "since": cursor})
+        self.assertEqual(response.json(), {"cursor": cursor})
+        self.assertLess(len(response.content), 40)
+
+        expired = to_cursor(timezone.now() - timedelta(days=31))
+        self.assertEqual(self.client.get(url, {"user_id": self.user.pk, "since": expired}).status_code, 410)
+        self.assertEqual(self.client.get(url, {"user_id": self.user.pk, "since": "soon"}).status_code, 400)
+
+    def test_prune(self):
+        self.task.delete()
+        Tombstone.objects.update(deleted_at=timezone.now() - timedelta(days=40))
+        self.assertEqual(Tombstone.prune(timezone.now() - timedelta(days=30)), 1)
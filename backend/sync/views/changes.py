@@ -0,0 +1,38 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from pydantic import BaseModel, Field, ValidationError
+from typing import Optional
+
+from ..changes import CursorExpired, get_changes
+
+
+class ChangesQuerySchema(BaseModel):
+    since: Optional[int] = Field(None, ge=0)
+    user_id: Optional[int] = None
+
+
+class ChangesView(APIView):
+    """
+    The user's projects, tasks and meetings created, updated or deleted since
+    `since` (the `cursor` of the previous response), or a full snapshot without
+    it. Answers 410 when the cursor is too old to be caught up, and the client
+    has to start again from a snapshot.
+    """
+
+    def get(self, request) -> Response:
+        try:
+            query = ChangesQuerySchema.model_validate(request.query_params.dict())
+        except ValidationError as e:
+            return Response({"error": "Invalid query parameters", "details": e.errors()}, status=status.HTTP_400_BAD_REQUEST)
+
+        user_id = query.user_id or request.user.pk
+        if user_id is None:
+            return Response({"error": "user_id is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            return Response(get_changes(user_id, query.since), status=status.HTTP_200_OK)
+        except CursorExpired as e:
+            return Response({"error": str(e)}, status=status.HTTP_410_GONE)
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
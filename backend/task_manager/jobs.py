@@ -0,0 +1,24 @@
+from django.db import transaction
+
+from jobs.registry import job
+from .models import DailyTaskHistory, ProjectDeadlineSummary, ProjectStatusSummary
+from .models.project import Project
+from .views.bulk_add_task import upsert_items
+
+
+@job("task_manager.bulk_upsert_tasks")
+def bulk_upsert_tasks(project_id: int, tasks: list[dict]) -> dict:
+    return upsert_items(Project.objects.get(id=project_id), tasks)
+
+
+@job("task_manager.rollover_daily_tasks")
+def rollover_daily_tasks() -> dict:
+    return DailyTaskHistory.rollover()
+
+
+@job("task_manager.rebuild_project_summaries")
+def rebuild_project_summaries() -> dict:
+    with transaction.atomic():
+        ProjectStatusSummary.recount()
+        ProjectDeadlineSummary.recount()
+    return {"status_rows": ProjectStatusSummary.objects.count(), "deadline_rows": ProjectDeadlineSummary.objects.count()}
@@ -0,0 +1,107 @@
+import asyncio
+import json
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.test import AsyncClient, Client
+from django.urls import reverse
+
+from note_manager.models import Meeting
+
+HEADERS = {"host": "localhost"}
+
+
+def summarize(latencies: list[float], elapsed: float) -> dict:
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 2),
+        "requests_per_s": round(len(latencies) / elapsed, 1),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the sync views served by a fixed pool of threads (WSGI) against their async variants "
+        "served from one event loop (ASGI) at high concurrency. Runs against the configured database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user-id", type=int, help="User whose data is requested (default: the first user)")
+        parser.add_argument("--requests", type=int, default=400, help="Requests per endpoint and mode")
+        parser.add_argument("--concurrency", type=int, default=200, help="Requests in flight at once")
+        parser.add_argument("--threads", type=int, default=8, help="Worker threads of the sync server")
+        parser.add_argument(
+            "--client-delay", type=float, default=0.05, help="Seconds each request is held open, as by a slow client"
+        )
+        parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+
+    def handle(self, *args, requests: int, concurrency: int, threads: int, client_delay: float, **options):
+        user_id = options["user_id"] or User.objects.order_by("id").values_list("id", flat=True).first()
+        if user_id is None:
+            raise CommandError("No users in the database; seed some data first.")
+        meeting_id = Meeting.objects.filter(owner_id=user_id).values_list("id", flat=True).first()
+
+        endpoints = [
+            ("project list", "project_view", {"user_id": user_id}, {}),
+            ("task list", "task_view", {"user_id": user_id}, {}),
+            ("meeting feed", "user_meetings", {}, {"user_id": user_id}),
+        ]
+        if meeting_id is not None:
+            endpoints += [
+                ("meeting details", "meeting_details", {"meeting_id": meeting_id}, {}),
+                ("meeting note", "meeting_note", {"meeting_id": meeting_id}, {}),
+            ]
+
+        results = []
+        for label, name, kwargs, params in endpoints:
+            sync = self.run_sync(reverse(name, kwargs=kwargs), params, requests, threads, client_delay)
+            asynchronous = asyncio.run(
+                self.run_async(reverse(f"async_{name}", kwargs=kwargs), params, requests, concurrency, client_delay)
+            )
+            results.append({"endpoint": label, "sync": sync, "async": asynchronous})
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        self.stdout.write(f"{'endpoint':<18}{'mode':<7}{'p50 ms':>10}{'p95 ms':>10}{'req/s':>10}")
+        for r in results:
+            for mode in ("sync", "async"):
+                s = r[mode]
+                self.stdout.write(f"{r['endpoint']:<18}{mode:<7}{s['p50_ms']:>10}{s['p95_ms']:>10}{s['requests_per_s']:>10}")
+
+    @staticmethod
+    def run_sync(url: str, params: dict, requests: int, threads: int, client_delay: float) -> dict:
+        client = Client(headers=HEADERS)
+
+        def one() -> float:
+            started = time.perf_counter()
+            client.get(url, params)
+            time.sleep(client_delay)
+            return time.perf_counter() - started
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            latencies = list(pool.map(lambda _: one(), range(requests)))
+        return summarize(latencies, time.perf_counter() - started)
+
+    @staticmethod
+    async def run_async(url: str, params: dict, requests: int, concurrency: int, client_delay: float) -> dict:
+        client = AsyncClient(headers=HEADERS)
+        slots = asyncio.Semaphore(concurrency)
+
+        async def one() -> float:
+            async with slots:
+                started = time.perf_counter()
+                await client.get(url, params)
+                await asyncio.sleep(client_delay)
+                return time.perf_counter() - started
+
+        started = time.perf_counter()
+        latencies = await asyncio.gather(*(one() for _ in range(requests)))
+        return summarize(latencies, time.perf_counter() - started)
@@ -0,0 +1,309 @@
+import contextlib
+import io
+import json
+import time
+from dataclasses import dataclass
+from itertools import count
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import URLPattern, URLResolver, get_resolver
+from django.utils import timezone
+
+from authenticator import tokens
+from jobs.models import Job
+from note_manager.models import Meeting, Note
+from sync.changes import to_cursor
+from task_manager.models.project import Project
+from task_manager.models.project_task import ProjectTask
+
+from .seed_data import SEED_PASSWORD, SEED_USERNAME_PREFIX
+
+
+@dataclass
+class Fixture:
+    """Ids the requests are built from: the benchmarked user's busiest objects."""
+
+    username: str
+    user_id: int
+    project_id: int
+    task_id: int
+    task_title: str
+    meeting_id: int
+    link_sets: tuple[list[int], list[int]]
+    # Delta sync cursor taken when the fixture was built.
+    sync_cursor: int
+    refresh_token: str
+    # Set once inside the rolled-back transaction.
+    job_id: int = 0
+
+
+@dataclass
+class Spec:
+    method: str
+    kwargs: Callable[[Fixture], dict]
+    # Builds the query parameters (GET) or JSON body (POST) of the i-th request.
+    data: Callable[[Fixture, int], dict]
+
+
+def current_revision(f: Fixture) -> int:
+    return Note.objects.filter(meeting_id=f.meeting_id).values_list("revision", flat=True).first() or 0
+
+
+# Keyed by route pattern, since route names are not unique. Routes without a spec
+# are reported as skipped so new endpoints show up in the output.
+SPECS: dict[str, Spec] = {
+    "login/": Spec("post", lambda f: {}, lambda f, i: {"username": f.username, "password": SEED_PASSWORD}),
+    "token/": Spec("post", lambda f: {}, lambda f, i: {"username": f.username, "password": SEED_PASSWORD}),
+    "token/refresh/": Spec("post", lambda f: {}, lambda f, i: {"refresh": f.refresh_token}),
+    "token/revoke/": Spec("post", lambda f: {}, lambda f, i: {}),
+    "signup/": Spec("post", lambda f: {}, lambda f, i: {"username": f"bench-signup-{i}", "password": SEED_PASSWORD}),
+    "projects/<int:user_id>/": Spec("get", lambda f: {"user_id": f.user_id}, lambda f, i: {}),
+    "projects/<int:user_id>/summary/": Spec("get", lambda f: {"user_id": f.user_id}, lambda f, i: {}),
+    "projects/<int:project_id>/add_task/": Spec("post", lambda f: {"project_id": f.project_id}, lambda f, i: {"title": f"Bench task {i}"}),
+    "projects/<int:project_id>/add_task/bulk/": Spec(
+        "post", lambda f: {"project_id": f.project_id}, lambda f, i: {"tasks": [{"title": f"Bench bulk {i % 2} {t}"} for t in range(100)]}
+    ),
+    "projects/<int:project_id>/tasks/ordered/": Spec("get", lambda f: {"project_id": f.project_id}, lambda f, i: {}),
+    "projects/create/": Spec("post", lambda f: {}, lambda f, i: {"title": f"Bench project {i}", "description": "", "user_id": f.user_id}),
+    "meetings/create/": Spec(
+        "post",
+        lambda f: {},
+        lambda f, i: {
+            "title": f"Bench meeting {i}",
+            "description": "",
+            "start_time": "2026-01-01T09:00:00Z",
+            "end_time": "2026-01-01T09:30:00Z",
+            "tasks": f.link_sets[0],
+            "user_id": f.user_id,
+        },
+    ),
+    "meetings/<int:meeting_id>/note/": Spec("get", lambda f: {"meeting_id": f.meeting_id}, lambda f, i: {}),
+    "meetings/<int:meeting_id>/note/edit/": Spec("post", lambda f: {"meeting_id": f.meeting_id}, lambda f, i: {"content": f"Bench note {i}"}),
+    "meetings/<int:meeting_id>/note/patch/": Spec(
+        "post",
+        lambda f: {"meeting_id": f.meeting_id},
+        lambda f, i: {"base_revision": current_revision(f), "ops": [{"op": "insert", "pos": 0, "text": "x"}]},
+    ),
+    "meetings/": Spec("get", lambda f: {}, lambda f, i: {"user_id": f.user_id}),
+    "meetings/<int:meeting_id>/add_task/": Spec("post", lambda f: {"meeting_id": f.meeting_id}, lambda f, i: {"task_ids": f.link_sets[i % 2]}),
+    "meetings/<int:meeting_id>/tasks/add/": Spec("post", lambda f: {"meeting_id": f.meeting_id}, lambda f, i: {"task_ids": [f.task_id]}),
+    "meetings/<int:meeting_id>/tasks/remove/": Spec("post", lambda f: {"meeting_id": f.meeting_id}, lambda f, i: {"task_ids": [f.task_id]}),
+    "meetings/<int:meeting_id>/": Spec("get", lambda f: {"meeting_id": f.meeting_id}, lambda f, i: {}),
+    "calendar/": Spec("get", lambda f: {}, lambda f, i: {"user_id": f.user_id, "date": "2026-01-15"}),
+    "tasks/<int:user_id>/": Spec("get", lambda f: {"user_id": f.user_id}, lambda f, i: {}),
+    "tasks/<int:task_id>/edit/": Spec(
+        "post", lambda f: {"task_id": f.task_id}, lambda f, i: {"project_id": f.project_id, "title": f.task_title, "description": f"Edited {i}"}
+    ),
+    # Flips the first project's tasks between in progress and to do.
+    "tasks/batch/": Spec(
+        "post", lambda f: {}, lambda f, i: {"user_id": f.user_id, "filter": {"project_id": f.project_id}, "set": {"status": 1 - i % 2}}
+    ),
+    "tasks/<int:task_id>/dependencies/": Spec("get", lambda f: {"task_id": f.task_id}, lambda f, i: {}),
+    "tasks/<int:task_id>/dependencies/add/": Spec("post", lambda f: {"task_id": f.task_id}, lambda f, i: {"task_ids": f.link_sets[1]}),
+    "tasks/<int:task_id>/dependencies/remove/": Spec("post", lambda f: {"task_id": f.task_id}, lambda f, i: {"task_ids": f.link_sets[1]}),
+    "search/": Spec("get", lambda f: {}, lambda f, i: {"q": "review", "user_id": f.user_id}),
+    "jobs/<int:job_id>/": Spec("get", lambda f: {"job_id": f.job_id}, lambda f, i: {}),
+    "workspace/export/": Spec("get", lambda f: {}, lambda f, i: {"user_id": f.user_id, "gzip": i % 2}),
+    # A JSON body is a one-record JSON Lines file. Imports for the requesting
+    # user, so it is refused without --auth.
+    "workspace/import/": Spec(
+        "post", lambda f: {}, lambda f, i: {"type": "project", "id": 1, "name": f"Bench import {i}", "display_name": f"Bench import {i}", "description": ""}
+    ),
+    # Alternates a full snapshot with a poll since the fixture was set up.
+    "changes/": Spec("get", lambda f: {}, lambda f, i: {"user_id": f.user_id, **({"since": f.sync_cursor} if i % 2 else {})}),
+    # The test client is WSGI, so this measures the refusal rather than a stream.
+    "events/": Spec("get", lambda f: {}, lambda f, i: {"user_id": f.user_id}),
+    "async/projects/<int:user_id>/": Spec("get", lambda f: {"user_id": f.user_id}, lambda f, i: {}),
+    "async/tasks/<int:user_id>/": Spec("get", lambda f: {"user_id": f.user_id}, lambda f, i: {}),
+    "async/meetings/": Spec("get", lambda f: {}, lambda f, i: {"user_id": f.user_id}),
+    "async/meetings/<int:meeting_id>/": Spec("get", lambda f: {"meeting_id": f.meeting_id}, lambda f, i: {}),
+    "async/meetings/<int:meeting_id>/note/": Spec("get", lambda f: {"meeting_id": f.meeting_id}, lambda f, i: {}),
+}
+
+
+def iter_routes(patterns: list, prefix: str = ""):
+    """(route, name, pattern) for every endpoint, with includes reported as a single route."""
+    for entry in patterns:
+        if isinstance(entry, URLResolver):
+            yield prefix + str(entry.pattern), None, None
+        elif isinstance(entry, URLPattern):
+            yield prefix + str(entry.pattern), entry.name, entry
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive every route in alarmclock/urls.py through the test client against seeded data (see seed_data) "
+        "and report latency percentiles, throughput and SQL queries per request. All writes are rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", default=f"{SEED_USERNAME_PREFIX}0", help="Seeded user whose data is requested")
+        parser.add_argument("--requests", type=int, default=50, help="Measured requests per endpoint")
+        parser.add_argument("--warmup", type=int, default=5, help="Unmeasured requests per endpoint")
+        parser.add_argument("--only", nargs="*", default=None, help="Only benchmark routes containing one of these strings")
+        parser.add_argument("--output", help="Write JSON results to this file")
+        parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+        parser.add_argument(
+            "--auth",
+            choices=("none", "session", "token"),
+            default="none",
+            help="Send requests anonymously, with a session cookie or with a bearer token for --user",
+        )
+
+    def handle(self, *args, requests: int, warmup: int, **options):
+        fixture = self.build_fixture(options["user"])
+        client = Client(headers={"host": "localhost"})
+        numbers = count()
+
+        results = []
+        # Throttling stays on so its overhead is measured, but cannot refuse anything.
+        unlimited = {"capacity": 1e12, "rate": 1e12}
+        throttling = {
+            **settings.THROTTLING,
+            "USER": unlimited,
+            "ANON": unlimited,
+            "SCOPES": {scope: {**config, **unlimited} if "capacity" in config else config for scope, config in settings.THROTTLING["SCOPES"].items()},
+        }
+
+        # Every request is served in this process, so a local response cache is coherent.
+        response_cache = {**settings.RESPONSE_CACHE, "ALLOW_LOCAL": True}
+
+        # Some views print debugging output; keep it out of the report.
+        with override_settings(THROTTLING=throttling, RESPONSE_CACHE=response_cache), transaction.atomic(), contextlib.redirect_stdout(io.StringIO()):
+            fixture.job_id = Job.enqueue("task_manager.rebuild_project_summaries", user_id=fixture.user_id).pk
+            for route, name, pattern in iter_routes(get_resolver().url_patterns):
+                if options["only"] and not any(part in route for part in options["only"]):
+                    continue
+                spec = SPECS.get(route)
+                if spec is None:
+                    results.append({"route": route, "name": name, "skipped": "include" if pattern is None else "no request spec"})
+                    continue
+
+                # Every endpoint starts from a cold response cache, and fresh
+                # credentials since login/signup/revoke replace them.
+                caches[settings.RESPONSE_CACHE["ALIAS"]].clear()
+                self.authenticate(client, fixture, options["auth"])
+                url = self.reverse(route, spec.kwargs(fixture))
+                measured = self.run(client, spec, url, fixture, numbers, warmup, requests)
+                results.append({"route": route, "name": name, "method": spec.method.upper(), **measured})
+            transaction.set_rollback(True)
+
+        report = {
+            "database": connection.vendor,
+            "user": fixture.username,
+            "requests": requests,
+            "auth": options["auth"],
+            "data": {
+                "projects": Project.objects.filter(user_id=fixture.user_id).count(),
+                "tasks": ProjectTask.objects.filter(project__user_id=fixture.user_id).count(),
+                "meetings": Meeting.objects.filter(owner_id=fixture.user_id).count(),
+            },
+            "endpoints": results,
+        }
+
+        if options["output"]:
+            with open(options["output"], "w") as out:
+                json.dump(report, out, indent=2)
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self.stdout.write(f"{'route':<42}{'method':<7}{'status':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>9}{'queries':>9}")
+        for r in results:
+            if "skipped" in r:
+                self.stdout.write(f"{r['route']:<42}skipped ({r['skipped']})")
+                continue
+            self.stdout.write(
+                f"{r['route']:<42}{r['method']:<7}{r['status']:>7}{r['p50_ms']:>9}{r['p95_ms']:>9}{r['p99_ms']:>9}"
+                f"{r['requests_per_s']:>9}{r['queries']:>9}"
+            )
+
+    @staticmethod
+    def authenticate(client: Client, fixture: Fixture, auth: str) -> None:
+        client.logout()
+        client.defaults.pop("HTTP_AUTHORIZATION", None)
+        user = User.objects.get(pk=fixture.user_id)
+        if auth == "session":
+            client.force_login(user)
+        elif auth == "token":
+            client.defaults["HTTP_AUTHORIZATION"] = f"Bearer {tokens.issue(user)['access']}"
+
+    @staticmethod
+    def reverse(route: str, kwargs: dict) -> str:
+        path = route
+        for key, value in kwargs.items():
+            path = path.replace(f"<int:{key}>", str(value))
+        return "/" + path
+
+    @staticmethod
+    def build_fixture(username: str) -> Fixture:
+        user = User.objects.filter(username=username).first()
+        if user is None:
+            raise CommandError(f"User {username!r} does not exist; run seed_data first.")
+
+        project: Optional[Project] = Project.objects.filter(user=user).order_by("id").first()
+        meeting: Optional[Meeting] = Meeting.objects.filter(owner=user).order_by("id").first()
+        if project is None or meeting is None:
+            raise CommandError(f"User {username!r} needs at least one project and one meeting.")
+        task_ids = list(ProjectTask.objects.filter(project=project).order_by("id").values_list("id", flat=True)[:6])
+        if not task_ids:
+            raise CommandError(f"Project {project.pk} has no tasks.")
+
+        return Fixture(
+            username=username,
+            user_id=user.pk,
+            project_id=project.pk,
+            task_id=task_ids[0],
+            task_title=ProjectTask.objects.get(pk=task_ids[0]).title,
+            meeting_id=meeting.pk,
+            link_sets=(task_ids[:3], task_ids[3:] or task_ids[:1]),
+            sync_cursor=to_cursor(timezone.now()),
+            refresh_token=tokens.issue(user)["refresh"],
+        )
+
+    @staticmethod
+    def run(client: Client, spec: Spec, url: str, fixture: Fixture, numbers, warmup: int, requests: int) -> dict:
+        latencies: list[float] = []
+        queries: list[int] = []
+        statuses: set[int] = set()
+
+        for iteration in range(warmup + requests):
+            data = spec.data(fixture, next(numbers))
+            # The query log is capped; once full, new queries would not show up as captured.
+            connection.queries_log.clear()
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                if spec.method == "get":
+                    response = client.get(url, data)
+                else:
+                    response = client.post(url, data, content_type="application/json")
+                if response.streaming:
+                    b"".join(response.streaming_content)
+                elapsed = time.perf_counter() - started
+            if iteration >= warmup:
+                latencies.append(elapsed)
+                # Savepoints come from the surrounding rollback transaction, not the view.
+                queries.append(sum(1 for q in captured.captured_queries if "SAVEPOINT" not in q["sql"]))
+                statuses.add(response.status_code)
+
+        latencies.sort()
+        return {
+            "status": ",".join(str(s) for s in sorted(statuses)),
+            "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+            "requests_per_s": round(len(latencies) / sum(latencies), 1),
+            "queries": round(sum(queries) / len(queries), 1),
+        }
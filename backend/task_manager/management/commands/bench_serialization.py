@@ -0,0 +1,120 @@
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+
+from note_manager.models.meeting import Meeting, MeetingSchema
+from note_manager.models.notes import Note
+from task_manager.models.project import Project, ProjectSchema
+from task_manager.models.project_task import ProjectTask
+
+
+def best_rate(fn: Callable[[], list], rows: int, repeat: int) -> float:
+    """Rows per second of the fastest of `repeat` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return rows / best
+
+
+class Command(BaseCommand):
+    help = "Compare rows/second of serialize().model_dump() against the values()-row fast path. Touches no database."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=20000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+
+    def handle(self, *args, rows: int, repeat: int, **options):
+        user = User(id=1, username="bench", email="bench@example.com")
+        project = Project(id=1, user=user, display_name="Bench project", description="A project")
+        tasks = [
+            ProjectTask(
+                id=i, project=project, title=f"Task {i}", priority=i % 3, status=i % 4, description="Some description", is_daily_task=i % 2 == 0
+            )
+            for i in range(rows)
+        ]
+        task_rows = [(t.pk, project.display_name, project.pk, t.title, t.priority, t.status, t.description, t.is_daily_task) for t in tasks]
+
+        start = datetime(2026, 1, 1, 9, tzinfo=timezone.utc)
+        meetings = [
+            Meeting(
+                id=i,
+                title=f"Meeting {i}",
+                description="Weekly sync",
+                start_time=start + timedelta(hours=i),
+                end_time=start + timedelta(hours=i, minutes=30),
+            )
+            for i in range(rows)
+        ]
+        meeting_rows = [(m.pk, m.title, m.description, m.start_time, m.end_time) for m in meetings]
+
+        notes = [Note(meeting_id=i, content="Meeting notes " * 20, created_at=start, updated_at=start) for i in range(rows)]
+        note_rows = [(n.meeting_id, n.content, n.created_at, n.updated_at) for n in notes]
+
+        # Meeting.serialize() and Project.serialize() read tasks through a related
+        # manager (a query), so their model path is measured by building the same
+        # schemas they build from in-memory instances.
+        project_count = rows // 50
+
+        cases = {
+            "task": (
+                lambda: [t.serialize().model_dump() for t in tasks],
+                lambda: [ProjectTask.row_to_dict(r) for r in task_rows],
+            ),
+            "meeting": (
+                lambda: [
+                    MeetingSchema(
+                        id=m.pk,
+                        title=m.title,
+                        description=m.description,
+                        start_time=m.start_time.isoformat(),
+                        end_time=m.end_time.isoformat(),
+                        tasks=[],
+                    ).model_dump()
+                    for m in meetings
+                ],
+                lambda: Meeting.rows_to_dicts(meeting_rows, []),
+            ),
+            "note": (
+                lambda: [n.serialize().model_dump() for n in notes],
+                lambda: [Note.row_to_dict(r) for r in note_rows],
+            ),
+            "project (50 tasks each)": (
+                lambda: [
+                    ProjectSchema(
+                        id=p,
+                        owner_username=user.username,
+                        owner_email=user.email,
+                        display_name="P",
+                        description="",
+                        tasks=[t.serialize() for t in tasks[p * 50 : p * 50 + 50]],
+                    ).model_dump()
+                    for p in range(project_count)
+                ],
+                lambda: Project.rows_to_dicts(
+                    [(p, user.username, user.email, "P", "") for p in range(project_count)], task_rows[: project_count * 50]
+                ),
+            ),
+        }
+
+        results = []
+        for name, (model_path, row_path) in cases.items():
+            model_rate = best_rate(model_path, rows, repeat)
+            row_rate = best_rate(row_path, rows, repeat)
+            results.append(
+                {"case": name, "model_rows_per_s": round(model_rate), "fast_rows_per_s": round(row_rate), "speedup": round(row_rate / model_rate, 2)}
+            )
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        self.stdout.write(f"{'case':<26}{'model rows/s':>16}{'fast rows/s':>16}{'speedup':>10}")
+        for r in results:
+            self.stdout.write(f"{r['case']:<26}{r['model_rows_per_s']:>16,}{r['fast_rows_per_s']:>16,}{r['speedup']:>9}x")
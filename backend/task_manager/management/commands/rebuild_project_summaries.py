@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from task_manager.models import ProjectDeadlineSummary, ProjectStatusSummary
+
+
+class Command(BaseCommand):
+    help = "Recount the per-project task summaries from the tasks, repairing any drift."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            ProjectStatusSummary.recount()
+            ProjectDeadlineSummary.recount()
+        self.stdout.write(
+            f"Rebuilt {ProjectStatusSummary.objects.count()} status and {ProjectDeadlineSummary.objects.count()} deadline summary rows"
+        )
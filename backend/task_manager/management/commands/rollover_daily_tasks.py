@@ -0,0 +1,36 @@
+import json
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from task_manager.models import DailyTaskHistory
+
+
+class Command(BaseCommand):
+    help = (
+        "Record yesterday's completion of daily tasks and reset them to TODO for every user whose local day has "
+        "changed. Safe to run repeatedly; schedule it at least every 15 minutes so each timezone rolls over soon "
+        "after its midnight."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--now", help="ISO timestamp to roll over as of, instead of the current time")
+        parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+
+    def handle(self, *args, **options):
+        now = None
+        if options["now"]:
+            try:
+                now = datetime.fromisoformat(options["now"])
+            except ValueError as e:
+                raise CommandError(f"Invalid --now: {e}")
+            if timezone.is_naive(now):
+                now = timezone.make_aware(now)
+
+        result = DailyTaskHistory.rollover(now=now)
+
+        if options["json"]:
+            self.stdout.write(json.dumps(result))
+            return
+        self.stdout.write(f"Rolled over {result['users']} users: {result['recorded']} days recorded, {result['reset']} tasks reset")
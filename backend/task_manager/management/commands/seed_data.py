@@ -0,0 +1,131 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from note_manager.models import Meeting, Note
+from task_manager.models.project import Project
+from task_manager.models.project_task import ProjectTask
+
+# Seeded users are named SEED_USERNAME_PREFIX + rank and log in with SEED_PASSWORD;
+# rank 0 owns the most data when the volumes are skewed.
+SEED_USERNAME_PREFIX = "seed-user-"
+SEED_PASSWORD = "seed-password"
+
+# Meetings are spread around a fixed date so reruns produce identical rows.
+ANCHOR = datetime(2026, 1, 1, 9, tzinfo=timezone.utc)
+
+VERBS = ("Review", "Draft", "Fix", "Plan", "Write", "Call", "Update", "Prepare", "Book", "Clean up", "Report on", "Ship")
+NOUNS = ("budget", "release notes", "dentist", "invoice", "roadmap", "onboarding", "backlog", "slides", "travel", "report", "tests", "hiring plan")
+WORDS = ("agreed", "follow", "up", "next", "week", "owner", "blocked", "on", "review", "decision", "risk", "timeline", "scope", "customer")
+
+
+def skewed_counts(total: int, buckets: int, skew: float) -> list[int]:
+    """
+    Split `total` over `buckets` in proportion to 1 / (rank + 1) ** skew: 0 is
+    uniform, 1 is Zipf-like. Every bucket gets at least one item while there are
+    items to give.
+    """
+    weights = [1 / (rank + 1) ** skew for rank in range(buckets)]
+    scale = total / sum(weights)
+    return [max(1, round(weight * scale)) if total else 0 for weight in weights]
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed users with projects, tasks, meetings linked to tasks and notes, at configurable volumes and skew. "
+        f"The same --seed always produces the same data. Users log in with the password {SEED_PASSWORD!r}."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=20)
+        parser.add_argument("--projects", type=int, default=5, help="Projects per user, on average")
+        parser.add_argument("--tasks", type=int, default=40, help="Tasks per project, on average")
+        parser.add_argument("--meetings", type=int, default=30, help="Meetings per user, on average")
+        parser.add_argument("--links", type=int, default=3, help="Tasks linked to each meeting")
+        parser.add_argument("--note-ratio", type=float, default=0.5, help="Share of meetings with a note")
+        parser.add_argument("--skew", type=float, default=1.0, help="0 spreads data evenly; higher concentrates it on few users")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--reset", action="store_true", help="Delete previously seeded users and their data first")
+
+    def handle(self, *args, users: int, projects: int, tasks: int, meetings: int, links: int, note_ratio: float, skew: float, **options):
+        rng = random.Random(options["seed"])
+
+        with transaction.atomic():
+            seeded = User.objects.filter(username__startswith=SEED_USERNAME_PREFIX)
+            if options["reset"]:
+                seeded.delete()
+            elif seeded.exists():
+                raise CommandError("Seeded users already exist; pass --reset to replace them.")
+
+            password = make_password(SEED_PASSWORD)
+            seed_users = User.objects.bulk_create(
+                User(username=f"{SEED_USERNAME_PREFIX}{rank}", email=f"{SEED_USERNAME_PREFIX}{rank}@example.com", password=password)
+                for rank in range(users)
+            )
+
+            project_counts = skewed_counts(users * projects, users, skew)
+            new_projects = Project.objects.bulk_create(
+                Project(user=user, display_name=f"{rng.choice(NOUNS).capitalize()} {p}", description="Seeded project")
+                for user, count in zip(seed_users, project_counts)
+                for p in range(count)
+            )
+
+            task_counts = skewed_counts(len(new_projects) * tasks, len(new_projects), skew)
+            ProjectTask.objects.bulk_create(
+                (
+                    ProjectTask(
+                        project=project,
+                        title=f"{rng.choice(VERBS)} {rng.choice(NOUNS)} #{t}",
+                        description=" ".join(rng.choices(WORDS, k=8)),
+                        priority=rng.randrange(3),
+                        status=rng.choices(range(4), weights=(5, 3, 6, 1))[0],
+                        is_daily_task=rng.random() < 0.1,
+                        deadline=(ANCHOR + timedelta(days=rng.randrange(-30, 90))).date() if rng.random() < 0.4 else None,
+                        calendar_linked_date=(ANCHOR + timedelta(days=rng.randrange(-30, 30))).date() if rng.random() < 0.2 else None,
+                    )
+                    for project, count in zip(new_projects, task_counts)
+                    for t in range(count)
+                ),
+                batch_size=1000,
+            )
+
+            task_ids_by_user: dict[int, list[int]] = {}
+            for task_id, user_id in ProjectTask.objects.filter(project__user__in=seed_users).order_by("id").values_list("id", "project__user_id"):
+                task_ids_by_user.setdefault(user_id, []).append(task_id)
+
+            meeting_counts = skewed_counts(users * meetings, users, skew)
+            new_meetings = []
+            for user, count in zip(seed_users, meeting_counts):
+                for m in range(count):
+                    start = ANCHOR + timedelta(days=rng.randrange(-60, 60), hours=rng.randrange(9))
+                    new_meetings.append(
+                        Meeting(owner=user, title=f"{rng.choice(NOUNS).capitalize()} sync {m}", description="Seeded meeting", start_time=start, end_time=start + timedelta(minutes=30))
+                    )
+            new_meetings = Meeting.objects.bulk_create(new_meetings, batch_size=1000)
+
+            Link = Meeting.tasks.through
+            Link.objects.bulk_create(
+                (
+                    Link(meeting_id=meeting.pk, projecttask_id=task_id)
+                    for meeting in new_meetings
+                    for task_id in rng.sample(task_ids_by_user.get(meeting.owner_id, []), min(links, len(task_ids_by_user.get(meeting.owner_id, []))))
+                ),
+                batch_size=1000,
+            )
+            Note.objects.bulk_create(
+                (Note(meeting=meeting, content=" ".join(rng.choices(WORDS, k=rng.randrange(20, 200)))) for meeting in new_meetings if rng.random() < note_ratio),
+                batch_size=1000,
+            )
+
+            # bulk_create skips the signals that keep the search index and project summaries current.
+            call_command("rebuild_search_index", stdout=self.stdout)
+            call_command("rebuild_project_summaries", stdout=self.stdout)
+
+        self.stdout.write(
+            f"Seeded {len(seed_users)} users, {len(new_projects)} projects, {sum(task_counts)} tasks and {len(new_meetings)} meetings."
+        )
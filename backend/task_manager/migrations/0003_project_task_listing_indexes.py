@@ -0,0 +1,37 @@
+# Generated by Django 4.2 on 2026-10-18 17:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0002_project_name_alter_projecttask_unique_together"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="projecttask",
+            index=models.Index(
+                fields=["project", "status", "id"], name="task_project_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="projecttask",
+            index=models.Index(
+                fields=["project", "priority", "id"], name="task_project_priority_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="projecttask",
+            index=models.Index(
+                fields=["project", "is_daily_task", "id"], name="task_project_daily_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="projecttask",
+            index=models.Index(
+                fields=["project", "deadline", "id"], name="task_project_deadline_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2 on 2026-10-18 18:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0003_project_task_listing_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyTaskHistory",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("completed", models.BooleanField()),
+                (
+                    "task",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_history",
+                        to="task_manager.projecttask",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("task", "day")},
+            },
+        ),
+    ]
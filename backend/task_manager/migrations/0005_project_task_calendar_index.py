@@ -0,0 +1,20 @@
+# Generated by Django 4.2 on 2026-10-18 18:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0004_daily_task_history"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="projecttask",
+            index=models.Index(
+                fields=["project", "calendar_linked_date", "id"],
+                name="task_project_calendar_idx",
+            ),
+        ),
+    ]
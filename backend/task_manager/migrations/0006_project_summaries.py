@@ -0,0 +1,94 @@
+# Generated by Django 4.2 on 2026-10-18 18:31
+
+from django.db import migrations, models
+from django.db.models import Count
+import django.db.models.deletion
+
+
+def count_existing_tasks(apps, schema_editor):
+    ProjectTask = apps.get_model("task_manager", "ProjectTask")
+    ProjectStatusSummary = apps.get_model("task_manager", "ProjectStatusSummary")
+    ProjectDeadlineSummary = apps.get_model("task_manager", "ProjectDeadlineSummary")
+
+    by_status = ProjectTask.objects.values("project_id", "status", "priority").annotate(n=Count("id")).order_by()
+    ProjectStatusSummary.objects.bulk_create(
+        (ProjectStatusSummary(project_id=row["project_id"], status=row["status"], priority=row["priority"], task_count=row["n"]) for row in by_status),
+        batch_size=1000,
+    )
+    # Open (TODO, IN_PROGRESS) tasks only.
+    by_deadline = (
+        ProjectTask.objects.filter(status__in=(0, 1), deadline__isnull=False).values("project_id", "deadline").annotate(n=Count("id")).order_by()
+    )
+    ProjectDeadlineSummary.objects.bulk_create(
+        (ProjectDeadlineSummary(project_id=row["project_id"], deadline=row["deadline"], task_count=row["n"]) for row in by_deadline),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0005_project_task_calendar_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectDeadlineSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("deadline", models.DateField()),
+                ("task_count", models.IntegerField(default=0)),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="deadline_summary",
+                        to="task_manager.project",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("project", "deadline")},
+            },
+        ),
+        migrations.CreateModel(
+            name="ProjectStatusSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "status",
+                    models.IntegerField(choices=[(0, 0), (1, 1), (2, 2), (3, 3)]),
+                ),
+                ("priority", models.IntegerField(choices=[(0, 0), (1, 1), (2, 2)])),
+                ("task_count", models.IntegerField(default=0)),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="status_summary",
+                        to="task_manager.project",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("project", "status", "priority")},
+            },
+        ),
+        migrations.RunPython(count_existing_tasks, migrations.RunPython.noop),
+    ]
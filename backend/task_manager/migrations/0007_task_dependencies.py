@@ -0,0 +1,104 @@
+# Generated by Django 4.2 on 2026-10-18 18:44
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0006_project_summaries"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskDependency",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "depends_on",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="dependent_edges",
+                        to="task_manager.projecttask",
+                    ),
+                ),
+                (
+                    "task",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="dependency_edges",
+                        to="task_manager.projecttask",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name="projecttask",
+            name="dependencies",
+            field=models.ManyToManyField(
+                related_name="dependents",
+                through="task_manager.TaskDependency",
+                through_fields=("task", "depends_on"),
+                to="task_manager.projecttask",
+            ),
+        ),
+        migrations.CreateModel(
+            name="TaskClosure",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("paths", models.BigIntegerField()),
+                (
+                    "ancestor",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="task_manager.projecttask",
+                    ),
+                ),
+                (
+                    "descendant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="task_manager.projecttask",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["descendant", "ancestor"],
+                        name="task_closure_descendant_idx",
+                    )
+                ],
+                "unique_together": {("ancestor", "descendant")},
+            },
+        ),
+        migrations.AddIndex(
+            model_name="taskdependency",
+            index=models.Index(
+                fields=["depends_on", "task"], name="task_dependency_reverse_idx"
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="taskdependency",
+            unique_together={("task", "depends_on")},
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2 on 2026-10-18 19:20
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("task_manager", "0007_task_dependencies"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="projecttask",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(fields=["user", "updated_at"], name="project_user_updated_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="projecttask",
+            index=models.Index(fields=["project", "updated_at"], name="task_project_updated_idx"),
+        ),
+    ]
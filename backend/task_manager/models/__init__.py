@@ -0,0 +1,5 @@
+from .project import Project
+from .project_task import ProjectTask
+from .daily_task_history import DailyTaskHistory
+from .project_summary import ProjectDeadlineSummary, ProjectStatusSummary
+from .task_dependency import DependencyCycle, TaskClosure, TaskDependency
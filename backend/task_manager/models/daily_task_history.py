@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.contrib.auth.models import User
+from django.db import connection, models, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from authenticator.models import Account
+from .project import Project
+from .project_task import ProjectTask, TaskState, tasks_bulk_updated
+
+
+class DailyTaskHistory(models.Model):
+    """
+    Whether a daily task was completed on a given local day, written by `rollover`
+    just before the task is reset for the next day.
+    """
+
+    task = models.ForeignKey(ProjectTask, on_delete=models.CASCADE, related_name="daily_history")
+    day = models.DateField()
+    completed = models.BooleanField()
+
+    class Meta:
+        unique_together = ("task", "day")
+
+    @classmethod
+    def rollover(cls, now: Optional[datetime] = None) -> dict[str, int]:
+        """
+        Close the day for every user whose local date has moved past their last
+        rollover: record each daily task's completion under the previous local
+        day, then reset completed and in-progress daily tasks to TODO.
+
+        Users are handled per timezone with a few set-based statements each.
+        Running it again on the same local day finds nobody due, and history
+        rows are only ever inserted once, so repeated runs change nothing.
+        """
+        now = now or timezone.now()
+        result = {"users": 0, "recorded": 0, "reset": 0}
+
+        # Users with daily tasks but no account roll over in the default timezone.
+        Account.objects.bulk_create(
+            [
+                Account(user_id=user_id)
+                for user_id in User.objects.filter(account__isnull=True, task__project_task__is_daily_task=True).values_list("id", flat=True).distinct()
+            ],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+
+        for tz_name in Account.objects.values_list("timezone", flat=True).distinct().order_by("timezone"):
+            try:
+                today = now.astimezone(ZoneInfo(tz_name)).date()
+            except (ZoneInfoNotFoundError, ValueError):
+                today = now.astimezone(ZoneInfo("UTC")).date()
+            due = Account.objects.filter(Q(last_rollover_date__isnull=True) | Q(last_rollover_date__lt=today), timezone=tz_name)
+
+            with transaction.atomic():
+                users = len(due.select_for_update().values_list("id", flat=True))
+                if not users:
+                    continue
+                tasks = ProjectTask.objects.filter(is_daily_task=True, project__user__account__in=due)
+                result["users"] += users
+                result["recorded"] += cls._record_day(tz_name, today)
+                result["reset"] += tasks.filter(status__in=[TaskState.COMPLETED, TaskState.IN_PROGRESS]).update(
+                    status=TaskState.TODO, updated_at=timezone.now()
+                )
+                tasks_bulk_updated.send(sender=ProjectTask, task_ids=tasks.values("id"), fields=["status", "updated_at"])
+                due.update(last_rollover_date=today)
+
+        return result
+
+    @classmethod
+    def _record_day(cls, tz_name: str, today) -> int:
+        # INSERT ... SELECT keeps the copy inside the database; ON CONFLICT makes
+        # a day that was already recorded a no-op.
+        sql = f"""
+            INSERT INTO {cls._meta.db_table} (task_id, day, completed)
+            SELECT t.id, %s, t.status = %s
+            FROM {ProjectTask._meta.db_table} AS t
+            JOIN {Project._meta.db_table} AS p ON p.id = t.project_id
+            JOIN {Account._meta.db_table} AS a ON a.user_id = p.user_id
+            WHERE t.is_daily_task AND a.timezone = %s AND (a.last_rollover_date IS NULL OR a.last_rollover_date < %s)
+            ON CONFLICT (task_id, day) DO NOTHING
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [today - timedelta(days=1), TaskState.COMPLETED, tz_name, today])
+            return cursor.rowcount
@@ -1,8 +1,9 @@
 from django.db import models
-from django.db.models import QuerySet
-from typing import Optional
+from django.db.models import Prefetch, QuerySet
+from typing import Iterable, Iterator, Optional
 from django.contrib.auth.models import User
-from .project_task import ProjectTask, TaskSchema
+from alarmclock.streaming import iter_chunks
+from .project_task import ProjectTask, TaskSchema, TASK_ROW_FIELDS
 from pydantic import BaseModel
 
 
@@ -15,16 +16,27 @@ class ProjectSchema(BaseModel):
     tasks: list[TaskSchema]
 
 
+# Columns for the values_list() fast path, in ProjectSchema field order (tasks excluded).
+PROJECT_ROW_FIELDS = ("id", "user__username", "user__email", "display_name", "description")
+
+
 # Create your models here.
 class Project(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="task")
     name = models.TextField(null=False, default="Default Project")
     display_name = models.TextField(null=False, default="Default Project")
     description = models.TextField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # Delta sync (see the sync app) reads a user's projects changed since a cursor.
+        indexes = [models.Index(fields=["user", "updated_at"], name="project_user_updated_idx")]
 
     def serialize(self: "Project") -> ProjectSchema:
         try:
-            linked_tasks: list[ProjectTask] = list(ProjectTask.objects.filter(project=self))
+            # Uses the prefetched tasks when loaded through `with_related`, and the
+            # reverse manager keeps `task.project` pointing at `self` either way.
+            linked_tasks: list[ProjectTask] = list(self.project_task.all())
             return ProjectSchema(
                 id=self.pk,
                 owner_username=self.user.username,
@@ -40,17 +52,58 @@ class Project(models.Model):
         except Exception as e:
             return {}
 
+    @classmethod
+    def with_related(cls) -> QuerySet["Project"]:
+        """
+        Projects with their owner joined and tasks prefetched, so serializing any
+        number of them costs two queries in total.
+        """
+        return cls.objects.select_related("user").prefetch_related(
+            Prefetch("project_task", queryset=ProjectTask.objects.order_by("id")),
+        )
+
+    @staticmethod
+    def rows_to_dicts(project_rows: Iterable[tuple], task_rows: Iterable[tuple]) -> list[dict]:
+        """
+        What `serialize().model_dump()` returns for each PROJECT_ROW_FIELDS row,
+        with its tasks picked out of TASK_ROW_FIELDS rows by project id.
+        """
+        tasks_by_project: dict[int, list[dict]] = {}
+        for row in task_rows:
+            tasks_by_project.setdefault(row[2], []).append(ProjectTask.row_to_dict(row))
+
+        return [
+            {
+                "id": project_id,
+                "owner_username": owner_username,
+                "owner_email": owner_email,
+                "display_name": display_name,
+                "description": description,
+                "tasks": tasks_by_project.get(project_id, []),
+            }
+            for project_id, owner_username, owner_email, display_name, description in project_rows
+        ]
+
     @classmethod
     def get_project_list_for_user(cls, user_id: int) -> list:
-        try:
-            user: User = User.objects.get(id=user_id)
-        except User.DoesNotExist:
-            return []
-        except Exception as e:
-            return []
+        project_rows = cls.objects.filter(user_id=user_id).order_by("id").values_list(*PROJECT_ROW_FIELDS)
+        task_rows = ProjectTask.objects.filter(project__user_id=user_id).order_by("id").values_list(*TASK_ROW_FIELDS)
+        return cls.rows_to_dicts(project_rows, task_rows)
 
-        project_list: QuerySet[Project] = cls.objects.filter(user=user)
-        return [p.serialize().model_dump() for p in project_list]
+    @classmethod
+    async def aget_project_list_for_user(cls, user_id: int) -> list:
+        """`get_project_list_for_user` on Django's async ORM API."""
+        project_rows = [row async for row in cls.objects.filter(user_id=user_id).order_by("id").values_list(*PROJECT_ROW_FIELDS)]
+        task_rows = [row async for row in ProjectTask.objects.filter(project__user_id=user_id).order_by("id").values_list(*TASK_ROW_FIELDS)]
+        return cls.rows_to_dicts(project_rows, task_rows)
+
+    @classmethod
+    def iter_project_list_for_user(cls, user_id: int, chunk_size: int) -> Iterator[dict]:
+        """Same rows as `get_project_list_for_user`, fetched `chunk_size` projects at a time."""
+        project_rows = cls.objects.filter(user_id=user_id).order_by("id").values_list(*PROJECT_ROW_FIELDS)
+        for chunk in iter_chunks(project_rows.iterator(chunk_size=chunk_size), chunk_size):
+            task_rows = ProjectTask.objects.filter(project_id__in=[row[0] for row in chunk]).order_by("id").values_list(*TASK_ROW_FIELDS)
+            yield from cls.rows_to_dicts(chunk, task_rows)
 
     @classmethod
     def create(cls, user_id: int, display_name: str, description: Optional[str]) -> "Project":
@@ -0,0 +1,166 @@
+from datetime import date
+from typing import Iterable, Optional
+
+from django.db import connection, models, transaction
+from django.db.models import Sum
+
+from .project import Project
+from .project_task import PRIORITY_CHOICES, STATUS_CHOICES, ProjectTask, TaskState
+
+# Tasks still to be done; only these can be overdue.
+OPEN_STATES = (TaskState.TODO, TaskState.IN_PROGRESS)
+
+
+def _upsert_increment(table: str, key_columns: tuple[str, ...], rows: Iterable[tuple]) -> None:
+    """Add each row's last value to the task_count of the row with its key, creating it if missing."""
+    rows = list(rows)
+    if not rows:
+        return
+    columns = ", ".join(key_columns)
+    placeholders = ", ".join(["%s"] * (len(key_columns) + 1))
+    sql = f"""
+        INSERT INTO {table} ({columns}, task_count) VALUES ({placeholders})
+        ON CONFLICT ({columns}) DO UPDATE SET task_count = {table}.task_count + excluded.task_count
+    """
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, rows)
+
+
+class ProjectStatusSummary(models.Model):
+    """
+    Number of tasks per project, status and priority.
+
+    Kept current by the task signals (see task_manager.signals): single-task
+    writes apply a -1/+1 delta, set-based writes recount the affected projects.
+    `recount` (the rebuild_project_summaries command) repairs drift.
+    """
+
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="status_summary")
+    status = models.IntegerField(choices=STATUS_CHOICES)
+    priority = models.IntegerField(choices=PRIORITY_CHOICES)
+    task_count = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ("project", "status", "priority")
+
+    @staticmethod
+    def task_key(values: dict) -> Optional[tuple]:
+        try:
+            return values["project_id"], values["status"], values["priority"]
+        except KeyError:
+            return None
+
+    @classmethod
+    def apply(cls, old: Optional[tuple], new: Optional[tuple]) -> None:
+        """Move one task from the `old` key to the `new` key; either may be None."""
+        if old == new:
+            return
+        if old is not None:
+            # Decrements never create rows, so a task deleted along with its
+            # project cannot bring back a summary row the cascade removed.
+            project_id, status, priority = old
+            cls.objects.filter(project_id=project_id, status=status, priority=priority).update(task_count=models.F("task_count") - 1)
+        if new is not None:
+            _upsert_increment(cls._meta.db_table, ("project_id", "status", "priority"), [(*new, 1)])
+
+    @classmethod
+    def recount(cls, project_ids: Optional[Iterable[int]] = None) -> None:
+        """Recount the given projects (all projects when None) from their tasks."""
+        tasks = ProjectTask.objects.all()
+        summaries = cls.objects.all()
+        if project_ids is not None:
+            tasks, summaries = tasks.filter(project_id__in=project_ids), summaries.filter(project_id__in=project_ids)
+        counts = tasks.values("project_id", "status", "priority").annotate(n=models.Count("id")).order_by()
+        with transaction.atomic():
+            summaries.delete()
+            cls.objects.bulk_create(
+                (cls(project_id=row["project_id"], status=row["status"], priority=row["priority"], task_count=row["n"]) for row in counts),
+                batch_size=1000,
+            )
+
+    @classmethod
+    def get_summaries_for_user(cls, user_id: int, today: date) -> list[dict]:
+        """
+        Task counts of each of the user's projects by status, by priority and by
+        both, with the open tasks due before `today`. Reads only summary rows.
+        """
+        projects = {
+            project_id: {
+                "id": project_id,
+                "display_name": display_name,
+                "total": 0,
+                "overdue": 0,
+                "by_status": [0] * len(STATUS_CHOICES),
+                "by_priority": [0] * len(PRIORITY_CHOICES),
+                # matrix[status][priority]
+                "matrix": [[0] * len(PRIORITY_CHOICES) for _ in STATUS_CHOICES],
+            }
+            for project_id, display_name in Project.objects.filter(user_id=user_id).order_by("id").values_list("id", "display_name")
+        }
+
+        counts = cls.objects.filter(project__user_id=user_id, task_count__gt=0)
+        for project_id, status, priority, task_count in counts.values_list("project_id", "status", "priority", "task_count"):
+            summary = projects[project_id]
+            summary["total"] += task_count
+            summary["by_status"][status] += task_count
+            summary["by_priority"][priority] += task_count
+            summary["matrix"][status][priority] += task_count
+
+        overdue = (
+            ProjectDeadlineSummary.objects.filter(project__user_id=user_id, deadline__lt=today)
+            .values("project_id")
+            .annotate(n=Sum("task_count"))
+            .order_by()
+        )
+        for row in overdue:
+            projects[row["project_id"]]["overdue"] = row["n"]
+
+        return list(projects.values())
+
+
+class ProjectDeadlineSummary(models.Model):
+    """
+    Number of open tasks per project and deadline, so the overdue count of a
+    project is a sum over its past deadlines rather than a scan of its tasks.
+    Maintained alongside ProjectStatusSummary.
+    """
+
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="deadline_summary")
+    deadline = models.DateField()
+    task_count = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ("project", "deadline")
+
+    @staticmethod
+    def task_key(values: dict) -> Optional[tuple]:
+        try:
+            if values["deadline"] is None or values["status"] not in OPEN_STATES:
+                return None
+            return values["project_id"], values["deadline"]
+        except KeyError:
+            return None
+
+    @classmethod
+    def apply(cls, old: Optional[tuple], new: Optional[tuple]) -> None:
+        if old == new:
+            return
+        if old is not None:
+            project_id, deadline = old
+            cls.objects.filter(project_id=project_id, deadline=deadline).update(task_count=models.F("task_count") - 1)
+        if new is not None:
+            _upsert_increment(cls._meta.db_table, ("project_id", "deadline"), [(*new, 1)])
+
+    @classmethod
+    def recount(cls, project_ids: Optional[Iterable[int]] = None) -> None:
+        tasks = ProjectTask.objects.filter(status__in=OPEN_STATES, deadline__isnull=False)
+        summaries = cls.objects.all()
+        if project_ids is not None:
+            tasks, summaries = tasks.filter(project_id__in=project_ids), summaries.filter(project_id__in=project_ids)
+        counts = tasks.values("project_id", "deadline").annotate(n=models.Count("id")).order_by()
+        with transaction.atomic():
+            summaries.delete()
+            cls.objects.bulk_create(
+                (cls(project_id=row["project_id"], deadline=row["deadline"], task_count=row["n"]) for row in counts),
+                batch_size=1000,
+            )
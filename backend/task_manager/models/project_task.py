@@ -1,4 +1,11 @@
-from django.db import models
+from datetime import date
+from typing import Iterator, Optional
+
+from django.db import models, transaction
+from django.db.models import Count, F, Q, QuerySet, Window
+from django.db.models.functions import Coalesce, RowNumber
+from django.dispatch import Signal
+from django.utils import timezone
 from django.contrib.auth.models import User
 from pydantic import BaseModel
 
@@ -14,6 +21,24 @@ class TaskSchema(BaseModel):
     is_daily_task: int
 
 
+def task_row_fields(prefix: str = "") -> tuple[str, ...]:
+    """
+    Columns for the values_list() fast path, in TaskSchema field order.
+    `prefix` reaches the task through a relation, e.g. "projecttask__".
+    """
+    fields = ("id", "project__display_name", "project_id", "title", "priority", "status", "description", "is_daily_task")
+    return tuple(prefix + field for field in fields)
+
+
+TASK_ROW_FIELDS = task_row_fields()
+
+# Sent with `task_ids` after set-based writes (bulk_create, queryset.update) that
+# bypass save() and so the per-row post_save receivers. `task_ids` may be a list or
+# an id queryset; `fields`, when given, names the only columns that were written;
+# `previous_project_ids`, when tasks were moved, the projects they were moved from.
+tasks_bulk_updated = Signal()
+
+
 class PriorityChoices:
     HIGH = 0
     MEDIUM = 1
@@ -57,10 +82,39 @@ class ProjectTask(models.Model):
     is_daily_task = models.BooleanField(default=False)
     deadline = models.DateField(null=True)
     calendar_linked_date = models.DateField(null=True)
-    # dependencies = models.ManyToManyField("Task", related_name="dependencies")
+    # Set-based writes must set this themselves; auto_now only applies to save().
+    updated_at = models.DateTimeField(auto_now=True)
+    # Edited through TaskDependency.link/unlink, which maintain the transitive closure.
+    dependencies = models.ManyToManyField(
+        "self", symmetrical=False, through="TaskDependency", through_fields=("task", "depends_on"), related_name="dependents"
+    )
 
     class Meta:
         unique_together = ("project", "title")
+        # Task listings are always scoped to the owner's projects and walked in id
+        # order (keyset pagination), so each filter column sits between the
+        # project and the id.
+        indexes = [
+            models.Index(fields=["project", "status", "id"], name="task_project_status_idx"),
+            models.Index(fields=["project", "priority", "id"], name="task_project_priority_idx"),
+            models.Index(fields=["project", "is_daily_task", "id"], name="task_project_daily_idx"),
+            models.Index(fields=["project", "deadline", "id"], name="task_project_deadline_idx"),
+            models.Index(fields=["project", "calendar_linked_date", "id"], name="task_project_calendar_idx"),
+            models.Index(fields=["project", "updated_at"], name="task_project_updated_idx"),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember what was loaded so signal handlers can tell what a save changed.
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # The post_save receivers have compared against the previous values; the
+        # next save compares against these.
+        self._loaded_values = {field.attname: getattr(self, field.attname) for field in self._meta.concrete_fields}
 
     def serialize(self) -> TaskSchema:
         return TaskSchema(
@@ -74,6 +128,28 @@ class ProjectTask(models.Model):
             is_daily_task=self.is_daily_task,
         )
 
+    @staticmethod
+    def row_to_dict(row: tuple) -> dict:
+        """
+        What `serialize().model_dump()` returns, built directly from a
+        TASK_ROW_FIELDS row without loading a model or validating a schema.
+        """
+        task_id, project_name, project_id, title, priority, status, description, is_daily_task = row
+        return {
+            "id": task_id,
+            "project_name": project_name,
+            "project_id": project_id,
+            "title": title,
+            "priority": priority,
+            "status": status,
+            "description": description,
+            "is_daily_task": int(is_daily_task),
+        }
+
+    @classmethod
+    def serialize_queryset(cls, tasks: QuerySet["ProjectTask"]) -> list[dict]:
+        return [cls.row_to_dict(row) for row in tasks.values_list(*TASK_ROW_FIELDS)]
+
     @classmethod
     def create(cls, project: "Project", task_data: dict, **kwargs) -> tuple["ProjectTask", bool]:
         task = cls.objects.filter(project=project, title=task_data["title"]).first()
@@ -101,15 +177,185 @@ class ProjectTask(models.Model):
 
         return task, created
 
+    @classmethod
+    def bulk_upsert(cls, project: "Project", items: list[dict], batch_size: int = 500) -> dict[str, tuple[int, bool]]:
+        """
+        Insert or update many tasks of one project, keyed on the (project, title)
+        uniqueness, with set-based statements inside a single transaction.
+
+        `items` are `create`-style task dicts with distinct titles. Returns
+        {title: (task id, created)}.
+        """
+        titles = [item["title"] for item in items]
+        with transaction.atomic():
+            existing: set[str] = set()
+            for start in range(0, len(titles), batch_size):
+                existing.update(
+                    cls.objects.filter(project=project, title__in=titles[start : start + batch_size]).values_list("title", flat=True)
+                )
+
+            cls.objects.bulk_create(
+                [cls(project=project, **item) for item in items],
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=["project", "title"],
+                update_fields=["description", "priority", "status", "is_daily_task", "deadline", "updated_at"],
+            )
+
+            ids: dict[str, int] = {}
+            for start in range(0, len(titles), batch_size):
+                ids.update(cls.objects.filter(project=project, title__in=titles[start : start + batch_size]).values_list("title", "id"))
+
+            tasks_bulk_updated.send(sender=cls, task_ids=list(ids.values()))
+
+        return {title: (ids[title], title not in existing) for title in titles}
+
+    @classmethod
+    def batch_update(cls, user_id: int, changes: dict, task_ids: Optional[list[int]] = None, max_tasks: Optional[int] = None, **filters) -> int:
+        """
+        Apply `changes` (status, priority and/or project_id) to the user's tasks
+        in `task_ids`, or else to those matching `filter_for_user` `filters`,
+        with one UPDATE. Returns how many tasks were updated.
+
+        The tasks are looked up and their ownership checked in a single query:
+        raises ProjectTask.DoesNotExist if any of `task_ids` is not the user's,
+        Project.DoesNotExist if project_id is not, and ValueError if more than
+        `max_tasks` match. Moving a task into a project that already has one of
+        its title raises IntegrityError.
+        """
+        from task_manager.models.project import Project
+
+        tasks = cls.objects.filter(project__user_id=user_id, id__in=task_ids) if task_ids is not None else cls.filter_for_user(user_id, **filters)
+        with transaction.atomic():
+            rows = tasks.order_by("id").values_list("id", "project_id")
+            found = dict(rows if max_tasks is None else rows[: max_tasks + 1])
+            if task_ids is not None and len(found) < len(set(task_ids)):
+                raise cls.DoesNotExist("Tasks not found: %s" % sorted(set(task_ids) - found.keys()))
+            if max_tasks is not None and len(found) > max_tasks:
+                raise ValueError(f"More than {max_tasks} tasks match")
+            if "project_id" in changes and not Project.objects.filter(id=changes["project_id"], user_id=user_id).exists():
+                raise Project.DoesNotExist(f"Project {changes['project_id']} not found")
+            if not found or not changes:
+                return 0
+
+            updated = cls.objects.filter(id__in=list(found)).update(**changes, updated_at=timezone.now())
+            fields = [name.removesuffix("_id") for name in changes] + ["updated_at"]
+            previous_project_ids = set(found.values()) if "project_id" in changes else None
+            tasks_bulk_updated.send(sender=cls, task_ids=list(found), fields=fields, previous_project_ids=previous_project_ids)
+        return updated
+
     @classmethod
     def get_all_tasks(cls, project: "Project") -> list[dict]:
-        all_tasks = cls.objects.select_related("project").filter(project=project)
-        return [task.serialize().model_dump() for task in all_tasks]
+        return cls.serialize_queryset(cls.objects.filter(project=project))
+
+    @classmethod
+    def get_task_for_user(cls, user_id: int) -> list[dict]:
+        return cls.serialize_queryset(cls.objects.filter(project__user_id=user_id))
+
+    @classmethod
+    def filter_for_user(
+        cls,
+        user_id: int,
+        status: Optional[int] = None,
+        priority: Optional[int] = None,
+        is_daily_task: Optional[bool] = None,
+        deadline_from: Optional[date] = None,
+        deadline_to: Optional[date] = None,
+        project_id: Optional[int] = None,
+    ) -> QuerySet["ProjectTask"]:
+        tasks = cls.objects.filter(project__user_id=user_id)
+        if status is not None:
+            tasks = tasks.filter(status=status)
+        if priority is not None:
+            tasks = tasks.filter(priority=priority)
+        if is_daily_task is not None:
+            tasks = tasks.filter(is_daily_task=is_daily_task)
+        if deadline_from is not None:
+            tasks = tasks.filter(deadline__gte=deadline_from)
+        if deadline_to is not None:
+            tasks = tasks.filter(deadline__lte=deadline_to)
+        if project_id is not None:
+            tasks = tasks.filter(project_id=project_id)
+        return tasks
+
+    @classmethod
+    def task_page_queryset(cls, user_id: int, cursor: Optional[int] = None, **filters) -> QuerySet["ProjectTask"]:
+        tasks = cls.filter_for_user(user_id, **filters).order_by("id")
+        if cursor is not None:
+            tasks = tasks.filter(id__gt=cursor)
+        return tasks
 
     @classmethod
-    def get_task_for_user(cls, user_id: int) -> "ProjectTask":
-        tasks = cls.objects.select_related("project").filter(project__user_id=user_id)
-        return [task.serialize().model_dump() for task in tasks]
+    def get_task_page_for_user(
+        cls, user_id: int, limit: int, cursor: Optional[int] = None, **filters
+    ) -> tuple[list[dict], Optional[int]]:
+        """
+        One page of a user's tasks in id order, starting after `cursor`.
+
+        Returns the serialized page and the cursor for the next one (None on the
+        last page). One extra row is fetched to tell whether another page exists.
+        """
+        page: list[tuple] = list(cls.task_page_queryset(user_id, cursor, **filters).values_list(*TASK_ROW_FIELDS)[: limit + 1])
+        next_cursor = page[limit - 1][0] if len(page) > limit else None
+        return [cls.row_to_dict(row) for row in page[:limit]], next_cursor
+
+    @classmethod
+    async def aget_task_page_for_user(
+        cls, user_id: int, limit: int, cursor: Optional[int] = None, **filters
+    ) -> tuple[list[dict], Optional[int]]:
+        """`get_task_page_for_user` on Django's async ORM API."""
+        page = [row async for row in cls.task_page_queryset(user_id, cursor, **filters).values_list(*TASK_ROW_FIELDS)[: limit + 1]]
+        next_cursor = page[limit - 1][0] if len(page) > limit else None
+        return [cls.row_to_dict(row) for row in page[:limit]], next_cursor
+
+    @classmethod
+    def iter_task_page_for_user(
+        cls, user_id: int, limit: int, chunk_size: int, cursor: Optional[int] = None, **filters
+    ) -> tuple[Iterator[dict], Optional[int]]:
+        """
+        Streaming counterpart of `get_task_page_for_user`. The next cursor is
+        looked up first from the ids alone so the rows can be emitted as fetched.
+        """
+        tasks = cls.task_page_queryset(user_id, cursor, **filters)
+        boundary = list(tasks.values_list("id", flat=True)[limit - 1 : limit + 1])
+        next_cursor = boundary[0] if len(boundary) > 1 else None
+        rows = (cls.row_to_dict(row) for row in tasks.values_list(*TASK_ROW_FIELDS)[:limit].iterator(chunk_size=chunk_size))
+        return rows, next_cursor
+
+    @classmethod
+    def get_calendar_for_user(cls, user_id: int, start: date, end: date, top: int) -> dict[date, dict]:
+        """
+        Per-day task counts over [start, end) and the first `top` tasks of each
+        day (none for 0), open tasks first, then by priority.
+
+        A task sits on its calendar_linked_date, or on its deadline when it is
+        not linked to a day. Counts and ranks are window functions over the same
+        grouped rows, so the whole range is one query whatever the task count.
+        """
+        day = Coalesce("calendar_linked_date", "deadline")
+        by_day = {"partition_by": [day]}
+        rows = (
+            cls.objects.filter(project__user_id=user_id)
+            # Each branch is a range scan on one of the (project, date) indexes.
+            .filter(Q(calendar_linked_date__gte=start, calendar_linked_date__lt=end) | Q(deadline__gte=start, deadline__lt=end))
+            .annotate(
+                day=day,
+                rank=Window(RowNumber(), order_by=[F("status").asc(), F("priority").asc(), F("id").asc()], **by_day),
+                day_count=Window(Count("id"), **by_day),
+                completed_count=Window(Count("id", filter=Q(status=TaskState.COMPLETED)), **by_day),
+            )
+            # Each day's first row carries its counts even when no tasks are wanted.
+            .filter(day__gte=start, day__lt=end, rank__lte=max(top, 1))
+            .order_by("day", "rank")
+            .values_list("day", "rank", "day_count", "completed_count", *TASK_ROW_FIELDS)
+        )
+
+        days: dict[date, dict] = {}
+        for task_day, rank, day_count, completed_count, *task_row in rows:
+            entry = days.setdefault(task_day, {"task_count": day_count, "completed_count": completed_count, "tasks": []})
+            if rank <= top:
+                entry["tasks"].append(cls.row_to_dict(task_row))
+        return days
 
     def update_task(self, task_data: dict) -> None:
         from task_manager.models.project import Project
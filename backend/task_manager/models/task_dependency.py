@@ -0,0 +1,167 @@
+from typing import Iterable
+
+from django.contrib.auth.models import User
+from django.db import connection, models, transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from .project_task import TASK_ROW_FIELDS, ProjectTask, TaskState
+
+# States in which a task no longer holds up the tasks depending on it.
+DONE_STATES = (TaskState.COMPLETED, TaskState.DROPPED)
+
+
+class DependencyCycle(Exception):
+    """A dependency would make a task (transitively) depend on itself."""
+
+    def __init__(self, task_id: int, depends_on_id: int):
+        super().__init__(f"Task {task_id} cannot depend on task {depends_on_id}: that would create a cycle")
+        self.task_id = task_id
+        self.depends_on_id = depends_on_id
+
+
+class TaskClosure(models.Model):
+    """
+    The transitive closure of TaskDependency: one row per pair of tasks where
+    `ancestor` must be done before `descendant`, however indirectly, with the
+    number of distinct dependency paths between them. Counting paths lets an
+    edge be removed by subtracting the paths that went through it, instead of
+    recomputing the closure.
+    """
+
+    ancestor = models.ForeignKey(ProjectTask, on_delete=models.CASCADE, related_name="+")
+    descendant = models.ForeignKey(ProjectTask, on_delete=models.CASCADE, related_name="+")
+    paths = models.BigIntegerField()
+
+    class Meta:
+        unique_together = ("ancestor", "descendant")
+        indexes = [models.Index(fields=["descendant", "ancestor"], name="task_closure_descendant_idx")]
+
+
+class TaskDependency(models.Model):
+    """`task` cannot be done before `depends_on`. Only edit through `link`/`unlink`, which keep TaskClosure in step."""
+
+    task = models.ForeignKey(ProjectTask, on_delete=models.CASCADE, related_name="dependency_edges")
+    depends_on = models.ForeignKey(ProjectTask, on_delete=models.CASCADE, related_name="dependent_edges")
+
+    class Meta:
+        unique_together = ("task", "depends_on")
+        indexes = [models.Index(fields=["depends_on", "task"], name="task_dependency_reverse_idx")]
+
+    @classmethod
+    def link(cls, task: ProjectTask, depends_on_ids: Iterable[int]) -> set[int]:
+        """
+        Make `task` depend on each of `depends_on_ids` (tasks of the same owner;
+        other ids are ignored). Returns the ids actually added; raises
+        DependencyCycle, adding nothing, if any of them would close a loop.
+        """
+        owner_id = task.project.user_id
+        with transaction.atomic():
+            # Serialises graph edits per owner, so two links cannot race into a cycle.
+            list(User.objects.select_for_update().filter(pk=owner_id).values_list("pk", flat=True))
+            candidates = set(ProjectTask.objects.filter(id__in=list(depends_on_ids), project__user_id=owner_id).values_list("id", flat=True))
+            existing = set(cls.objects.filter(task=task, depends_on_id__in=candidates).values_list("depends_on_id", flat=True))
+            added = candidates - existing
+            for depends_on_id in sorted(added):
+                # A cycle needs `task` to already be (or come) before `depends_on`.
+                if depends_on_id == task.pk or TaskClosure.objects.filter(ancestor_id=task.pk, descendant_id=depends_on_id).exists():
+                    raise DependencyCycle(task.pk, depends_on_id)
+                cls.objects.create(task=task, depends_on_id=depends_on_id)
+                cls._adjust_closure(depends_on_id, task.pk, +1)
+        return added
+
+    @classmethod
+    def unlink(cls, task: ProjectTask, depends_on_ids: Iterable[int]) -> set[int]:
+        """Remove the given dependencies of `task`; returns the ids actually removed."""
+        with transaction.atomic():
+            removed = set(cls.objects.filter(task=task, depends_on_id__in=list(depends_on_ids)).values_list("depends_on_id", flat=True))
+            for depends_on_id in sorted(removed):
+                cls.objects.filter(task=task, depends_on_id=depends_on_id).delete()
+                cls._adjust_closure(depends_on_id, task.pk, -1)
+        return removed
+
+    @classmethod
+    def unlink_all(cls, task: ProjectTask) -> None:
+        """
+        Drop the paths running through `task` before it is deleted. Once its own
+        prerequisites are unlinked no path passes through it, and the rows that
+        start or end at it go with the task.
+        """
+        cls.unlink(task, cls.objects.filter(task=task).values_list("depends_on_id", flat=True))
+
+    @staticmethod
+    def _adjust_closure(before_id: int, after_id: int, sign: int) -> None:
+        """
+        Add (sign=+1) or remove (sign=-1) the paths created by the edge
+        before -> after: every ancestor of `before` (and `before` itself) reaches
+        every descendant of `after` (and `after` itself) through it, as many
+        times as the product of the path counts on either side.
+        """
+        table = TaskClosure._meta.db_table
+        ancestors = f"SELECT ancestor_id AS x, paths AS p FROM {table} WHERE descendant_id = %s UNION ALL SELECT %s, 1"
+        descendants = f"SELECT descendant_id AS y, paths AS q FROM {table} WHERE ancestor_id = %s UNION ALL SELECT %s, 1"
+        params = [before_id, before_id, after_id, after_id]
+
+        with connection.cursor() as cursor:
+            if sign > 0:
+                # WHERE TRUE lets SQLite tell the ON CONFLICT clause from a join constraint.
+                cursor.execute(
+                    f"""
+                    INSERT INTO {table} (ancestor_id, descendant_id, paths)
+                    SELECT a.x, d.y, a.p * d.q FROM ({ancestors}) AS a CROSS JOIN ({descendants}) AS d WHERE TRUE
+                    ON CONFLICT (ancestor_id, descendant_id) DO UPDATE SET paths = {table}.paths + excluded.paths
+                    """,
+                    params,
+                )
+                return
+            # Neither side's rows change here: that would need the edge to lie on a cycle.
+            affected = f"ancestor_id IN (SELECT x FROM ({ancestors}) AS a2) AND descendant_id IN (SELECT y FROM ({descendants}) AS d2)"
+            cursor.execute(
+                f"""
+                UPDATE {table} SET paths = paths - (
+                    SELECT a.p * d.q FROM ({ancestors}) AS a CROSS JOIN ({descendants}) AS d
+                    WHERE a.x = {table}.ancestor_id AND d.y = {table}.descendant_id
+                )
+                WHERE {affected}
+                """,
+                params * 2,
+            )
+            cursor.execute(f"DELETE FROM {table} WHERE paths <= 0 AND {affected}", params)
+
+    @staticmethod
+    def get_dependency_data(task: ProjectTask) -> dict:
+        """
+        Whether `task` is blocked, the unfinished tasks blocking it (directly or
+        not), its direct prerequisites and the tasks directly depending on it.
+        """
+        ancestors = TaskClosure.objects.filter(descendant_id=task.pk).values("ancestor_id")
+        blocked_by = ProjectTask.objects.filter(id__in=ancestors).exclude(status__in=DONE_STATES)
+        depends_on = TaskDependency.objects.filter(task=task).values("depends_on_id")
+        unblocks = ProjectTask.objects.filter(id__in=TaskDependency.objects.filter(depends_on=task).values("task_id"))
+
+        blocked_rows = [ProjectTask.row_to_dict(row) for row in blocked_by.order_by("id").values_list(*TASK_ROW_FIELDS)]
+        return {
+            "blocked": bool(blocked_rows),
+            "blocked_by": blocked_rows,
+            "depends_on": sorted(row["depends_on_id"] for row in depends_on),
+            "unblocks": [ProjectTask.row_to_dict(row) for row in unblocks.order_by("id").values_list(*TASK_ROW_FIELDS)],
+        }
+
+    @staticmethod
+    def is_blocked(task_id: int) -> bool:
+        return TaskClosure.objects.filter(descendant_id=task_id).exclude(ancestor__status__in=DONE_STATES).exists()
+
+    @staticmethod
+    def topological_order(project_id: int) -> list[dict]:
+        """
+        The project's tasks, each after everything it depends on. A task's
+        prerequisites are a strict subset of its dependents' prerequisites, so
+        sorting by the number of prerequisites is a topological order.
+        """
+        prerequisites = TaskClosure.objects.filter(descendant_id=OuterRef("pk")).values("descendant_id").annotate(n=Count("*")).values("n")
+        tasks = (
+            ProjectTask.objects.filter(project_id=project_id)
+            .annotate(prerequisites=Coalesce(Subquery(prerequisites), 0))
+            .order_by("prerequisites", "id")
+        )
+        return [ProjectTask.row_to_dict(row) for row in tasks.values_list(*TASK_ROW_FIELDS)]
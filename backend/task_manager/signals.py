@@ -0,0 +1,137 @@
+from typing import Optional
+
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from alarmclock import events, response_cache
+from .models.project import Project
+from .models.project_summary import ProjectDeadlineSummary, ProjectStatusSummary
+from .models.project_task import ProjectTask, tasks_bulk_updated
+from .models.task_dependency import TaskDependency
+
+SUMMARY_MODELS = (ProjectStatusSummary, ProjectDeadlineSummary)
+# Task columns the summaries are keyed on.
+SUMMARY_FIELDS = ("project_id", "status", "priority", "deadline")
+
+
+def linked_meeting_ids(**filters) -> list[int]:
+    return list(ProjectTask.meetings.through.objects.filter(**filters).values_list("meeting_id", flat=True).distinct())
+
+
+@receiver(post_save, sender=ProjectTask)
+def invalidate_saved_task(sender, instance: ProjectTask, **kwargs):
+    # A task moved between projects changes the payloads of both owners.
+    project_ids = {instance.project_id, getattr(instance, "_loaded_values", {}).get("project_id")}
+    response_cache.bump_users(Project.objects.filter(id__in=project_ids - {None}).values_list("user_id", flat=True))
+    response_cache.bump_meetings(linked_meeting_ids(projecttask=instance.pk))
+
+
+@receiver(pre_delete, sender=ProjectTask)
+def invalidate_deleted_task(sender, instance: ProjectTask, **kwargs):
+    # Runs before the meeting links are deleted along with the task.
+    response_cache.bump_users(Project.objects.filter(id=instance.project_id).values_list("user_id", flat=True))
+    response_cache.bump_meetings(linked_meeting_ids(projecttask=instance.pk))
+
+
+@receiver(tasks_bulk_updated, sender=ProjectTask)
+def invalidate_bulk_updated_tasks(sender, task_ids: list[int], **kwargs):
+    tasks = ProjectTask.objects.filter(id__in=task_ids)
+    response_cache.bump_users(Project.objects.filter(project_task__in=tasks).values_list("user_id", flat=True).distinct())
+    response_cache.bump_meetings(linked_meeting_ids(projecttask__in=tasks))
+
+
+@receiver([post_save, post_delete], sender=Project)
+def invalidate_project(sender, instance: Project, **kwargs):
+    response_cache.bump_users([instance.user_id])
+    if not kwargs.get("created"):
+        # Meeting payloads embed the project name of each linked task.
+        response_cache.bump_meetings(linked_meeting_ids(projecttask__project_id=instance.pk))
+
+
+def summary_values(values: Optional[dict]) -> Optional[dict]:
+    """The summary columns of `values` as stored, or None if any was not loaded."""
+    if values is None or not all(name in values for name in SUMMARY_FIELDS):
+        return None
+    # Views may assign datetimes to the deadline or strings to the choices.
+    return {name: ProjectTask._meta.get_field(name).to_python(values[name]) for name in SUMMARY_FIELDS}
+
+
+def current_values(task: ProjectTask) -> dict:
+    return {name: getattr(task, name) for name in SUMMARY_FIELDS}
+
+
+@receiver(post_save, sender=ProjectTask)
+def update_summaries_on_save(sender, instance: ProjectTask, created: bool, **kwargs):
+    new = summary_values(current_values(instance))
+    old = None if created else summary_values(getattr(instance, "_loaded_values", None))
+    if not created and old is None:
+        # Saved without having been loaded, so what it replaced is unknown.
+        for summary in SUMMARY_MODELS:
+            summary.recount([instance.project_id])
+        return
+    for summary in SUMMARY_MODELS:
+        summary.apply(old and summary.task_key(old), summary.task_key(new))
+
+
+@receiver(post_delete, sender=ProjectTask)
+def update_summaries_on_delete(sender, instance: ProjectTask, **kwargs):
+    old = summary_values(getattr(instance, "_loaded_values", None)) or summary_values(current_values(instance))
+    for summary in SUMMARY_MODELS:
+        summary.apply(summary.task_key(old), None)
+
+
+@receiver(tasks_bulk_updated, sender=ProjectTask)
+def recount_bulk_updated_summaries(sender, task_ids: list[int], fields: Optional[list[str]] = None, previous_project_ids=None, **kwargs):
+    if fields is not None and not {"project", "status", "priority", "deadline"}.intersection(fields):
+        return
+    project_ids = set(ProjectTask.objects.filter(id__in=task_ids).values_list("project_id", flat=True).distinct())
+    # Moved tasks are no longer counted where they were.
+    project_ids.update(previous_project_ids or ())
+    for summary in SUMMARY_MODELS:
+        summary.recount(project_ids)
+
+
+@receiver(pre_delete, sender=ProjectTask)
+def unlink_deleted_task(sender, instance: ProjectTask, **kwargs):
+    TaskDependency.unlink_all(instance)
+
+
+def publish_tasks(tasks) -> None:
+    """Push the rows of `tasks` to their owners and to the meetings they are linked to."""
+    task_ids_by_channel: dict[str, list[int]] = {}
+    for task_id, user_id in tasks.values_list("id", "project__user_id"):
+        task_ids_by_channel.setdefault(events.user_channel(user_id), []).append(task_id)
+    for meeting_id, task_id in ProjectTask.meetings.through.objects.filter(projecttask__in=tasks).values_list("meeting_id", "projecttask_id"):
+        task_ids_by_channel.setdefault(events.meeting_channel(meeting_id), []).append(task_id)
+
+    for channel, task_ids in task_ids_by_channel.items():
+        events.notify(
+            [channel],
+            lambda task_ids=task_ids: {
+                "type": "tasks.saved",
+                "tasks": ProjectTask.serialize_queryset(ProjectTask.objects.filter(id__in=task_ids).order_by("id")),
+            },
+        )
+
+
+@receiver(post_save, sender=ProjectTask)
+def publish_saved_task(sender, instance: ProjectTask, **kwargs):
+    if events.listening():
+        publish_tasks(ProjectTask.objects.filter(pk=instance.pk))
+
+
+@receiver(tasks_bulk_updated, sender=ProjectTask)
+def publish_bulk_updated_tasks(sender, task_ids: list[int], **kwargs):
+    if events.listening():
+        publish_tasks(ProjectTask.objects.filter(id__in=task_ids))
+
+
+@receiver(pre_delete, sender=ProjectTask)
+def publish_deleted_task(sender, instance: ProjectTask, **kwargs):
+    # Runs before the meeting links are deleted along with the task.
+    if not events.listening():
+        return
+    channels = [events.user_channel(user_id) for user_id in Project.objects.filter(id=instance.project_id).values_list("user_id", flat=True)]
+    channels += [events.meeting_channel(meeting_id) for meeting_id in linked_meeting_ids(projecttask=instance.pk)]
+    task_id = instance.pk
+    events.notify(channels, lambda: {"type": "tasks.deleted", "ids": [task_id]})
@@ -1,3 +1,670 @@
-from django.test import TestCase
+import io
+import json
+import tempfile
+import time
+from datetime import date, datetime, timezone
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from alarmclock import response_cache, throttling
+from authenticator.models import Account
+from task_manager.models.project import Project
+from task_manager.management.commands.seed_data import skewed_counts
+from task_manager.models import DailyTaskHistory, DependencyCycle, ProjectDeadlineSummary, ProjectStatusSummary, TaskClosure, TaskDependency
+from task_manager.models.project_task import ProjectTask, TaskState
+
+
+def make_projects(user: User, project_count: int, tasks_per_project: int) -> list[Project]:
+    projects = []
+    for p in range(project_count):
+        project = Project.objects.create(user=user, display_name=f"Project {p}", description="")
+        ProjectTask.objects.bulk_create(
+            ProjectTask(project=project, title=f"Task {t}", description="") for t in range(tasks_per_project)
+        )
+        projects.append(project)
+    return projects
+
+
+class ProjectListTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username="owner", email="owner@example.com")
+
+    def test_project_list_query_count_is_constant(self):
+        make_projects(self.user, project_count=1, tasks_per_project=1)
+        with self.assertNumQueries(2):
+            Project.get_project_list_for_user(user_id=self.user.pk)
+
+        make_projects(self.user, project_count=20, tasks_per_project=10)
+        with self.assertNumQueries(2):
+            project_list = Project.get_project_list_for_user(user_id=self.user.pk)
+
+        self.assertEqual(len(project_list), 21)
+        self.assertEqual(sum(len(p["tasks"]) for p in project_list), 201)
+
+    def test_project_list_shape(self):
+        project = make_projects(self.user, project_count=1, tasks_per_project=2)[0]
+        [serialized] = Project.get_project_list_for_user(user_id=self.user.pk)
+
+        self.assertEqual(serialized["id"], project.pk)
+        self.assertEqual(serialized["owner_username"], "owner")
+        self.assertEqual(serialized["owner_email"], "owner@example.com")
+        self.assertEqual([t["title"] for t in serialized["tasks"]], ["Task 0", "Task 1"])
+        self.assertEqual({t["project_name"] for t in serialized["tasks"]}, {"Project 0"})
+
+    def test_project_list_for_unknown_user_is_empty(self):
+        self.assertEqual(Project.get_project_list_for_user(user_id=12345), [])
+
+    def test_fast_path_matches_model_serialization(self):
+        make_projects(self.user, project_count=2, tasks_per_project=3)
+        ProjectTask.objects.filter(title="Task 1").update(is_daily_task=True)
+
+        expected = [p.serialize().model_dump() for p in Project.with_related().filter(user=self.user).order_by("id")]
+
+        self.assertEqual(Project.get_project_list_for_user(user_id=self.user.pk), expected)
+        self.assertEqual(list(Project.iter_project_list_for_user(user_id=self.user.pk, chunk_size=1)), expected)
+
+
+class TaskListTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username="owner")
+        self.project, self.other_project = make_projects(self.user, project_count=2, tasks_per_project=3)
+        ProjectTask.objects.filter(title="Task 1").update(status=TaskState.COMPLETED, deadline=date(2026, 1, 15))
+
+    def test_pages_follow_cursor_until_exhausted(self):
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = ProjectTask.get_task_page_for_user(user_id=self.user.pk, limit=4, cursor=cursor)
+            seen.extend(t["id"] for t in page)
+            if cursor is None:
+                break
+
+        self.assertEqual(seen, sorted(ProjectTask.objects.values_list("id", flat=True)))
+
+    def test_filters(self):
+        page, cursor = ProjectTask.get_task_page_for_user(
+            user_id=self.user.pk,
+            limit=10,
+            status=TaskState.COMPLETED,
+            deadline_from=date(2026, 1, 1),
+            deadline_to=date(2026, 1, 31),
+            project_id=self.project.pk,
+        )
+        self.assertEqual([(t["project_id"], t["title"]) for t in page], [(self.project.pk, "Task 1")])
+        self.assertIsNone(cursor)
+
+    def test_view_returns_next_cursor_and_rejects_bad_limit(self):
+        url = reverse("task_view", kwargs={"user_id": self.user.pk})
+
+        response = self.client.get(url, {"limit": 5})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["task_list"]), 5)
+        self.assertIsNotNone(response.json()["next_cursor"])
+
+        response = self.client.get(url, {"limit": 0})
+        self.assertEqual(response.status_code, 400)
+
+
+class StreamingListTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username="owner")
+        project = make_projects(self.user, project_count=3, tasks_per_project=4)[0]
+        ProjectTask.objects.create(project=project, title="Ünïcode \u2028 task", description='quote " and \\ slash')
+
+    def assertStreamsIdentically(self, url: str, params: dict):
+        buffered = self.client.get(url, params)
+        streamed = self.client.get(url, {**params, "stream": "1"})
+
+        self.assertTrue(streamed.streaming)
+        self.assertEqual(streamed.status_code, buffered.status_code)
+        self.assertEqual(b"".join(streamed.streaming_content), buffered.content)
+
+    def test_project_list_stream_matches_buffered(self):
+        self.assertStreamsIdentically(reverse("project_view", kwargs={"user_id": self.user.pk}), {})
+
+    def test_task_list_stream_matches_buffered(self):
+        url = reverse("task_view", kwargs={"user_id": self.user.pk})
+        self.assertStreamsIdentically(url, {"limit": 5})
+        self.assertStreamsIdentically(url, {"limit": 50})
+
+
+class AsyncListTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username="owner")
+        make_projects(self.user, project_count=2, tasks_per_project=3)
+
+    async def assertAsyncMatchesSync(self, name: str, params: dict):
+        kwargs = {"user_id": self.user.pk}
+        sync = await self.async_client.get(reverse(name, kwargs=kwargs), params)
+        asynchronous = await self.async_client.get(reverse(f"async_{name}", kwargs=kwargs), params)
+
+        self.assertEqual(asynchronous.status_code, sync.status_code)
+        self.assertEqual(asynchronous.content, sync.content)
+
+    async def test_project_list_matches_sync_view(self):
+        await self.assertAsyncMatchesSync("project_view", {})
+
+    async def test_task_list_matches_sync_view(self):
+        await self.assertAsyncMatchesSync("task_view", {"limit": 2})
+        await self.assertAsyncMatchesSync("task_view", {"limit": 0})
+
+
+class BulkAddTaskTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username="owner")
+        self.project = make_projects(self.user, project_count=1, tasks_per_project=2)[0]
+        self.url = reverse("bulk_add_task", kwargs={"project_id": self.project.pk})
+
+    def test_results_per_item(self):
+        response = self.client.post(
+            self.url,
+            {
+                "tasks": [
+                    {"title": "Task 0", "status": TaskState.COMPLETED},
+                    {"title": "New task", "description": "fresh"},
+                    {"title": "New task"},
+                    {"description": "no title"},
+                ]
+            },
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual([r["result"] for r in body["results"]], ["updated", "created", "error", "error"])
+        self.assertEqual((body["created"], body["updated"], body["error"]), (1, 1, 2))
+        self.assertEqual(ProjectTask.objects.get(id=body["results"][0]["id"]).status, TaskState.COMPLETED)
+        self.assertEqual(ProjectTask.objects.get(id=body["results"][1]["id"]).description, "fresh")
+
+    def test_nulls_take_the_defaults(self):
+        items = [{"title": "Nulls", "description": None, "priority": None, "status": None, "is_daily_task": None}, {"title": "Plain"}]
+        response = self.client.post(self.url, {"tasks": items}, content_type="application/json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["created"], 2)
+        task = ProjectTask.objects.get(project=self.project, title="Nulls")
+        self.assertEqual((task.description, task.priority, task.status, task.is_daily_task), ("", 1, TaskState.TODO, False))
+
+    def test_query_count_does_not_grow_with_batch(self):
+        def upsert_queries(count: int) -> int:
+            items = [{"title": f"Bulk {count}-{i}", "description": ""} for i in range(count)]
+            with CaptureQueriesContext(connection) as queries:
+                ProjectTask.bulk_upsert(project=self.project, items=items)
+            return len(queries)
+
+        self.assertEqual(upsert_queries(5), upsert_queries(100))
+        self.assertEqual(ProjectTask.objects.filter(project=self.project).count(), 107)
+
+
+class BatchUpdateTaskTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username="owner")
+        self.project, self.other_project = make_projects(self.user, project_count=2, tasks_per_project=250)
+        self.url = reverse("batch_update_tasks")
+
+    def post(self, body: dict):
+        return self.client.post(self.url, {"user_id": self.user.pk, **body}, content_type="application/json")
+
+    def test_explicit_ids_in_one_update(self):
+        task_ids = list(ProjectTask.objects.filter(project__user=self.user).values_list("id", flat=True))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post({"task_ids": task_ids, "set": {"status": TaskState.COMPLETED, "priority": 0}})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"updated": 500})
+        updates = [q for q in queries.captured_queries if q["sql"].startswith('UPDATE "task_manager_projecttask"')]
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(ProjectTask.objects.filter(status=TaskState.COMPLETED, priority=0).count(), 500)
+        self.assertEqual(ProjectStatusSummary.objects.get(project=self.project, status=TaskState.COMPLETED, priority=0).task_count, 250)
+
+    def test_filter_and_move(self):
+        ProjectTask.objects.filter(project=self.project, title__in=["Task 0", "Task 1"]).update(status=TaskState.DROPPED)
+        ProjectTask.objects.filter(project=self.other_project).delete()
+        target = Project.objects.create(user=self.user, display_name="Archive", description="")
+
+        response = self.post({"filter": {"project_id": self.project.pk, "status": TaskState.DROPPED}, "set": {"project_id": target.pk}})
+
+        self.assertEqual(response.json(), {"updated": 2})
+        self.assertEqual(set(target.project_task.values_list("title", flat=True)), {"Task 0", "Task 1"})
+        self.assertEqual(ProjectTask.objects.filter(project=self.project).count(), 248)
+        ProjectTask.objects.create(project=self.project, title="Task 0", description="")
+        response = self.post({"task_ids": list(target.project_task.values_list("id", flat=True)), "set": {"project_id": self.project.pk}})
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(target.project_task.count(), 2)
+
+    def test_ownership_is_checked(self):
+        stranger = User.objects.create(username="stranger")
+        foreign_project = make_projects(stranger, project_count=1, tasks_per_project=1)[0]
+        mine = ProjectTask.objects.filter(project=self.project).first()
+        theirs = foreign_project.project_task.get()
+
+        response = self.post({"task_ids": [mine.pk, theirs.pk], "set": {"status": TaskState.COMPLETED}})
+        self.assertEqual(response.status_code, 404)
+        response = self.post({"task_ids": [mine.pk], "set": {"project_id": foreign_project.pk}})
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(ProjectTask.objects.filter(status=TaskState.COMPLETED).exists())
+        self.assertEqual(ProjectTask.objects.get(pk=mine.pk).project_id, self.project.pk)
+
+    def test_invalid_requests(self):
+        task_id = ProjectTask.objects.values_list("id", flat=True).first()
+        for body in (
+            {"task_ids": [task_id], "filter": {}, "set": {"status": 1}},
+            {"set": {"status": 1}},
+            {"task_ids": [task_id], "set": {}},
+            {"task_ids": [task_id], "set": {"status": 9}},
+        ):
+            self.assertEqual(self.post(body).status_code, 400, body)
+
+    @override_settings(BULK_TASK_MAX_ITEMS=100)
+    def test_filter_matching_too_many_tasks(self):
+        response = self.post({"filter": {"project_id": self.project.pk}, "set": {"status": TaskState.COMPLETED}})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"error": "More than 100 tasks match"})
+        self.assertFalse(ProjectTask.objects.filter(status=TaskState.COMPLETED).exists())
+
+
+class ResponseCacheTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        response_cache.reset_stats()
+        self.user = User.objects.create(username="owner")
+        self.project = make_projects(self.user, project_count=1, tasks_per_project=2)[0]
+        self.projects_url = reverse("project_view", kwargs={"user_id": self.user.pk})
+        self.tasks_url = reverse("task_view", kwargs={"user_id": self.user.pk})
+
+    def test_reads_hit_until_a_write(self):
+        self.assertEqual(self.client.get(self.projects_url)["X-Cache"], "MISS")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(self.projects_url)["X-Cache"], "HIT")
+
+        ProjectTask.objects.create(project=self.project, title="Another", description="")
+
+        response = self.client.get(self.projects_url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(len(response.json()["project_list"][0]["tasks"]), 3)
+        self.assertEqual(response_cache.stats()["project_list"], {"hits": 1, "misses": 2})
+
+    def test_task_edit_and_delete_invalidate_task_list(self):
+        self.client.get(self.tasks_url)
+        task = ProjectTask.objects.get(title="Task 0")
+        task.status = TaskState.COMPLETED
+        task.save()
+
+        response = self.client.get(self.tasks_url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["task_list"][0]["status"], TaskState.COMPLETED)
+
+        task.delete()
+        self.assertEqual(len(self.client.get(self.tasks_url).json()["task_list"]), 1)
+
+    def test_task_moved_to_another_users_project_invalidates_both(self):
+        other = User.objects.create(username="other")
+        other_project = make_projects(other, project_count=1, tasks_per_project=0)[0]
+        other_url = reverse("project_view", kwargs={"user_id": other.pk})
+        self.client.get(self.projects_url)
+        self.client.get(other_url)
+
+        task = ProjectTask.objects.get(title="Task 0")
+        task.project = other_project
+        task.save()
+
+        self.assertEqual(self.client.get(self.projects_url)["X-Cache"], "MISS")
+        self.assertEqual(self.client.get(other_url)["X-Cache"], "MISS")
+
+    def test_bulk_upsert_invalidates(self):
+        self.client.get(self.tasks_url)
+        ProjectTask.bulk_upsert(project=self.project, items=[{"title": "Task 0", "description": "changed"}])
+        self.assertEqual(self.client.get(self.tasks_url)["X-Cache"], "MISS")
+
+    def test_project_list_conditional_get(self):
+        etag = self.client.get(self.projects_url)["ETag"]
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(self.projects_url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        Project.objects.create(user=self.user, display_name="New", description="")
+        self.assertEqual(self.client.get(self.projects_url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_off_on_a_per_process_cache(self):
+        with override_settings(RESPONSE_CACHE={**settings.RESPONSE_CACHE, "ALLOW_LOCAL": False}):
+            self.assertEqual(response_cache.enabled(), not isinstance(caches["default"], LocMemCache))
+            self.client.get(self.projects_url)
+            self.assertEqual(self.client.get(self.projects_url)["X-Cache"], "HIT" if response_cache.enabled() else "MISS")
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": tempfile.mkdtemp()}}
+)
+class FileBasedResponseCacheTests(ResponseCacheTests):
+    pass
+
+
+class BenchmarkCommandTests(TestCase):
+
+    def seed(self, **options) -> list[tuple]:
+        call_command("seed_data", users=3, projects=2, tasks=5, meetings=4, reset=True, stdout=io.StringIO(), **options)
+        return list(ProjectTask.objects.order_by("project__user__username", "title").values_list("project__user__username", "title", "status", "deadline"))
+
+    def test_seeding_is_reproducible_and_skewed(self):
+        self.assertEqual(self.seed(seed=1), self.seed(seed=1))
+        self.assertNotEqual(self.seed(seed=1), self.seed(seed=2))
+        self.assertEqual(skewed_counts(12, 3, skew=0), [4, 4, 4])
+        self.assertGreater(*skewed_counts(12, 2, skew=1))
+
+    def test_seeding_fills_the_project_summaries(self):
+        self.seed(seed=0)
+        counts = ProjectStatusSummary.objects.values_list("task_count", flat=True)
+        self.assertEqual(sum(counts), ProjectTask.objects.count())
+
+    @override_settings(REQUEST_TIMING={"SAMPLE_RATE": 1.0, "SLOW_REQUEST_MS": 60_000, "SLOWEST_QUERIES": 5})
+    def test_every_route_is_benchmarked(self):
+        self.seed(seed=0)
+        out = io.StringIO()
+        call_command("bench_endpoints", requests=1, warmup=0, json=True, stdout=out)
+
+        endpoints = json.loads(out.getvalue())["endpoints"]
+        self.assertEqual([e["route"] for e in endpoints if "skipped" in e], ["admin/"])
+        self.assertEqual([e["route"] for e in endpoints if "skipped" not in e and e["status"].startswith("5")], [])
+
+
+class RequestTimingTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username="owner")
+        make_projects(self.user, project_count=2, tasks_per_project=2)
+        self.url = reverse("task_view", kwargs={"user_id": self.user.pk})
+
+    def test_server_timing_reports_queries_view_and_render(self):
+        response = self.client.get(self.url)
+
+        metrics = {metric.split(";")[0]: metric for metric in response["Server-Timing"].split(", ")}
+        self.assertEqual(set(metrics), {"db", "view", "render", "total"})
+        self.assertIn('desc="1 queries"', metrics["db"])
+
+    @override_settings(REQUEST_TIMING={"SAMPLE_RATE": 0.0, "SLOW_REQUEST_MS": 0, "SLOWEST_QUERIES": 5})
+    def test_unsampled_requests_are_only_checked_for_slowness(self):
+        with self.assertLogs("alarmclock.requests") as logs:
+            response = self.client.get(self.url)
+
+        self.assertNotIn("Server-Timing", response)
+        self.assertEqual(json.loads(logs.output[0].split(":", 2)[2])["sampled"], False)
+
+    @override_settings(REQUEST_TIMING={"SAMPLE_RATE": 1.0, "SLOW_REQUEST_MS": 0, "SLOWEST_QUERIES": 1})
+    def test_slow_requests_log_their_slowest_statement(self):
+        with self.assertLogs("alarmclock.requests") as logs:
+            self.client.get(self.url)
+
+        record = json.loads(logs.output[0].split(":", 2)[2])
+        self.assertEqual((record["status"], record["queries"]), (200, 1))
+        self.assertEqual(len(record["slowest_queries"]), 1)
+        self.assertIn("task_manager_projecttask", record["slowest_queries"][0]["sql"])
+
+
+# Throttling is off for the rest of the suite (see alarmclock.test_runner).
+THROTTLING_ON = {**settings.THROTTLING, "ENABLED": True}
+
+
+@override_settings(THROTTLING=THROTTLING_ON)
+class ThrottlingTests(TestCase):
+
+    def setUp(self):
+        throttling.get_store().clear()
+        self.user = User.objects.create(username="owner")
+        self.url = reverse("task_view", kwargs={"user_id": self.user.pk})
+
+    @override_settings(THROTTLING={**THROTTLING_ON, "ANON": {"capacity": 10, "rate": 0.01}})
+    def test_list_endpoints_cost_more_and_refusals_say_when_to_retry(self):
+        # A list request costs 5 of the 10 units; a plain read costs 1.
+        self.assertEqual([self.client.get(self.url).status_code for _ in range(3)], [200, 200, 429])
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 429)
+        self.assertGreaterEqual(int(response["Retry-After"]), 400)
+        self.assertEqual(self.client.get(reverse("project_summary", kwargs={"user_id": self.user.pk})).status_code, 429)
+
+    @override_settings(THROTTLING={**THROTTLING_ON, "ANON": {"capacity": 10, "rate": 0.01}})
+    def test_users_have_separate_budgets(self):
+        other = User.objects.create(username="other")
+        for _ in range(2):
+            self.client.get(self.url)
+        self.assertEqual(self.client.get(self.url).status_code, 429)
+        self.client.force_login(other)
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+    @override_settings(THROTTLING={**THROTTLING_ON, "SCOPES": {"list": {"cost": 1, "capacity": 1, "rate": 0.01}}})
+    async def test_scope_buckets_limit_async_views_too(self):
+        url = reverse("async_task_view", kwargs={"user_id": self.user.pk})
+        self.assertEqual((await self.async_client.get(url)).status_code, 200)
+        response = await self.async_client.get(url)
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response)
+
+    @override_settings(THROTTLING={**THROTTLING_ON, "ANON": {"capacity": 1, "rate": 0.01}})
+    async def test_every_async_view_is_throttled_first(self):
+        urls = [
+            reverse("async_user_meetings") + "?start=not-a-date",
+            reverse("async_meeting_details", kwargs={"meeting_id": 1}),
+            reverse("async_meeting_note", kwargs={"meeting_id": 1}),
+        ]
+        for url in urls:
+            throttling.get_store().clear()
+            await self.async_client.get(reverse("async_meeting_details", kwargs={"meeting_id": 1}))
+            self.assertEqual((await self.async_client.get(url)).status_code, 429, url)
+
+    def test_buckets_refill_over_time(self):
+        store = throttling.LocalBucketStore()
+        self.assertEqual(store.consume("k", 2, capacity=2, rate=1000), 0)
+        self.assertGreater(store.consume("k", 2, capacity=2, rate=1000), 0)
+        time.sleep(0.005)
+        self.assertEqual(store.consume("k", 2, capacity=2, rate=1000), 0)
+
+
+class DailyRolloverTests(TestCase):
+
+    def setUp(self):
+        self.utc_user = User.objects.create(username="london")
+        self.nz_user = User.objects.create(username="auckland")
+        Account.objects.create(user=self.nz_user, timezone="Pacific/Auckland")
+        self.tasks = {}
+        for user in (self.utc_user, self.nz_user):
+            project = Project.objects.create(user=user, display_name="Habits", description="")
+            for title, status, daily in (("done", TaskState.COMPLETED, True), ("dropped", TaskState.DROPPED, True), ("once", TaskState.COMPLETED, False)):
+                self.tasks[user.username, title] = ProjectTask.objects.create(project=project, title=title, description="", status=status, is_daily_task=daily)
+
+    def status(self, user: User, title: str) -> int:
+        return ProjectTask.objects.get(pk=self.tasks[user.username, title].pk).status
+
+    def test_rolls_over_users_past_their_local_midnight(self):
+        # 13:00 UTC on May 1st is already May 2nd in Auckland.
+        result = DailyTaskHistory.rollover(now=datetime(2026, 5, 1, 13, tzinfo=timezone.utc))
+
+        self.assertEqual(result, {"users": 2, "recorded": 4, "reset": 2})
+        self.assertEqual(self.status(self.nz_user, "done"), TaskState.TODO)
+        self.assertEqual(self.status(self.nz_user, "dropped"), TaskState.DROPPED)
+        self.assertEqual(self.status(self.nz_user, "once"), TaskState.COMPLETED)
+        self.assertEqual(
+            set(DailyTaskHistory.objects.filter(task__project__user=self.nz_user).values_list("task__title", "day", "completed")),
+            {("done", date(2026, 5, 1), True), ("dropped", date(2026, 5, 1), False)},
+        )
+        self.assertEqual(Account.objects.get(user=self.utc_user).last_rollover_date, date(2026, 5, 1))
+
+    def test_second_run_on_the_same_local_day_changes_nothing(self):
+        DailyTaskHistory.rollover(now=datetime(2026, 5, 1, 13, tzinfo=timezone.utc))
+        ProjectTask.objects.filter(pk=self.tasks["auckland", "done"].pk).update(status=TaskState.COMPLETED)
+
+        result = DailyTaskHistory.rollover(now=datetime(2026, 5, 1, 20, tzinfo=timezone.utc))
+
+        self.assertEqual(result, {"users": 0, "recorded": 0, "reset": 0})
+        self.assertEqual(self.status(self.nz_user, "done"), TaskState.COMPLETED)
+
+        # On the next day both roll over again, and only the re-completed task is reset.
+        result = DailyTaskHistory.rollover(now=datetime(2026, 5, 2, 13, tzinfo=timezone.utc))
+        self.assertEqual(result, {"users": 2, "recorded": 4, "reset": 1})
+
+    def test_rollover_invalidates_cached_task_lists(self):
+        url = reverse("task_view", kwargs={"user_id": self.nz_user.pk})
+        self.client.get(url)
+
+        DailyTaskHistory.rollover(now=datetime(2026, 5, 1, 13, tzinfo=timezone.utc))
+
+        response = self.client.get(url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertIn(TaskState.TODO, [task["status"] for task in response.json()["task_list"]])
+
+
+class ProjectSummaryTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username="owner")
+        self.project, self.other_project = make_projects(self.user, project_count=2, tasks_per_project=0)
+
+    def summary_rows(self) -> tuple[set, set]:
+        return (
+            set(ProjectStatusSummary.objects.filter(task_count__gt=0).values_list("project_id", "status", "priority", "task_count")),
+            set(ProjectDeadlineSummary.objects.filter(task_count__gt=0).values_list("project_id", "deadline", "task_count")),
+        )
+
+    def assertMatchesRecount(self):
+        incremental = self.summary_rows()
+        ProjectStatusSummary.recount()
+        ProjectDeadlineSummary.recount()
+        self.assertEqual(incremental, self.summary_rows())
+
+    def test_single_task_writes_keep_summaries_exact(self):
+        task = ProjectTask.objects.create(project=self.project, title="a", description="", deadline=date(2026, 1, 5))
+        ProjectTask.objects.create(project=self.project, title="b", description="", status=TaskState.COMPLETED)
+        self.assertMatchesRecount()
+
+        task = ProjectTask.objects.get(pk=task.pk)
+        task.update_task({"status": TaskState.IN_PROGRESS, "priority": 0, "project_id": self.other_project.pk})
+        task.update_task({"status": TaskState.COMPLETED})
+        self.assertMatchesRecount()
+
+        task.delete()
+        self.assertMatchesRecount()
+
+    def test_bulk_writes_and_rollover_recount(self):
+        ProjectTask.bulk_upsert(self.project, [{"title": f"t{i}", "description": "", "deadline": date(2026, 1, 1)} for i in range(5)])
+        ProjectTask.objects.create(project=self.project, title="habit", description="", status=TaskState.COMPLETED, is_daily_task=True)
+        DailyTaskHistory.rollover(now=datetime(2026, 5, 1, 12, tzinfo=timezone.utc))
+        self.assertMatchesRecount()
+
+    def test_batch_update_moves_counts_between_projects(self):
+        ProjectTask.bulk_upsert(self.project, [{"title": f"t{i}", "description": "", "deadline": date(2026, 1, 1)} for i in range(5)])
+        changes = {"project_id": self.other_project.pk, "status": TaskState.IN_PROGRESS}
+        ProjectTask.batch_update(self.user.pk, changes, project_id=self.project.pk, status=TaskState.TODO)
+        self.assertMatchesRecount()
+        self.assertFalse(ProjectStatusSummary.objects.filter(project=self.project, task_count__gt=0).exists())
+
+    def test_project_delete_cascades_cleanly(self):
+        ProjectTask.objects.create(project=self.project, title="a", description="", deadline=date(2026, 1, 5))
+        self.project.delete()
+        self.assertEqual(self.summary_rows(), (set(), set()))
+
+    def test_endpoint_reads_summaries_only(self):
+        for i, status in enumerate([TaskState.TODO, TaskState.TODO, TaskState.COMPLETED]):
+            ProjectTask.objects.create(project=self.project, title=f"t{i}", description="", status=status, deadline=date(2000, 1, 1))
+        ProjectTask.objects.create(project=self.other_project, title="later", description="", deadline=date(2999, 1, 1))
+        url = reverse("project_summary", kwargs={"user_id": self.user.pk})
+
+        with CaptureQueriesContext(connection) as queries:
+            projects = self.client.get(url).json()["projects"]
+
+        self.assertFalse([q for q in queries.captured_queries if "task_manager_projecttask" in q["sql"]])
+        self.assertEqual(
+            [(p["total"], p["overdue"], p["by_status"], p["by_priority"]) for p in projects],
+            [(3, 2, [2, 0, 1, 0], [0, 3, 0]), (1, 0, [1, 0, 0, 0], [0, 1, 0])],
+        )
+        self.assertEqual(projects[0]["matrix"][TaskState.TODO], [0, 2, 0])
+
+
+class TaskDependencyTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username="owner")
+        self.project = make_projects(self.user, project_count=1, tasks_per_project=0)[0]
+        self.tasks = [ProjectTask.objects.create(project=self.project, title=f"t{i}", description="") for i in range(6)]
+
+    def link(self, task: int, *depends_on: int) -> None:
+        TaskDependency.link(self.tasks[task], [self.tasks[d].pk for d in depends_on])
+
+    def assertClosureMatchesGraph(self):
+        edges: dict[int, set[int]] = {}
+        for task_id, depends_on_id in TaskDependency.objects.values_list("task_id", "depends_on_id"):
+            edges.setdefault(depends_on_id, set()).add(task_id)
+
+        def count_paths(start: int) -> dict[int, int]:
+            counts: dict[int, int] = {}
+            for following in edges.get(start, ()):
+                counts[following] = counts.get(following, 0) + 1
+                for reached, n in count_paths(following).items():
+                    counts[reached] = counts.get(reached, 0) + n
+            return counts
+
+        expected = {(a, d, n) for a in edges for d, n in count_paths(a).items()}
+        self.assertEqual(set(TaskClosure.objects.values_list("ancestor_id", "descendant_id", "paths")), expected)
+
+    def test_closure_follows_links_unlinks_and_deletes(self):
+        # A diamond 0 -> {1, 2} -> 3 with a tail 3 -> 4 has two paths from 0 to 4.
+        self.link(1, 0)
+        self.link(2, 0)
+        self.link(3, 1, 2)
+        self.link(4, 3)
+        self.assertEqual(TaskClosure.objects.get(ancestor=self.tasks[0], descendant=self.tasks[4]).paths, 2)
+        self.assertClosureMatchesGraph()
+
+        TaskDependency.unlink(self.tasks[3], [self.tasks[1].pk])
+        self.assertClosureMatchesGraph()
+
+        self.tasks[2].delete()
+        self.assertClosureMatchesGraph()
+        self.assertFalse(TaskClosure.objects.filter(ancestor=self.tasks[0], descendant=self.tasks[4]).exists())
+
+    def test_cycles_are_rejected_without_partial_writes(self):
+        self.link(1, 0)
+        self.link(2, 1)
+
+        with self.assertRaises(DependencyCycle):
+            TaskDependency.link(self.tasks[0], [self.tasks[5].pk, self.tasks[2].pk])
+        with self.assertRaises(DependencyCycle):
+            self.link(3, 3)
+
+        self.assertFalse(TaskDependency.objects.filter(task=self.tasks[0]).exists())
+        self.assertClosureMatchesGraph()
+
+    def test_blocked_by_unblocks_and_topological_order(self):
+        self.link(2, 1)
+        self.link(1, 0)
+        self.link(5, 2, 3)
+        ProjectTask.objects.filter(pk=self.tasks[1].pk).update(status=TaskState.COMPLETED)
+
+        data = self.client.get(reverse("task_dependencies", kwargs={"task_id": self.tasks[2].pk})).json()
+        self.assertEqual((data["blocked"], [t["title"] for t in data["blocked_by"]]), (True, ["t0"]))
+        self.assertEqual((data["depends_on"], [t["title"] for t in data["unblocks"]]), ([self.tasks[1].pk], ["t5"]))
+        self.assertFalse(TaskDependency.is_blocked(self.tasks[0].pk))
+
+        order = [t["title"] for t in self.client.get(reverse("project_task_order", kwargs={"project_id": self.project.pk})).json()["task_list"]]
+        for before, after in (("t0", "t1"), ("t1", "t2"), ("t2", "t5"), ("t3", "t5")):
+            self.assertLess(order.index(before), order.index(after))
+
+    def test_add_endpoint_reports_cycles(self):
+        self.link(1, 0)
+        url = reverse("task_dependencies_add", kwargs={"task_id": self.tasks[0].pk})
+
+        response = self.client.post(url, {"task_ids": [self.tasks[1].pk]}, content_type="application/json")
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()["depends_on_id"], self.tasks[1].pk)
@@ -3,3 +3,8 @@ from .add_task import AddTaskView
 from .add_project import AddProjectView
 from .task_list import TaskListView
 from .edit_task import EditTaskView
+from .bulk_add_task import BulkAddTaskView
+from .batch_update_tasks import BatchUpdateTasksView
+from .async_lists import AsyncProjectListView, AsyncTaskListView
+from .project_summary import ProjectSummaryView
+from .task_dependencies import TaskDependenciesView, TaskDependenciesAddView, TaskDependenciesRemoveView, ProjectTaskOrderView
@@ -0,0 +1,45 @@
+from django.views import View
+from pydantic import ValidationError
+from rest_framework import status
+
+from alarmclock.streaming import json_response
+from alarmclock.throttling import athrottled
+from ..models.project import Project
+from ..models.project_task import ProjectTask
+from .task_list import TaskListQuerySchema
+
+
+class AsyncProjectListView(View):
+    """
+    ProjectListView on the async ORM, for serving under ASGI without holding a
+    thread per request.
+    """
+
+    async def get(self, request, user_id: int):
+        if throttled := await athrottled(request, "list"):
+            return throttled
+        try:
+            project_list = await Project.aget_project_list_for_user(user_id=user_id)
+            return json_response({"project_list": project_list})
+        except Exception as e:
+            return json_response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class AsyncTaskListView(View):
+    """
+    TaskListView on the async ORM, with the same pagination and filters.
+    """
+
+    async def get(self, request, user_id: int):
+        if throttled := await athrottled(request, "list"):
+            return throttled
+        try:
+            query = TaskListQuerySchema.model_validate(request.GET.dict())
+        except ValidationError as e:
+            return json_response({"error": "Invalid query parameters", "details": e.errors()}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            task_list, next_cursor = await ProjectTask.aget_task_page_for_user(user_id=user_id, **query.model_dump())
+            return json_response({"task_list": task_list, "next_cursor": next_cursor})
+        except Exception as e:
+            return json_response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -0,0 +1,68 @@
+from django.conf import settings
+from django.db import IntegrityError
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from pydantic import BaseModel, Field, ValidationError
+from typing import Optional
+
+from ..models.project import Project
+from ..models.project_task import ProjectTask
+from .task_list import TaskFilterSchema
+
+
+class TaskChangesSchema(BaseModel):
+    status: Optional[int] = Field(None, ge=0, le=3)
+    priority: Optional[int] = Field(None, ge=0, le=2)
+    project_id: Optional[int] = Field(None, gt=0)
+
+
+class BatchUpdateTasksSchema(BaseModel):
+    user_id: Optional[int] = None
+    task_ids: Optional[list[int]] = Field(None, min_length=1, max_length=settings.BULK_TASK_MAX_ITEMS)
+    filter: Optional[TaskFilterSchema] = None
+    set: TaskChangesSchema
+
+
+class BatchUpdateTasksView(APIView):
+    """
+    API View to change the status, priority and/or project of many of a user's
+    tasks at once: the ids in `task_ids`, or every task matching `filter` (the
+    TaskListView filters). The change set is applied with a single UPDATE after
+    one query checks the tasks belong to the user; answers with the number of
+    tasks updated.
+    """
+
+    throttle_scope = "bulk"
+
+    def post(self, request) -> Response:
+        try:
+            batch = BatchUpdateTasksSchema.model_validate(request.data)
+        except ValidationError as e:
+            return Response({"error": "Invalid request data", "details": e.errors()}, status=status.HTTP_400_BAD_REQUEST)
+
+        if (batch.task_ids is None) == (batch.filter is None):
+            return Response({"error": "Give either task_ids or filter"}, status=status.HTTP_400_BAD_REQUEST)
+        changes = batch.set.model_dump(exclude_none=True)
+        if not changes:
+            return Response({"error": "set must change status, priority or project_id"}, status=status.HTTP_400_BAD_REQUEST)
+
+        user_id = batch.user_id or request.user.pk
+        if user_id is None:
+            return Response({"error": "user_id is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            updated = ProjectTask.batch_update(
+                user_id,
+                changes,
+                task_ids=batch.task_ids,
+                max_tasks=settings.BULK_TASK_MAX_ITEMS,
+                **(batch.filter.model_dump() if batch.filter else {}),
+            )
+        except (ProjectTask.DoesNotExist, Project.DoesNotExist) as e:
+            return Response({"error": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        except IntegrityError:
+            return Response({"error": "The target project already has a task with one of these titles"}, status=status.HTTP_409_CONFLICT)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"updated": updated}, status=status.HTTP_200_OK)
@@ -0,0 +1,91 @@
+from django.conf import settings
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from pydantic import BaseModel, Field, ValidationError
+
+from jobs.models import Job
+from ..models.project import Project
+from ..models.project_task import ProjectTask
+from .add_task import AddTaskSchema
+
+
+class BulkAddTaskSchema(BaseModel):
+    tasks: list[dict] = Field(..., min_length=1, max_length=settings.BULK_TASK_MAX_ITEMS)
+
+
+def wants_background(request) -> bool:
+    return request.GET.get("background", "").lower() in ("1", "true", "yes")
+
+
+def upsert_items(project: Project, items: list[dict]) -> dict:
+    """
+    Validate and upsert `items`, giving each its own result; invalid items are
+    reported and skipped. Runs in the request or as a background job.
+    """
+    results: list[dict] = []
+    valid: dict[str, dict] = {}
+    for index, item in enumerate(items):
+        try:
+            task_data = AddTaskSchema.model_validate(item).model_dump()
+        except ValidationError as e:
+            results.append({"index": index, "title": item.get("title"), "result": "error", "error": e.errors()})
+            continue
+
+        # An explicit null means the default; only the deadline column is nullable.
+        task_data = {
+            name: AddTaskSchema.model_fields[name].default if value is None and name != "deadline" else value for name, value in task_data.items()
+        }
+
+        if task_data["title"] in valid:
+            results.append({"index": index, "title": task_data["title"], "result": "error", "error": "Duplicate title in batch"})
+            continue
+
+        valid[task_data["title"]] = task_data
+        results.append({"index": index, "title": task_data["title"]})
+
+    upserted = ProjectTask.bulk_upsert(project=project, items=list(valid.values()))
+
+    for result in results:
+        if "result" in result:
+            continue
+        task_id, created = upserted[result["title"]]
+        result.update(id=task_id, result="created" if created else "updated")
+
+    counts = {"created": 0, "updated": 0, "error": 0}
+    for result in results:
+        counts[result["result"]] += 1
+    return {"results": results, **counts}
+
+
+class BulkAddTaskView(APIView):
+    """
+    API View to create or update many tasks of a project in one request.
+
+    Each item is validated like AddTaskView's payload; valid items are upserted
+    on (project, title) in one transaction and every item gets its own result.
+    With ?background=1 the batch is queued as a job instead, and the response
+    is 202 with the id to poll at jobs/<id>/.
+    """
+
+    throttle_scope = "bulk"
+
+    def post(self, request, project_id: int) -> Response:
+        try:
+            project = Project.objects.get(id=project_id)
+        except Project.DoesNotExist:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        try:
+            batch = BulkAddTaskSchema.model_validate(request.data)
+        except ValidationError as e:
+            return Response({"error": "Invalid request data", "details": e.errors()}, status=status.HTTP_400_BAD_REQUEST)
+
+        if wants_background(request):
+            job = Job.enqueue("task_manager.bulk_upsert_tasks", {"project_id": project.pk, "tasks": batch.tasks}, user_id=request.user.pk)
+            return Response({"job_id": job.pk, "status": job.status}, status=status.HTTP_202_ACCEPTED)
+
+        try:
+            return Response(upsert_items(project, batch.tasks), status=status.HTTP_200_OK)
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -6,19 +6,38 @@ from django.http import HttpRequest
 from rest_framework import status
 from django.contrib.auth.models import User
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from alarmclock import response_cache
+from alarmclock.streaming import StreamingJSONResponse, chunk_size, wants_streaming
 from ..models.project import Project
 
 # Create your views here.
 
 
+def project_list_etag(request, user_id: int) -> str:
+    # The user version is bumped by every write that changes this payload
+    # (see task_manager.signals), so no database query is needed here.
+    return f"projects-{user_id}-{response_cache.get_version('user', user_id)}"
+
+
+@method_decorator(cache_control(private=True, no_cache=True), name="get")
+@method_decorator(response_cache.etag(project_list_etag), name="get")
 class ProjectListView(APIView):
     login_url = "/login"
+    throttle_scope = "list"
 
     def get(self, request, user_id: int):
         try:
-            project_list: list[dict] = Project.get_project_list_for_user(user_id=user_id)
+            if wants_streaming(request):
+                rows = Project.iter_project_list_for_user(user_id=user_id, chunk_size=chunk_size())
+                return StreamingJSONResponse(rows, key="project_list")
+
+            project_list, hit = response_cache.cached(
+                "project_list", "user", user_id, build=lambda: Project.get_project_list_for_user(user_id=user_id)
+            )
 
-            return Response(status=status.HTTP_200_OK, data={"project_list": project_list})
+            return Response(status=status.HTTP_200_OK, data={"project_list": project_list}, headers=response_cache.cache_header(hit))
 
         except User.DoesNotExist:
             return Response(status=status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,22 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from django.utils import timezone
+
+from authenticator.models import Account
+from ..models.project_summary import ProjectStatusSummary
+
+
+class ProjectSummaryView(APIView):
+    """
+    Per-project task counts by status and priority, and overdue counts, read
+    from the summary tables so the cost follows the number of projects.
+    """
+
+    def get(self, request, user_id: int) -> Response:
+        try:
+            today = timezone.now().astimezone(Account.timezone_for(user_id)).date()
+            summaries = ProjectStatusSummary.get_summaries_for_user(user_id=user_id, today=today)
+            return Response({"projects": summaries}, status=status.HTTP_200_OK)
+        except Exception as e:
+            return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -0,0 +1,69 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from pydantic import BaseModel, ValidationError
+
+from ..models.project_task import ProjectTask
+from ..models.task_dependency import DependencyCycle, TaskDependency
+
+
+class DependencySchema(BaseModel):
+    task_ids: list[int]
+
+
+class TaskDependenciesView(APIView):
+    """
+    Whether a task is blocked, by which unfinished tasks, and which tasks it
+    unblocks. Answered from the precomputed closure, not by walking the graph.
+    """
+
+    def get(self, request, task_id: int) -> Response:
+        try:
+            task = ProjectTask.objects.get(id=task_id)
+        except ProjectTask.DoesNotExist:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+        return Response(TaskDependency.get_dependency_data(task), status=status.HTTP_200_OK)
+
+
+class TaskDependenciesAddView(APIView):
+
+    def post(self, request, task_id: int) -> Response:
+        try:
+            task = ProjectTask.objects.select_related("project").get(id=task_id)
+        except ProjectTask.DoesNotExist:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        try:
+            dependencies = DependencySchema.model_validate(request.data)
+        except ValidationError as e:
+            return Response({"error": "Invalid request data", "details": e.errors()}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            added = TaskDependency.link(task, dependencies.task_ids)
+        except DependencyCycle as cycle:
+            return Response({"error": str(cycle), "task_id": cycle.task_id, "depends_on_id": cycle.depends_on_id}, status=status.HTTP_409_CONFLICT)
+        return Response({"added": sorted(added)}, status=status.HTTP_200_OK)
+
+
+class TaskDependenciesRemoveView(APIView):
+
+    def post(self, request, task_id: int) -> Response:
+        try:
+            task = ProjectTask.objects.get(id=task_id)
+        except ProjectTask.DoesNotExist:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        try:
+            dependencies = DependencySchema.model_validate(request.data)
+        except ValidationError as e:
+            return Response({"error": "Invalid request data", "details": e.errors()}, status=status.HTTP_400_BAD_REQUEST)
+
+        removed = TaskDependency.unlink(task, dependencies.task_ids)
+        return Response({"removed": sorted(removed)}, status=status.HTTP_200_OK)
+
+
+class ProjectTaskOrderView(APIView):
+    """A project's tasks with every task listed after the tasks it depends on."""
+
+    def get(self, request, project_id: int) -> Response:
+        return Response({"task_list": TaskDependency.topological_order(project_id)}, status=status.HTTP_200_OK)
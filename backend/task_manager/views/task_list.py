@@ -2,17 +2,62 @@ from rest_framework.views import APIView
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from django.conf import settings
 from django.contrib.auth.models import User
+from pydantic import BaseModel, Field, ValidationError
+from typing import Optional
+from datetime import date
+from alarmclock import response_cache
+from alarmclock.streaming import StreamingJSONResponse, chunk_size, wants_streaming
 from ..models.project_task import ProjectTask
 # Create your views here.
 
 
+class TaskFilterSchema(BaseModel):
+    """The ProjectTask.filter_for_user filters, shared with batch updates."""
+
+    status: Optional[int] = None
+    priority: Optional[int] = None
+    is_daily_task: Optional[bool] = None
+    deadline_from: Optional[date] = None
+    deadline_to: Optional[date] = None
+    project_id: Optional[int] = None
+
+
+class TaskListQuerySchema(TaskFilterSchema):
+    cursor: Optional[int] = None
+    limit: int = Field(settings.TASK_LIST_PAGE_SIZE, ge=1, le=settings.TASK_LIST_MAX_PAGE_SIZE)
+
+
 class TaskListView(APIView):
+    throttle_scope = "list"
+
     def get(self, request, user_id: int):
         try:
-            task_list: list[dict] = ProjectTask.get_task_for_user(user_id=user_id)
+            query = TaskListQuerySchema.model_validate(request.query_params.dict())
+        except ValidationError as e:
+            return Response({"error": "Invalid query parameters", "details": e.errors()}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            if wants_streaming(request):
+                rows, next_cursor = ProjectTask.iter_task_page_for_user(
+                    user_id=user_id, chunk_size=chunk_size(), **query.model_dump()
+                )
+                return StreamingJSONResponse(rows, key="task_list", extra={"next_cursor": next_cursor})
+
+            (task_list, next_cursor), hit = response_cache.cached(
+                "task_list",
+                "user",
+                user_id,
+                build=lambda: ProjectTask.get_task_page_for_user(user_id=user_id, **query.model_dump()),
+                params=query.model_dump(),
+            )
 
-            return Response(status=status.HTTP_200_OK, data={"task_list": task_list})
+            return Response(
+                status=status.HTTP_200_OK,
+                data={"task_list": task_list, "next_cursor": next_cursor},
+                headers=response_cache.cache_header(hit),
+            )
 
         except User.DoesNotExist:
             return Response(status=status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,93 @@
+"""
+Streaming export of a user's workspace: their projects, tasks, meetings, the
+links between meetings and tasks, and notes, as one record per line.
+
+Each kind is read with `iterator(chunk_size=...)` and rendered as it arrives,
+so memory use does not grow with the size of the account. Records come in
+dependency order (projects before their tasks, meetings before their links and
+notes), which is what workspace.importer relies on to load them in one pass.
+
+JSON Lines records are objects with a "type" key; CSV rows have a "type"
+column followed by the union of all kinds' fields, left empty where a kind has
+no such field.
+"""
+
+import csv
+import io
+import zlib
+from typing import Iterable, Iterator
+
+from alarmclock.streaming import WRITE_BUFFER_SIZE, chunk_size, render_json
+from note_manager.models import Meeting, Note
+from task_manager.models.project import Project
+from task_manager.models.project_task import ProjectTask
+
+FORMATS = ("jsonl", "csv")
+
+# Record type -> fields, in the order they are exported.
+RECORD_FIELDS: dict[str, tuple[str, ...]] = {
+    "project": ("id", "name", "display_name", "description"),
+    "task": ("id", "project_id", "title", "priority", "status", "description", "is_daily_task", "deadline", "calendar_linked_date"),
+    "meeting": ("id", "title", "description", "start_time", "end_time"),
+    "meeting_task": ("meeting_id", "task_id"),
+    "note": ("meeting_id", "content", "revision"),
+}
+
+CSV_COLUMNS = ("type",) + tuple(dict.fromkeys(field for fields in RECORD_FIELDS.values() for field in fields))
+
+
+def iter_records(user_id: int) -> Iterator[tuple[str, tuple]]:
+    """(type, row) for everything the user owns, rows in RECORD_FIELDS order."""
+    size = chunk_size()
+    links = Meeting.tasks.through.objects.filter(meeting__owner_id=user_id, projecttask__project__user_id=user_id)
+    querysets = {
+        "project": Project.objects.filter(user_id=user_id).order_by("id").values_list(*RECORD_FIELDS["project"]),
+        "task": ProjectTask.objects.filter(project__user_id=user_id).order_by("id").values_list(*RECORD_FIELDS["task"]),
+        "meeting": Meeting.objects.filter(owner_id=user_id).order_by("id").values_list(*RECORD_FIELDS["meeting"]),
+        # Links to other users' tasks are left out; they would not import.
+        "meeting_task": links.order_by("meeting_id", "projecttask_id").values_list("meeting_id", "projecttask_id"),
+        "note": Note.objects.filter(meeting__owner_id=user_id).order_by("meeting_id").values_list(*RECORD_FIELDS["note"]),
+    }
+    for kind, rows in querysets.items():
+        for row in rows.iterator(chunk_size=size):
+            yield kind, row
+
+
+def iter_jsonl(records: Iterable[tuple[str, tuple]]) -> Iterator[bytes]:
+    buffer = bytearray()
+    for kind, row in records:
+        buffer += render_json({"type": kind, **dict(zip(RECORD_FIELDS[kind], row))}) + b"\n"
+        if len(buffer) >= WRITE_BUFFER_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    yield bytes(buffer)
+
+
+def iter_csv(records: Iterable[tuple[str, tuple]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, CSV_COLUMNS)
+    writer.writeheader()
+    for kind, row in records:
+        writer.writerow({"type": kind, **{field: "" if value is None else value for field, value in zip(RECORD_FIELDS[kind], row)}})
+        if buffer.tell() >= WRITE_BUFFER_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+def gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Compress a stream of chunks into one gzip member as it goes."""
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def iter_export(user_id: int, format: str = "jsonl", compress: bool = False) -> Iterator[bytes]:
+    if format not in FORMATS:
+        raise ValueError(f"Unknown export format {format!r}")
+    chunks = (iter_jsonl if format == "jsonl" else iter_csv)(iter_records(user_id))
+    return gzip_chunks(chunks) if compress else chunks
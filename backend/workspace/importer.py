@@ -0,0 +1,152 @@
+"""
+Streaming import of workspace.export files into a user's workspace.
+
+Records are read one at a time and inserted with bulk_create in batches of
+consecutive records of one type, so a file is loaded in one pass with memory
+bounded by the batch size and the map from exported to new ids. Everything is
+imported as new objects owned by the importing user; the ids in the file only
+say which records refer to which. A record that cannot be imported fails the
+whole import, which runs in one transaction.
+"""
+
+import csv
+import gzip
+import json
+from typing import IO, Iterable, Iterator, Optional
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, models, transaction
+
+from alarmclock import response_cache
+from note_manager.models import Meeting, Note
+from note_manager.models.meeting import meetings_bulk_updated
+from task_manager.models.project import Project
+from task_manager.models.project_task import ProjectTask, tasks_bulk_updated
+from .export import FORMATS, RECORD_FIELDS
+
+
+class InvalidRecord(Exception):
+    """A record of the import file is malformed or refers to a record not imported before it."""
+
+
+def read_records(stream: IO[bytes], format: str = "jsonl", compressed: bool = False) -> Iterator[dict]:
+    """Records of a binary export stream, as dicts with a "type" key."""
+    if format not in FORMATS:
+        raise ValueError(f"Unknown import format {format!r}")
+    if compressed:
+        stream = gzip.GzipFile(fileobj=stream, mode="rb")
+    lines = (line.decode() for line in stream)
+
+    if format == "csv":
+        for row in csv.DictReader(lines):
+            yield {field: row.get(field, "") for field in ("type", *RECORD_FIELDS.get(row.get("type"), ()))}
+        return
+
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise InvalidRecord(f"Line {number}: {e}")
+
+
+def to_python(field: models.Field, value):
+    # CSV has no null: an empty cell of a nullable column is one.
+    if value == "" and field.null:
+        return None
+    return field.to_python(value)
+
+
+class WorkspaceImporter:
+
+    def __init__(self, user_id: int, batch_size: Optional[int] = None):
+        self.user_id = user_id
+        self.batch_size = batch_size or settings.WORKSPACE_IMPORT_BATCH_SIZE
+        # Record type -> {exported id: new id}
+        self.ids: dict[str, dict[int, int]] = {"project": {}, "task": {}, "meeting": {}}
+        self.counts = {kind: 0 for kind in RECORD_FIELDS}
+        # Records read so far, to point errors at the right part of the file.
+        self.read = 0
+        self.pending_kind = None
+        self.pending: list[dict] = []
+
+    def add(self, record: dict) -> None:
+        self.read += 1
+        kind = record.get("type") if isinstance(record, dict) else None
+        if kind not in RECORD_FIELDS:
+            raise InvalidRecord(f"Record {self.read}: unknown type {kind!r}")
+        if kind != self.pending_kind or len(self.pending) >= self.batch_size:
+            self.flush()
+            self.pending_kind = kind
+        self.pending.append(record)
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        first = self.read - len(self.pending) + 1
+        try:
+            getattr(self, f"create_{self.pending_kind}s")(self.pending)
+        except (KeyError, TypeError, ValueError, ValidationError, IntegrityError) as e:
+            raise InvalidRecord(f"Records {first}-{self.read} ({self.pending_kind}): {type(e).__name__}: {e}")
+        self.counts[self.pending_kind] += len(self.pending)
+        self.pending = []
+
+    def values(self, model: type[models.Model], record: dict, *names: str) -> dict:
+        return {name: to_python(model._meta.get_field(name), record[name]) for name in names}
+
+    def new_id(self, kind: str, record: dict, key: str) -> int:
+        old_id = int(record[key])
+        if old_id not in self.ids[kind]:
+            raise KeyError(f"{kind} {old_id} is not in the file before this record")
+        return self.ids[kind][old_id]
+
+    def create_projects(self, records: list[dict]) -> None:
+        projects = Project.objects.bulk_create(
+            Project(user_id=self.user_id, **self.values(Project, record, "name", "display_name", "description")) for record in records
+        )
+        self.ids["project"].update((int(record["id"]), project.pk) for record, project in zip(records, projects))
+
+    def create_tasks(self, records: list[dict]) -> None:
+        fields = ("title", "priority", "status", "description", "is_daily_task", "deadline", "calendar_linked_date")
+        tasks = ProjectTask.objects.bulk_create(
+            ProjectTask(project_id=self.new_id("project", record, "project_id"), **self.values(ProjectTask, record, *fields)) for record in records
+        )
+        self.ids["task"].update((int(record["id"]), task.pk) for record, task in zip(records, tasks))
+        tasks_bulk_updated.send(sender=ProjectTask, task_ids=[task.pk for task in tasks])
+
+    def create_meetings(self, records: list[dict]) -> None:
+        fields = ("title", "description", "start_time", "end_time")
+        meetings = Meeting.objects.bulk_create(Meeting(owner_id=self.user_id, **self.values(Meeting, record, *fields)) for record in records)
+        self.ids["meeting"].update((int(record["id"]), meeting.pk) for record, meeting in zip(records, meetings))
+        meetings_bulk_updated.send(sender=Meeting, meeting_ids=[meeting.pk for meeting in meetings])
+
+    def create_meeting_tasks(self, records: list[dict]) -> None:
+        links = [
+            Meeting.tasks.through(meeting_id=self.new_id("meeting", record, "meeting_id"), projecttask_id=self.new_id("task", record, "task_id"))
+            for record in records
+        ]
+        Meeting.tasks.through.objects.bulk_create(links)
+        meetings_bulk_updated.send(sender=Meeting, meeting_ids=list({link.meeting_id for link in links}))
+
+    def create_notes(self, records: list[dict]) -> None:
+        notes = Note.objects.bulk_create(
+            Note(meeting_id=self.new_id("meeting", record, "meeting_id"), **self.values(Note, record, "content", "revision")) for record in records
+        )
+        meetings_bulk_updated.send(sender=Meeting, meeting_ids=[note.meeting_id for note in notes])
+
+
+def import_workspace(user_id: int, records: Iterable[dict], batch_size: Optional[int] = None) -> dict:
+    """Import `records` for the user. Returns how many of each type were created. Raises InvalidRecord."""
+    importer = WorkspaceImporter(user_id, batch_size)
+    with transaction.atomic():
+        try:
+            for record in records:
+                importer.add(record)
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            raise InvalidRecord(f"Unreadable import file after record {importer.read}: {e}")
+        importer.flush()
+        # Covers projects imported without any tasks.
+        response_cache.bump_users([user_id])
+    return importer.counts
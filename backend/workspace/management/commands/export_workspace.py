@@ -0,0 +1,29 @@
+import sys
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from workspace.export import FORMATS, iter_export
+
+
+class Command(BaseCommand):
+    help = "Write everything a user owns as JSON Lines or CSV, streamed from the database, to a file or stdout."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", required=True, help="Username")
+        parser.add_argument("--format", choices=FORMATS, default="jsonl")
+        parser.add_argument("--gzip", action="store_true", help="Compress the output (implied by an --output ending in .gz)")
+        parser.add_argument("--output", help="File to write instead of stdout")
+
+    def handle(self, *args, user: str, format: str, gzip: bool, output: str, **options):
+        user_id = User.objects.filter(username=user).values_list("id", flat=True).first()
+        if user_id is None:
+            raise CommandError(f"User {user!r} does not exist.")
+
+        chunks = iter_export(user_id, format, compress=gzip or bool(output and output.endswith(".gz")))
+        if output:
+            with open(output, "wb") as out:
+                out.writelines(chunks)
+        else:
+            sys.stdout.buffer.writelines(chunks)
+            sys.stdout.buffer.flush()
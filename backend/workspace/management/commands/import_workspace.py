@@ -0,0 +1,32 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from workspace.export import FORMATS
+from workspace.importer import InvalidRecord, import_workspace, read_records
+
+
+class Command(BaseCommand):
+    help = (
+        "Load a file written by export_workspace into a user's workspace as new objects, in one transaction. "
+        "Files ending in .gz are decompressed as they are read."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--user", required=True, help="Username to import for")
+        parser.add_argument("--format", choices=FORMATS, help="Defaults to csv for .csv(.gz) files, jsonl otherwise")
+        parser.add_argument("--batch-size", type=int, default=None, help="Records per insert (default WORKSPACE_IMPORT_BATCH_SIZE)")
+
+    def handle(self, *args, path: str, user: str, format: str, batch_size: int, **options):
+        user_id = User.objects.filter(username=user).values_list("id", flat=True).first()
+        if user_id is None:
+            raise CommandError(f"User {user!r} does not exist.")
+
+        compressed = path.endswith(".gz")
+        format = format or ("csv" if path.removesuffix(".gz").endswith(".csv") else "jsonl")
+        with open(path, "rb") as stream:
+            try:
+                counts = import_workspace(user_id, read_records(stream, format, compressed), batch_size)
+            except InvalidRecord as e:
+                raise CommandError(f"Nothing imported: {e}")
+        self.stdout.write("Imported " + ", ".join(f"{count} {kind}" for kind, count in counts.items()))
@@ -0,0 +1,132 @@
+import gzip
+import io
+import json
+import os
+import tempfile
+from datetime import date, datetime, timezone
+
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from note_manager.models import Meeting, Note
+from search.models import SearchEntry
+from task_manager.models import ProjectStatusSummary
+from task_manager.models.project import Project
+from task_manager.models.project_task import ProjectTask, TaskState
+from workspace.export import iter_export
+from workspace.importer import InvalidRecord, import_workspace, read_records
+
+
+def workspace_snapshot(user: User) -> dict:
+    """The user's data without ids, comparable across an export and import."""
+    return {
+        "projects": sorted(Project.objects.filter(user=user).values_list("display_name", "description")),
+        "tasks": sorted(
+            ProjectTask.objects.filter(project__user=user).values_list(
+                "project__display_name", "title", "priority", "status", "is_daily_task", "deadline", "calendar_linked_date"
+            )
+        ),
+        "meetings": sorted(Meeting.objects.filter(owner=user).values_list("title", "start_time", "end_time")),
+        "links": sorted(Meeting.tasks.through.objects.filter(meeting__owner=user).values_list("meeting__title", "projecttask__title")),
+        "notes": sorted(Note.objects.filter(meeting__owner=user).values_list("meeting__title", "content", "revision")),
+    }
+
+
+class WorkspaceExportImportTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username="owner", email="owner@example.com")
+        self.other = User.objects.create(username="other", email="other@example.com")
+        self.client.force_login(self.user)
+
+        for p in range(2):
+            project = Project.objects.create(user=self.user, display_name=f"Project {p}", description='line one\nline, "two"')
+            ProjectTask.objects.bulk_create(
+                ProjectTask(project=project, title=f"Task {p}.{t}", description="", status=t % 4, deadline=date(2026, 3, t + 1) if t % 2 else None)
+                for t in range(5)
+            )
+        self.meeting = Meeting.objects.create(
+            owner=self.user,
+            title="Planning",
+            description="",
+            start_time=datetime(2026, 3, 1, 9, tzinfo=timezone.utc),
+            end_time=datetime(2026, 3, 1, 10, tzinfo=timezone.utc),
+        )
+        self.meeting.tasks.set(ProjectTask.objects.filter(title__in=["Task 0.1", "Task 1.2"]))
+        Note.objects.create(meeting=self.meeting, content="Agenda: ünïcode", revision=3)
+
+    def export(self, format: str = "jsonl", compress: bool = False) -> bytes:
+        return b"".join(iter_export(self.user.pk, format, compress))
+
+    def test_jsonl_records(self):
+        lines = [json.loads(line) for line in self.export().decode().splitlines()]
+        self.assertEqual([line["type"] for line in lines], ["project"] * 2 + ["task"] * 10 + ["meeting", "meeting_task", "meeting_task", "note"])
+        self.assertEqual(lines[-1], {"type": "note", "meeting_id": self.meeting.pk, "content": "Agenda: ünïcode", "revision": 3})
+
+    def test_jsonl_round_trip(self):
+        counts = import_workspace(self.other.pk, read_records(io.BytesIO(self.export())))
+        self.assertEqual(counts, {"project": 2, "task": 10, "meeting": 1, "meeting_task": 2, "note": 1})
+        self.assertEqual(workspace_snapshot(self.other), workspace_snapshot(self.user))
+
+    def test_csv_gzip_round_trip_in_small_batches(self):
+        data = self.export("csv", compress=True)
+        self.assertEqual(data[:2], b"\x1f\x8b")
+        with CaptureQueriesContext(connection) as captured:
+            import_workspace(self.other.pk, read_records(io.BytesIO(data), "csv", compressed=True), batch_size=3)
+        task_inserts = [q for q in captured.captured_queries if q["sql"].startswith('INSERT INTO "task_manager_projecttask"')]
+        self.assertEqual(len(task_inserts), 4)
+        self.assertEqual(workspace_snapshot(self.other), workspace_snapshot(self.user))
+
+    def test_import_keeps_derived_data_current(self):
+        import_workspace(self.other.pk, read_records(io.BytesIO(self.export())))
+        imported = Meeting.objects.get(owner=self.other)
+        self.assertTrue(SearchEntry.objects.filter(kind=SearchEntry.NOTE, object_id=imported.pk, user_id=self.other.pk).exists())
+        self.assertEqual(SearchEntry.objects.filter(kind=SearchEntry.TASK, user_id=self.other.pk).count(), 10)
+        done = ProjectStatusSummary.objects.filter(project__user=self.other, status=TaskState.COMPLETED)
+        self.assertEqual(sum(done.values_list("task_count", flat=True)), 2)
+
+    def test_invalid_record_imports_nothing(self):
+        lines = self.export().decode().splitlines()
+        orphan = {"type": "task", "id": 999, "project_id": 12345, "title": "Orphan", "priority": 1, "status": 0, "description": ""}
+        lines.insert(3, json.dumps({**orphan, "is_daily_task": False, "deadline": None, "calendar_linked_date": None}))
+        with self.assertRaises(InvalidRecord):
+            import_workspace(self.other.pk, read_records(io.BytesIO("\n".join(lines).encode())))
+        self.assertFalse(Project.objects.filter(user=self.other).exists())
+
+    def test_export_endpoint_streams(self):
+        response = self.client.get(reverse("export_workspace"), {"file_format": "csv", "gzip": "1"})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        self.assertIn('filename="workspace-%d.csv.gz"' % self.user.pk, response["Content-Disposition"])
+        body = gzip.decompress(b"".join(response.streaming_content)).decode()
+        self.assertEqual(body.splitlines()[0].split(",")[:3], ["type", "id", "name"])
+
+    def test_import_endpoint(self):
+        url = reverse("import_workspace") + f"?user_id={self.other.pk}"
+        response = self.client.post(url, gzip.compress(self.export()), content_type="application/x-ndjson", headers={"content-encoding": "gzip"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["created"]["task"], 10)
+        self.assertEqual(workspace_snapshot(self.other), workspace_snapshot(self.user))
+
+        response = self.client.post(url, b'{"type": "planet"}\n', content_type="application/x-ndjson")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Project.objects.filter(user=self.other).count(), 2)
+
+    def test_commands(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "workspace.csv.gz")
+            call_command("export_workspace", "--user", "owner", "--format", "csv", "--output", path)
+            out = io.StringIO()
+            call_command("import_workspace", path, "--user", "other", stdout=out)
+            self.assertIn("10 task", out.getvalue())
+            self.assertEqual(workspace_snapshot(self.other), workspace_snapshot(self.user))
+
+            with open(path, "wb") as broken:
+                broken.write(b"not gzip")
+            with self.assertRaises(CommandError):
+                call_command("import_workspace", path, "--user", "other", stdout=io.StringIO())
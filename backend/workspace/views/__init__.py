@@ -0,0 +1,2 @@
+from .export_workspace import ExportWorkspaceView
+from .import_workspace import ImportWorkspaceView
@@ -0,0 +1,47 @@
+from django.contrib.auth.models import User
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from pydantic import BaseModel, ValidationError
+from typing import Literal, Optional
+
+from ..importer import InvalidRecord, import_workspace, read_records
+
+
+class ImportWorkspaceQuerySchema(BaseModel):
+    # Not "format", which DRF takes for content negotiation.
+    file_format: Literal["jsonl", "csv"] = "jsonl"
+    user_id: Optional[int] = None
+
+
+class ImportWorkspaceView(APIView):
+    """
+    Load a file written by ExportWorkspaceView, sent as the raw request body
+    (with Content-Encoding: gzip if it is compressed), into the user's workspace
+    as new projects, tasks, meetings and notes. The body is read as it arrives
+    rather than parsed up front. Answers with how many of each were created,
+    or 400 and nothing imported if any record is invalid.
+    """
+
+    throttle_scope = "bulk"
+
+    def post(self, request) -> Response:
+        try:
+            query = ImportWorkspaceQuerySchema.model_validate(request.query_params.dict())
+        except ValidationError as e:
+            return Response({"error": "Invalid query parameters", "details": e.errors()}, status=status.HTTP_400_BAD_REQUEST)
+
+        user_id = query.user_id or request.user.pk
+        if user_id is None:
+            return Response({"error": "user_id is required"}, status=status.HTTP_400_BAD_REQUEST)
+        if not User.objects.filter(pk=user_id).exists():
+            return Response({"error": "User not found"}, status=status.HTTP_404_NOT_FOUND)
+        if request.stream is None:
+            return Response({"error": "Request body is empty"}, status=status.HTTP_400_BAD_REQUEST)
+
+        compressed = request.headers.get("Content-Encoding", "").lower() == "gzip"
+        try:
+            counts = import_workspace(user_id, read_records(request.stream, query.file_format, compressed))
+        except InvalidRecord as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"created": counts}, status=status.HTTP_200_OK)
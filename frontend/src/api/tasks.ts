@@ -0,0 +1,19 @@
+import axios from 'axios';
+
+// The largest page the task listing serves.
+const TASK_PAGE_SIZE = 500;
+
+// Loads every task of the user, following next_cursor through the paginated listing.
+// `params` are passed on as listing filters (status, priority, project_id, ...).
+export async function fetchAllTasks<T = any>(userId: number | string, params: Record<string, any> = {}): Promise<T[]> {
+  const tasks: T[] = [];
+  let cursor: number | null = null;
+  do {
+    const response: any = await axios.get(`http://0.0.0.0:8001/tasks/${userId}`, {
+      params: { ...params, cursor, limit: TASK_PAGE_SIZE }
+    });
+    tasks.push(...(response.data.task_list || []));
+    cursor = response.data.next_cursor;
+  } while (cursor);
+  return tasks;
+}
@@ -1,5 +1,6 @@
 import { useState, useEffect } from 'react';
 import axios from 'axios';
+import { fetchAllTasks } from '../api/tasks';
 import { useNavigate } from 'react-router-dom';
 import './Calendar.css';
 import { 
@@ -88,12 +89,8 @@ function Calendar({ userId, onDrop }: CalendarProps) {
 
   const fetchTasks = async () => {
     try {
-      const userData = localStorage.getItem('user');
-      const userId = userData ? JSON.parse(userData).id : '1';
-      
-      const response = await axios.get(`http://0.0.0.0:8001/tasks/${userId}`);
-      const taskList = response.data.task_list || [];
-      
+      const taskList = await fetchAllTasks<Task>(userId);
+
       // Don't filter out completed and dropped tasks anymore
       setTasks(taskList);
     } catch (error) {
@@ -102,9 +99,7 @@ function Calendar({ userId, onDrop }: CalendarProps) {
   };
 
   const fetchMeetings = () => {
-    // Mock API call - replace with actual endpoint when available
-    // Using mock data for now
-    axios.get('http://0.0.0.0:8001/meetings/')
+    axios.get('http://0.0.0.0:8001/meetings/', { params: { user_id: userId } })
       .then(response => {
         // Convert API response format to frontend Meeting format
         console.log("MEETINGS" ,response.data)
@@ -144,6 +139,7 @@ function Calendar({ userId, onDrop }: CalendarProps) {
       start_time: `${newMeeting.date}T${newMeeting.startTime}:00Z`,
       end_time: `${newMeeting.date}T${newMeeting.endTime}:00Z`,
       tasks: selectedTasks.map(task => task.id), // Include the selected task IDs
+      user_id: userId, // Meetings are only listed for their owner
     };
     
     // Make API call to create meeting with credentials
@@ -24,6 +24,7 @@ import LowPriorityIcon from '@mui/icons-material/LowPriority';
 import FlagIcon from '@mui/icons-material/Flag';
 import PriorityHighIcon from '@mui/icons-material/PriorityHigh';
 import axios from 'axios';
+import { fetchAllTasks } from '../api/tasks';
 
 interface Task {
   id: number;
@@ -63,8 +64,7 @@ function LinkTasksForm({ meetingId, onTasksLinked }: LinkTasksFormProps) {
       const userData = localStorage.getItem('user');
       const userId = userData ? JSON.parse(userData).id : '1';
       
-      const response = await axios.get(`http://0.0.0.0:8001/tasks/${userId}`);
-      const taskList = response.data.task_list || [];
+      const taskList = await fetchAllTasks<Task>(userId);
       console.log(taskList)
       // No longer filtering out completed tasks
       setTasks(taskList);
@@ -27,6 +27,7 @@ import {
   Typography
 } from '@mui/material';
 import axios from 'axios';
+import { fetchAllTasks } from '../api/tasks';
 import React, { useEffect, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import Sidebar from '../components/Sidebar';
@@ -75,7 +76,7 @@ function Dashboard() {
       const userId = userData ? JSON.parse(userData).id : '1';
 
       // Fetch upcoming meetings
-      const meetingsResponse = await axios.get(`http://0.0.0.0:8001/meetings/`);
+      const meetingsResponse = await axios.get('http://0.0.0.0:8001/meetings/', { params: { user_id: userId } });
       const currentDate = new Date();
       const meetings = meetingsResponse.data
         .map((meeting: any) => ({
@@ -95,8 +96,7 @@ function Dashboard() {
       setUpcomingMeetings(meetings);
 
       // Fetch tasks
-      const tasksResponse = await axios.get(`http://0.0.0.0:8001/tasks/${userId}`);
-      const tasks = tasksResponse.data.task_list || [];
+      const tasks = await fetchAllTasks<Task>(userId);
       setTodoTasks(tasks.filter((task: Task) => task.status === 0));
 
       // Fetch projects
@@ -30,7 +30,7 @@ import {
 } from '@mui/material';
 import { SelectChangeEvent } from '@mui/material/Select';
 import { styled } from '@mui/material/styles';
-import axios from 'axios';
+import { fetchAllTasks } from '../api/tasks';
 import { useEffect, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import AddTaskModal from '../components/AddTaskModal';
@@ -115,8 +115,8 @@ function TasksPage() {
       const userData = localStorage.getItem('user');
       const userId = userData ? JSON.parse(userData).id : '1'; // Default to 1 if not found
       
-      const response = await axios.get(`http://0.0.0.0:8001/tasks/${userId}`);
-      setTasks(response.data.task_list || []);
+      const taskList = await fetchAllTasks<Task>(userId);
+      setTasks(taskList);
       setError(null);
     } catch (err) {
       console.error('Error fetching tasks:', err);